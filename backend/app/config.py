@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 
@@ -7,10 +9,108 @@ class Settings(BaseSettings):
     spotify_client_id: str = ""
     spotify_client_secret: str = ""
     google_maps_api_key: str = ""
+    # Enables the single-query GraphQL backend for the GitHub connector
+    github_token: str = ""
     redis_url: str = "redis://localhost:6379"
     database_url: str = ""
     cors_origins: list[str] = ["http://localhost:5173"]
 
+    llm_model: str = "gemini-2.0-flash"
+    llm_max_connections: int = 20
+    llm_warm_up: bool = True
+    # "merged": one dual-perspective call; "parallel": two concurrent calls
+    coaching_mode: Literal["parallel", "merged"] = "parallel"
+
+    # Overall budget for one /api/analyze, /api/match, /run or /stream
+    # request; connector, browser and LLM work is cancelled when it runs out
+    # or the client disconnects. LLM calls also get their own cap.
+    request_deadline: float = 90.0
+    llm_timeout: float = 60.0
+
+    # Persistent LLM result caches (SQLite file shared by all workers)
+    cache_db_path: str = ".cache/starstruck.sqlite3"
+    llm_cache_enabled: bool = True
+    llm_cache_max_entries: int = 5000
+    dossier_cache_ttl: int = 7 * 24 * 3600
+    crossref_cache_ttl: int = 7 * 24 * 3600
+    # HTTP validators (ETag / Last-Modified + parsed body) for conditional GETs
+    validator_cache_ttl: int = 30 * 24 * 3600
+    validator_cache_max_entries: int = 10000
+
+    # Shared outbound HTTP pools (one keep-alive pool per upstream host)
+    http_max_connections: int = 50
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry: float = 30.0
+    http_timeout: float = 15.0
+    http_http2: bool = False
+
+    # Spotify recently-played: cursor pages followed and their time budget
+    spotify_recent_max_pages: int = 4
+    spotify_page_time_budget: float = 5.0
+    # The spotify_grant cookie needs SameSite=None; Secure when the frontend
+    # is served from another site than the API
+    spotify_grant_cross_site: bool = False
+
+    # Threads dedicated to parsing Letterboxd RSS (off the default executor)
+    letterboxd_parser_workers: int = 2
+
+    # Concurrent Places text searches per venue_node run
+    places_max_concurrency: int = 3
+
+    # Warm headless Chromium pool for the Instagram/LinkedIn scrapers
+    browser_pool_size: int = 2
+    browser_max_concurrent_pages: int = 4
+    browser_max_pages_per_browser: int = 50
+
+    # Optional scraper worker processes: > 0 moves Instagram/LinkedIn fetches
+    # (and their Chromium) out of the API process. Workers are replaced after
+    # max_tasks jobs; one whose process tree exceeds max_rss_mb drops its
+    # browsers after the job.
+    scraper_workers: int = 0
+    scraper_worker_max_tasks: int = 50
+    scraper_worker_max_rss_mb: int = 1536
+
+    # Opt-in Instagram screenshots: downscaled, re-encoded (WebP when Pillow
+    # is installed) and stored on disk by content hash
+    screenshot_dir: str = ".cache/screenshots"
+    screenshot_max_width: int = 540
+    screenshot_quality: int = 70
+
+    # Connector result cache shared by /api/connect, /api/analyze and /api/match
+    connector_cache_max_entries: int = 1024
+    connector_cache_default_ttl: int = 300
+    # Per-service overrides of the TTLs declared in app.connectors.registry
+    connector_cache_ttls: dict[str, int] = {}
+
+    # Per-service overrides of the concurrency limits declared in the
+    # registry, and the limit for services it does not know
+    connector_concurrency: dict[str, int] = {}
+    connector_default_concurrency: int = 4
+
+    # Negative cache for 404s, login/auth walls and timeouts (base TTL per
+    # outcome, doubled on each repeat up to the max)
+    negative_cache_max_entries: int = 4096
+    negative_cache_default_ttl: int = 300
+    negative_cache_ttls: dict[str, int] = {
+        "not_found": 3600,
+        "login_wall": 900,
+        "auth_wall": 900,
+        "timeout": 120,
+    }
+    negative_cache_max_ttl: int = 6 * 3600
+    negative_cache_strike_ttl: int = 24 * 3600
+
+    # GitHub rate-limit scheduler: extra tokens to rotate across, requests
+    # kept in reserve per token, and how long a call may queue for a reset
+    github_tokens: list[str] = []
+    github_ratelimit_reserve: int = 2
+    github_ratelimit_max_wait: float = 30.0
+    # REST list pagination: pages followed per listing, wall-clock budget per
+    # listing, and the reservoir sample size kept for the extractors
+    github_max_pages: int = 5
+    github_page_time_budget: float = 8.0
+    github_sample_size: int = 100
+
     model_config = {"env_file": ".env", "env_file_encoding": "utf-8"}
 
 
@@ -1,11 +1,26 @@
+import importlib
+
 from app.connectors.base import BaseConnector
-from app.connectors.spotify import SpotifyConnector
-from app.connectors.letterboxd import LetterboxdConnector
-from app.connectors.github import GitHubConnector
-from app.connectors.books import BooksConnector
-from app.connectors.instagram import InstagramConnector
-from app.connectors.linkedin import LinkedInConnector
-from app.connectors.places import PlacesConnector
+
+# Connectors are imported on first attribute access so that serving GitHub
+# or chat never pulls in Playwright (see also app.connectors.registry)
+_LAZY = {
+    "SpotifyConnector": "app.connectors.spotify",
+    "LetterboxdConnector": "app.connectors.letterboxd",
+    "GitHubConnector": "app.connectors.github",
+    "BooksConnector": "app.connectors.books",
+    "InstagramConnector": "app.connectors.instagram",
+    "LinkedInConnector": "app.connectors.linkedin",
+    "PlacesConnector": "app.connectors.places",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
+
 
 __all__ = [
     "BaseConnector",
@@ -1,10 +1,28 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Literal
+
+# How much work a fetch does:
+#   probe   — only confirm the account exists
+#   preview — just enough for the one-line connect preview
+#   full    — everything the analysis pipeline reads
+FetchDepth = Literal["probe", "preview", "full"]
+
+PROBE: FetchDepth = "probe"
+PREVIEW: FetchDepth = "preview"
+FULL: FetchDepth = "full"
+
+# Deepest first; a result at any level also satisfies the shallower ones
+DEPTHS: tuple[FetchDepth, ...] = (FULL, PREVIEW, PROBE)
+
+
+def depths_satisfying(depth: FetchDepth) -> tuple[FetchDepth, ...]:
+    """Levels whose results can serve a request for ``depth``, deepest first."""
+    return DEPTHS[: DEPTHS.index(depth) + 1]
 
 
 class BaseConnector(ABC):
     @abstractmethod
-    async def fetch(self, identifier: str) -> dict[str, Any]:
+    async def fetch(self, identifier: str, depth: FetchDepth = FULL) -> dict[str, Any]:
         ...
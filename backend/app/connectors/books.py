@@ -2,9 +2,9 @@ from __future__ import annotations
 
 from typing import Any
 
-from app.connectors.base import BaseConnector
+from app.connectors.base import FULL, BaseConnector, FetchDepth
 
 
 class BooksConnector(BaseConnector):
-    async def fetch(self, identifier: str) -> dict[str, Any]:
+    async def fetch(self, identifier: str, depth: FetchDepth = FULL) -> dict[str, Any]:
         return {}
@@ -1,74 +1,365 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 from typing import Any
 
 import httpx
 
-from app.connectors.base import BaseConnector
+from app.config import settings
+from app.connectors.base import FULL, PREVIEW, PROBE, BaseConnector, FetchDepth
+from app.connectors.paginate import ReservoirSample, paginate
+from app.services.cache import NOT_FOUND, TIMEOUT, negative_cache
+from app.services.http import http_clients
+from app.services.ratelimit import RateLimitScheduler, github_rate_limits
+from app.services.validators import ValidatorStore, validator_store
+
+logger = logging.getLogger(__name__)
 
 API_BASE = "https://api.github.com"
 
+# GraphQL selections, asking only for the fields the extractors read.
+# Commit hours come from recent default-branch history rather than the
+# public events feed, filtered to the user's own commits client-side.
+_GQL_REPOS = """
+    repositories(first: 100, ownerAffiliations: OWNER,
+                 orderBy: {field: UPDATED_AT, direction: DESC}) {
+      nodes {
+        name
+        description
+        stargazerCount
+        primaryLanguage { name }
+        languages(first: 5, orderBy: {field: SIZE, direction: DESC}) { nodes { name } }
+      }
+    }
+"""
+_GQL_ACTIVITY = """
+    recent: repositories(first: 10, ownerAffiliations: OWNER,
+                         orderBy: {field: PUSHED_AT, direction: DESC}) {
+      nodes {
+        defaultBranchRef {
+          target {
+            ... on Commit {
+              history(first: 30) {
+                nodes { committedDate author { user { login } } }
+              }
+            }
+          }
+        }
+      }
+    }
+    starredRepositories(first: 100, orderBy: {field: STARRED_AT, direction: DESC}) {
+      nodes { repositoryTopics(first: 10) { nodes { topic { name } } } }
+    }
+"""
+
+
+def _only(body: Any, fields: tuple[str, ...]) -> Any:
+    """Drop everything but ``fields`` from a REST object or list of objects."""
+    if isinstance(body, list):
+        return [{k: item.get(k) for k in fields} for item in body]
+    return {k: body.get(k) for k in fields}
+
+
+def _graphql_query(depth: FetchDepth) -> str:
+    fields = "login"
+    if depth != PROBE:
+        fields += _GQL_REPOS
+    if depth == FULL:
+        fields += _GQL_ACTIVITY
+    return f"query($login: String!) {{ user(login: $login) {{ {fields} }} }}"
+
 
 class GitHubConnector(BaseConnector):
-    """Fetch public GitHub profile data for a username."""
+    """Fetch public GitHub profile data for a username.
 
-    async def fetch(self, identifier: str) -> dict[str, Any]:
-        username = identifier.strip().lstrip("@")
-        async with httpx.AsyncClient(
+    Uses one GraphQL query when a token is configured, otherwise (or if the
+    token is rejected) the REST endpoints. Every call goes through a
+    :class:`RateLimitScheduler`; passing ``token`` gives the connector its
+    own single-token scheduler instead of the shared one.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient | None = None,
+        token: str | None = None,
+        rate_limits: RateLimitScheduler | None = None,
+        validators: ValidatorStore | None = None,
+    ) -> None:
+        self._client = client
+        self.validators = validators or validator_store
+        if rate_limits is None:
+            rate_limits = github_rate_limits if token is None else RateLimitScheduler([token])
+        self.rate_limits = rate_limits
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return self._client or http_clients.get(
+            "github",
             base_url=API_BASE,
             headers={"Accept": "application/vnd.github+json"},
-            timeout=15,
-        ) as client:
-            repos_task = self._fetch_repos(client, username)
-            events_task = self._fetch_events(client, username)
-            starred_task = self._fetch_starred(client, username)
+        )
+
+    async def fetch(self, identifier: str, depth: FetchDepth = FULL) -> dict[str, Any]:
+        username = identifier.strip().lstrip("@")
+        outcome = negative_cache.check("github", username)
+        if outcome is not None:
+            if depth == PROBE:
+                return {"exists": outcome != NOT_FOUND}
+            return self._build_result([], [], [], depth)
+
+        try:
+            return await self._fetch(self.client, username, depth)
+        except httpx.TimeoutException:
+            negative_cache.record("github", username, TIMEOUT)
+            raise
+
+    async def _fetch(
+        self, client: httpx.AsyncClient, username: str, depth: FetchDepth
+    ) -> dict[str, Any]:
+        if self.rate_limits.has_budget("graphql"):
+            result = await self._fetch_graphql(client, username, depth)
+            if result is not None:
+                return result
+            logger.warning("GitHub token rejected; falling back to REST")
+        return await self._fetch_rest(client, username, depth)
+
+    async def _fetch_rest(
+        self, client: httpx.AsyncClient, username: str, depth: FetchDepth
+    ) -> dict[str, Any]:
+        if depth == PROBE:
+            user = await self._fetch_user(client, username)
+            if user is None:
+                negative_cache.record("github", username, NOT_FOUND)
+            return {"exists": user is not None}
+
+        if depth == PREVIEW:
+            # One page is plenty for a preview line
+            repos = await self._fetch_repos(client, username, max_pages=1)
+            events, starred = [], []
+        else:
             repos, events, starred = await asyncio.gather(
-                repos_task, events_task, starred_task
+                self._fetch_repos(client, username),
+                self._fetch_events(client, username),
+                self._fetch_starred(client, username),
             )
 
-        return {
+        # /repos only 404s when the account itself does not exist
+        if repos is None:
+            negative_cache.record("github", username, NOT_FOUND)
+        return self._build_result(repos or [], events or [], starred or [], depth)
+
+    def _build_result(
+        self,
+        repos: list[dict],
+        events: list[dict],
+        starred: list[dict],
+        depth: FetchDepth = FULL,
+    ) -> dict[str, Any]:
+        result = {
             "languages": self._extract_languages(repos),
             "repos": self._extract_repos(repos),
-            "commit_hours": self._extract_commit_hours(events),
-            "starred_topics": self._extract_starred_topics(starred),
         }
+        if depth == FULL:
+            result["commit_hours"] = self._extract_commit_hours(events)
+            result["starred_topics"] = self._extract_starred_topics(starred)
+        return result
 
-    # ── individual API calls ──────────────────────────────────────
+    # ── GraphQL backend ───────────────────────────────────────────
 
-    async def _fetch_repos(
-        self, client: httpx.AsyncClient, username: str
-    ) -> list[dict]:
-        resp = await client.get(
-            f"/users/{username}/repos",
-            params={"per_page": 100, "sort": "updated"},
+    async def _fetch_graphql(
+        self, client: httpx.AsyncClient, username: str, depth: FetchDepth
+    ) -> dict[str, Any] | None:
+        """Everything ``depth`` needs in one round trip; None if the token is bad."""
+        resp = await self._request(
+            client,
+            "POST",
+            "/graphql",
+            resource="graphql",
+            json={"query": _graphql_query(depth), "variables": {"login": username}},
+        )
+        if resp.status_code == 401:
+            return None
+        resp.raise_for_status()
+        payload = resp.json()
+
+        user = (payload.get("data") or {}).get("user")
+        if user is None:
+            errors = payload.get("errors") or []
+            if not any(e.get("type") == "NOT_FOUND" for e in errors):
+                raise RuntimeError(f"GitHub GraphQL query failed: {errors}")
+            negative_cache.record("github", username, NOT_FOUND)
+            return {"exists": False} if depth == PROBE else self._build_result([], [], [], depth)
+
+        if depth == PROBE:
+            return {"exists": True}
+        return self._build_result(
+            self._graphql_repos(user),
+            self._graphql_push_events(user, username),
+            self._graphql_starred(user),
+            depth,
+        )
+
+    # GraphQL nodes are reshaped into the REST payload shapes so the
+    # extractors below serve both backends.
+
+    @staticmethod
+    def _graphql_repos(user: dict) -> list[dict]:
+        return [
+            {
+                "name": r["name"],
+                "description": r.get("description"),
+                "stargazers_count": r.get("stargazerCount", 0),
+                "language": (r.get("primaryLanguage") or {}).get("name"),
+                "languages": [lang["name"] for lang in (r.get("languages") or {}).get("nodes", [])],
+            }
+            for r in (user.get("repositories") or {}).get("nodes", [])
+        ]
+
+    @staticmethod
+    def _graphql_push_events(user: dict, username: str) -> list[dict]:
+        events: list[dict] = []
+        for repo in (user.get("recent") or {}).get("nodes", []):
+            target = (repo.get("defaultBranchRef") or {}).get("target") or {}
+            for commit in (target.get("history") or {}).get("nodes", []):
+                author = (commit.get("author") or {}).get("user") or {}
+                if (author.get("login") or "").lower() == username.lower():
+                    events.append({"type": "PushEvent", "created_at": commit["committedDate"]})
+        return events
+
+    @staticmethod
+    def _graphql_starred(user: dict) -> list[dict]:
+        return [
+            {"topics": [t["topic"]["name"] for t in (r.get("repositoryTopics") or {}).get("nodes", [])]}
+            for r in (user.get("starredRepositories") or {}).get("nodes", [])
+        ]
+
+    # ── individual API calls (None means 404) ─────────────────────
+
+    async def _request(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        url: str,
+        *,
+        resource: str = "core",
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send one call under the rate-limit scheduler, rotating credentials.
+
+        Rate-limited responses are retried on another budget (or after the
+        reset); a rejected token is dropped and the call retried without it.
+        """
+        headers = kwargs.pop("headers", None) or {}
+        while True:
+            budget = await self.rate_limits.acquire(resource)
+            resp = await client.request(
+                method, url, headers={**headers, **budget.auth_headers}, **kwargs
+            )
+            if self.rate_limits.update(budget, resp.status_code, resp.headers):
+                continue
+            if resp.status_code == 401 and budget.token:
+                self.rate_limits.disable(budget)
+                if self.rate_limits.has_budget(resource):
+                    continue
+            return resp
+
+    async def _get_page(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        fields: tuple[str, ...],
+        params: dict[str, Any] | None = None,
+    ) -> tuple[Any | None, str | None]:
+        """Conditional GET of one REST page, keeping only ``fields``.
+
+        Returns the trimmed body (None on 404) and the ``rel="next"`` URL.
+        A 304 reuses the stored page (and costs no rate-limit quota).
+        """
+        key = self.validators.key_for(client.base_url.join(url), params)
+        entry = await self.validators.get(key)
+        resp = await self._request(
+            client,
+            "GET",
+            url,
+            params=params,
+            headers=self.validators.conditional_headers(entry),
         )
+        if resp.status_code == 304 and entry is not None:
+            page = self.validators.reuse(entry)
+            return page["data"], page["next"]
         if resp.status_code == 404:
-            return []
+            return None, None
         resp.raise_for_status()
-        return resp.json()
+        data = _only(resp.json(), fields)
+        next_url = resp.links.get("next", {}).get("url")
+        await self.validators.remember(key, resp, {"data": data, "next": next_url})
+        return data, next_url
+
+    async def _fetch_list(
+        self,
+        client: httpx.AsyncClient,
+        path: str,
+        fields: tuple[str, ...],
+        params: dict[str, Any],
+        max_pages: int | None = None,
+    ) -> list[dict] | None:
+        """Stream a paginated listing into a bounded reservoir sample.
+
+        Pages are trimmed as they arrive, so memory and prompt size stay
+        at ``github_sample_size`` items however large the account is. The
+        sample is seeded by ``path`` so an unchanged listing yields the same
+        items, and the dossier built from it stays cacheable.
+        """
+        pages = paginate(
+            lambda url, page_params: self._get_page(client, url, fields, page_params),
+            path,
+            params,
+            max_pages=max_pages or settings.github_max_pages,
+            time_budget=settings.github_page_time_budget,
+        )
+        sample: ReservoirSample[dict] = ReservoirSample(
+            settings.github_sample_size, seed=f"github:{path}"
+        )
+        async for page in pages:
+            if page is None:
+                return None
+            sample.extend(page)
+        return sample.items()
+
+    async def _fetch_user(
+        self, client: httpx.AsyncClient, username: str
+    ) -> dict | None:
+        user, _ = await self._get_page(client, f"/users/{username}", ("login",))
+        return user
+
+    async def _fetch_repos(
+        self, client: httpx.AsyncClient, username: str, max_pages: int | None = None
+    ) -> list[dict] | None:
+        return await self._fetch_list(
+            client,
+            f"/users/{username}/repos",
+            ("name", "description", "stargazers_count", "language"),
+            {"per_page": 100, "sort": "updated"},
+            max_pages,
+        )
 
     async def _fetch_events(
         self, client: httpx.AsyncClient, username: str
-    ) -> list[dict]:
-        resp = await client.get(
-            f"/users/{username}/events/public", params={"per_page": 100}
+    ) -> list[dict] | None:
+        return await self._fetch_list(
+            client,
+            f"/users/{username}/events/public",
+            ("type", "created_at"),
+            {"per_page": 100},
         )
-        if resp.status_code == 404:
-            return []
-        resp.raise_for_status()
-        return resp.json()
 
     async def _fetch_starred(
         self, client: httpx.AsyncClient, username: str
-    ) -> list[dict]:
-        resp = await client.get(
-            f"/users/{username}/starred", params={"per_page": 100}
+    ) -> list[dict] | None:
+        return await self._fetch_list(
+            client, f"/users/{username}/starred", ("topics",), {"per_page": 100}
         )
-        if resp.status_code == 404:
-            return []
-        resp.raise_for_status()
-        return resp.json()
 
     # ── data extraction ───────────────────────────────────────────
 
@@ -76,8 +367,10 @@ class GitHubConnector(BaseConnector):
     def _extract_languages(repos: list[dict]) -> list[str]:
         langs: list[str] = []
         seen: set[str] = set()
-        for r in repos:
-            lang = r.get("language")
+        # Primary languages first; per-repo breakdowns (GraphQL only) after
+        candidates = [r.get("language") for r in repos]
+        candidates += [lang for r in repos for lang in r.get("languages", [])]
+        for lang in candidates:
             if lang and lang not in seen:
                 seen.add(lang)
                 langs.append(lang)
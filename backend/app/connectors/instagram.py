@@ -1,13 +1,20 @@
 from __future__ import annotations
 
-import asyncio
 import base64
 from typing import Any
 
-from playwright.async_api import async_playwright
+import httpx
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
-from app.connectors.base import BaseConnector
+from app.connectors.base import FULL, PREVIEW, PROBE, BaseConnector, FetchDepth
+from app.connectors.scrape import ScraperProfile, parse_static_page_async
+from app.services import deadline
+from app.services.browser import BrowserPool, browser_pool
+from app.services.cache import LOGIN_WALL, NOT_FOUND, TIMEOUT, negative_cache
+from app.services.http import http_clients, no_cookies
+from app.services.screenshots import ScreenshotStore, screenshot_store
 
+GOTO_TIMEOUT_MS = 20000
 PROFILE_URL = "https://www.instagram.com/{username}/"
 USER_AGENT = (
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
@@ -16,19 +23,112 @@ USER_AGENT = (
 
 _LOGIN_KEYWORDS = ("Login", "login", "Log in", "accounts/login", "Log into")
 
+# Profile header, or the login form Instagram redirects anonymous users to
+SCRAPER_PROFILE = ScraperProfile(
+    first_party=("instagram.com", "cdninstagram.com", "fbcdn.net"),
+    ready_selector='header section, input[name="username"]',
+)
+
 
 class InstagramConnector(BaseConnector):
-    """Scrape a public Instagram profile for bio and a screenshot."""
+    """Scrape a public Instagram profile for bio and, on request, a screenshot.
+
+    Screenshots are opt-in per call (``fetch(..., screenshot=True)``). The
+    image is compacted and stored off the event loop; the result carries a
+    ``screenshot_ref`` for ``/api/screenshots/{ref}`` rather than the bytes.
+    """
+
+    def __init__(
+        self,
+        pool: BrowserPool | None = None,
+        client: httpx.AsyncClient | None = None,
+        screenshots: ScreenshotStore | None = None,
+    ) -> None:
+        self.pool = pool or browser_pool
+        self._client = client
+        self.screenshots = screenshots or screenshot_store
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return self._client or http_clients.get(
+            "instagram",
+            headers={"User-Agent": USER_AGENT, "Accept-Language": "en-US,en;q=0.9"},
+            follow_redirects=True,
+            cookies=no_cookies(),
+        )
 
-    async def fetch(self, identifier: str) -> dict[str, Any]:
+    async def fetch(
+        self, identifier: str, depth: FetchDepth = FULL, *, screenshot: bool = False
+    ) -> dict[str, Any]:
         username = identifier.strip().lstrip("@")
-        page_data = await self._fetch_profile(username)
-        return self._extract_profile_data(page_data)
+        outcome = negative_cache.check("instagram", username)
+        if outcome is not None:
+            if depth == PROBE:
+                return {"exists": outcome != NOT_FOUND}
+            return {"bio": "", "screenshot_b64": "", "login_wall": outcome == LOGIN_WALL}
+
+        if depth == PROBE:
+            return {"exists": await self._profile_exists(username)}
+        if depth == PREVIEW:
+            # Never start a browser for a preview; the full fetch will
+            raw = await self._fetch_profile_html(username)
+            return self._extract_profile_data(raw or {})
+
+        page_data = await self._fetch_profile(username, screenshot=screenshot)
+        # Keep the image out of the base64 path; it is stored by reference
+        image = page_data.get("screenshot_bytes") or b""
+        profile = self._extract_profile_data({**page_data, "screenshot_bytes": b""})
+        if image and not profile["login_wall"]:
+            profile["screenshot_ref"] = await self.screenshots.put(image)
+        if not profile["bio"]:
+            if profile["login_wall"]:
+                negative_cache.record("instagram", username, LOGIN_WALL)
+            elif page_data.get("timed_out"):
+                negative_cache.record("instagram", username, TIMEOUT)
+        return profile
 
     # ── data fetching ──────────────────────────────────────────────
 
-    async def _fetch_profile(self, username: str) -> dict:
-        """Launch headless browser and grab raw page data + screenshot."""
+    async def _fetch_profile(self, username: str, *, screenshot: bool = False) -> dict:
+        """Try the static HTML first; render in a browser only if it had nothing
+        (or if a screenshot was asked for)."""
+        if screenshot:
+            return await self._render_profile(username, screenshot=True)
+        raw = await self._fetch_profile_html(username)
+        if raw is not None and self._extract_profile_data(raw)["bio"]:
+            return raw
+        return await self._render_profile(username)
+
+    async def _profile_exists(self, username: str) -> bool:
+        resp = await self.client.get(PROFILE_URL.format(username=username))
+        if resp.status_code == 404:
+            negative_cache.record("instagram", username, NOT_FOUND)
+            return False
+        return True
+
+    async def _fetch_profile_html(self, username: str) -> dict | None:
+        """Read og:description and <title> from the server-rendered HTML."""
+        url = PROFILE_URL.format(username=username)
+        try:
+            resp = await self.client.get(url)
+            if resp.status_code != 200:
+                return None
+            page = await parse_static_page_async(resp.text)
+        except Exception:
+            return None
+
+        return {
+            "title": page.title,
+            # og:description carries the follower counts + bio blurb
+            "bio_text": page.og_description,
+            "screenshot_bytes": b"",
+            "final_url": str(resp.url),
+            "meta_description": page.og_description,
+        }
+
+    async def _render_profile(self, username: str, *, screenshot: bool = False) -> dict:
+        """Open a pooled browser page and grab raw page data (+ screenshot)."""
+        profile = SCRAPER_PROFILE.with_screenshot() if screenshot else SCRAPER_PROFILE
         url = PROFILE_URL.format(username=username)
         result: dict[str, Any] = {
             "title": "",
@@ -39,53 +139,52 @@ class InstagramConnector(BaseConnector):
         }
 
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                context = await browser.new_context(user_agent=USER_AGENT)
-                page = await context.new_page()
+            async with self.pool.page(user_agent=USER_AGENT) as page:
+                await profile.install(page)
+                timeout = deadline.budget_ms(GOTO_TIMEOUT_MS)
                 try:
-                    try:
-                        await page.goto(url, wait_until="networkidle", timeout=20000)
-                    except Exception:
-                        pass
+                    await page.goto(url, wait_until=profile.wait_until, timeout=timeout)
+                except PlaywrightTimeoutError:
+                    # A request deadline cutting the load short says nothing about the profile
+                    if timeout >= GOTO_TIMEOUT_MS:
+                        result["timed_out"] = True
+                except Exception:
+                    pass
 
-                    await asyncio.sleep(1)
+                # Returns as soon as the profile or the login wall renders
+                await profile.wait_ready(page)
 
-                    result["title"] = await page.title()
-                    result["final_url"] = page.url
+                result["title"] = await page.title()
+                result["final_url"] = page.url
 
-                    # Bio text — in header section (only works if profile loaded)
-                    try:
-                        bio_el = await page.wait_for_selector(
-                            "header section", timeout=5000
-                        )
-                        if bio_el:
-                            result["bio_text"] = (await bio_el.inner_text()).strip()
-                    except Exception:
-                        pass
+                # Bio text — in header section (only works if profile loaded)
+                try:
+                    bio_el = await page.query_selector("header section")
+                    if bio_el:
+                        result["bio_text"] = (await bio_el.inner_text()).strip()
+                except Exception:
+                    pass
 
-                    # Fallback: meta description sometimes has bio info
-                    try:
-                        meta = await page.query_selector(
-                            'meta[property="og:description"]'
+                # Fallback: meta description sometimes has bio info
+                try:
+                    meta = await page.query_selector(
+                        'meta[property="og:description"]'
+                    )
+                    if meta:
+                        result["meta_description"] = (
+                            await meta.get_attribute("content") or ""
                         )
-                        if meta:
-                            result["meta_description"] = (
-                                await meta.get_attribute("content") or ""
-                            )
-                    except Exception:
-                        pass
+                except Exception:
+                    pass
 
-                    # Screenshot of the viewport
+                # Screenshot of the viewport
+                if screenshot:
                     try:
                         result["screenshot_bytes"] = await page.screenshot(
                             full_page=False
                         )
                     except Exception:
                         pass
-
-                finally:
-                    await browser.close()
         except Exception:
             pass
 
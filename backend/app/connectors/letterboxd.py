@@ -2,21 +2,130 @@ from __future__ import annotations
 
 import asyncio
 import re
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import feedparser
 import httpx
 
-from app.connectors.base import BaseConnector
+from app.config import settings
+from app.connectors.base import FULL, PROBE, BaseConnector, FetchDepth
+from app.services.http import http_clients
+from app.services.validators import ValidatorStore, validator_store
 
 FEED_URL = "https://letterboxd.com/{username}/rss/"
 
+# Only the newest entries are ever read
+MAX_FILMS = 20
+
+_CHUNK_SIZE = 16 * 1024
+
+_parser_pool: ThreadPoolExecutor | None = None
+
+
+def _parser_executor() -> ThreadPoolExecutor:
+    # Parsing gets its own small pool so it never queues behind (or
+    # starves) other work on the loop's default executor
+    global _parser_pool
+    if _parser_pool is None:
+        _parser_pool = ThreadPoolExecutor(
+            max_workers=settings.letterboxd_parser_workers,
+            thread_name_prefix="letterboxd-parse",
+        )
+    return _parser_pool
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+class FeedParser:
+    """Incremental RSS parser: feed chunks as they arrive, stop at ``limit`` items.
+
+    Reads only ``title``, ``link`` and ``letterboxd:memberRating``. Raises
+    ``ET.ParseError`` on malformed XML.
+    """
+
+    def __init__(self, limit: int = MAX_FILMS) -> None:
+        self.limit = limit
+        self.entries: list[dict[str, Any]] = []
+        self._parser = ET.XMLPullParser(events=("end",))
+
+    @property
+    def done(self) -> bool:
+        return len(self.entries) >= self.limit
+
+    def feed(self, chunk: bytes) -> bool:
+        """Parse ``chunk``; True once ``limit`` items are complete."""
+        self._parser.feed(chunk)
+        for _, el in self._parser.read_events():
+            if el.tag != "item":
+                continue
+            entry: dict[str, Any] = {"title": "", "link": "", "letterboxd_memberrating": None}
+            for child in el:
+                name = _local_name(child.tag)
+                if child.tag in ("title", "link"):
+                    entry[child.tag] = (child.text or "").strip()
+                elif name == "memberRating":
+                    entry["letterboxd_memberrating"] = (child.text or "").strip() or None
+            self.entries.append(entry)
+            el.clear()
+            if self.done:
+                return True
+        return False
+
+    def close(self) -> dict:
+        # Past the limit the rest of the document is never seen, so it is
+        # neither parsed nor validated
+        if not self.done:
+            self._parser.close()
+        return {"entries": self.entries}
+
+
+def parse_feed(content: bytes, limit: int = MAX_FILMS) -> dict:
+    """Parse an in-memory feed with :class:`FeedParser`."""
+    parser = FeedParser(limit)
+    for start in range(0, len(content), _CHUNK_SIZE):
+        if parser.feed(content[start : start + _CHUNK_SIZE]):
+            break
+    return parser.close()
+
+
+def _parse_with_feedparser(content: bytes, limit: int = MAX_FILMS) -> dict:
+    feed = feedparser.parse(content)
+    return {
+        "entries": [
+            {
+                "title": e.get("title", ""),
+                "link": e.get("link", ""),
+                "letterboxd_memberrating": e.get("letterboxd_memberrating"),
+            }
+            for e in feed.get("entries", [])[:limit]
+        ]
+    }
+
 
 class LetterboxdConnector(BaseConnector):
     """Fetch recent Letterboxd activity from a user's public RSS feed."""
 
-    async def fetch(self, identifier: str) -> dict[str, Any]:
+    def __init__(
+        self,
+        client: httpx.AsyncClient | None = None,
+        validators: ValidatorStore | None = None,
+    ) -> None:
+        self._client = client
+        self.validators = validators or validator_store
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return self._client or http_clients.get("letterboxd")
+
+    async def fetch(self, identifier: str, depth: FetchDepth = FULL) -> dict[str, Any]:
         username = identifier.strip().lstrip("@")
+        if depth == PROBE:
+            return {"exists": await self._feed_exists(username)}
+        # The feed is a single request, so preview and full are the same work
         feed_data = await self._fetch_feed(username)
         return {
             "recent_films": self._extract_films(feed_data),
@@ -24,16 +133,53 @@ class LetterboxdConnector(BaseConnector):
 
     # ── data fetching ──────────────────────────────────────────────
 
+    async def _feed_exists(self, username: str) -> bool:
+        resp = await self.client.head(FEED_URL.format(username=username))
+        if resp.status_code == 404:
+            return False
+        resp.raise_for_status()
+        return True
+
     async def _fetch_feed(self, username: str) -> dict:
+        """Conditional GET of the feed; a 304 reuses the stored parse."""
         url = FEED_URL.format(username=username)
-        async with httpx.AsyncClient(timeout=15) as client:
-            resp = await client.get(url)
+        entry = await self.validators.get(url)
+        headers = self.validators.conditional_headers(entry)
+        async with self.client.stream("GET", url, headers=headers) as resp:
+            if resp.status_code == 304 and entry is not None:
+                return self.validators.reuse(entry)
             if resp.status_code == 404:
                 return {}
             resp.raise_for_status()
-        # feedparser is sync, run in executor to avoid blocking
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, feedparser.parse, resp.text)
+            parsed = await self._parse_stream(resp)
+        await self.validators.remember(url, resp, parsed)
+        return parsed
+
+    @staticmethod
+    async def _parse_stream(resp: httpx.Response) -> dict:
+        """Parse the body while it downloads and stop reading at ``MAX_FILMS`` items.
+
+        Leaving :meth:`_fetch_feed`'s ``stream`` block closes the response,
+        so the rest of a long feed is never transferred.
+        """
+        loop = asyncio.get_running_loop()
+        executor = _parser_executor()
+        parser = FeedParser()
+        received: list[bytes] = []
+        chunks = resp.aiter_bytes(_CHUNK_SIZE)
+        try:
+            async for chunk in chunks:
+                received.append(chunk)
+                if await loop.run_in_executor(executor, parser.feed, chunk):
+                    break
+            return await loop.run_in_executor(executor, parser.close)
+        except ET.ParseError:
+            # feedparser tolerates the malformed markup a strict parser
+            # rejects, but it needs the whole document
+            received.extend([chunk async for chunk in chunks])
+            return await loop.run_in_executor(
+                executor, _parse_with_feedparser, b"".join(received)
+            )
 
     # ── data extraction ────────────────────────────────────────────
 
@@ -41,7 +187,7 @@ class LetterboxdConnector(BaseConnector):
     def _extract_films(feed: dict) -> list[dict[str, Any]]:
         entries = feed.get("entries", [])
         films: list[dict[str, Any]] = []
-        for entry in entries[:20]:
+        for entry in entries[:MAX_FILMS]:
             title_raw = entry.get("title", "")
             link = entry.get("link", "")
             rating = LetterboxdConnector._parse_rating(entry)
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
-import asyncio
 from typing import Any
 
-from playwright.async_api import async_playwright
+import httpx
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
-from app.connectors.base import BaseConnector
+from app.connectors.base import FULL, PREVIEW, PROBE, BaseConnector, FetchDepth
+from app.connectors.scrape import ScraperProfile, parse_static_page_async
+from app.services import deadline
+from app.services.browser import BrowserPool, browser_pool
+from app.services.cache import AUTH_WALL, NOT_FOUND, TIMEOUT, negative_cache
+from app.services.http import http_clients, no_cookies
 
+GOTO_TIMEOUT_MS = 15000
 PROFILE_URL = "https://www.linkedin.com/in/{username}/"
 USER_AGENT = (
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
@@ -16,24 +22,102 @@ USER_AGENT = (
 # Keywords that indicate we've been blocked by an auth wall
 _AUTH_WALL_KEYWORDS = ("Sign In", "Sign Up", "Login", "Join LinkedIn", "authwall")
 
+_HEADLINE_SELECTOR = ".top-card-layout__headline"
+
+# Text-only scrape; the auth wall also renders an <h1> ("Join LinkedIn")
+SCRAPER_PROFILE = ScraperProfile(
+    first_party=("linkedin.com", "licdn.com"),
+    ready_selector="h1",
+)
+
 
 class LinkedInConnector(BaseConnector):
     """Scrape a public LinkedIn profile for basic info."""
 
-    async def fetch(self, identifier: str) -> dict[str, Any]:
+    def __init__(
+        self,
+        pool: BrowserPool | None = None,
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
+        self.pool = pool or browser_pool
+        self._client = client
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return self._client or http_clients.get(
+            "linkedin",
+            headers={"User-Agent": USER_AGENT, "Accept-Language": "en-US,en;q=0.9"},
+            follow_redirects=True,
+            cookies=no_cookies(),
+        )
+
+    async def fetch(self, identifier: str, depth: FetchDepth = FULL) -> dict[str, Any]:
         username = identifier.strip().lstrip("@")
+        outcome = negative_cache.check("linkedin", username)
+        if outcome is not None:
+            if depth == PROBE:
+                return {"exists": outcome != NOT_FOUND}
+            return {"name": "", "headline": "", "about": "", "login_wall": outcome == AUTH_WALL}
+
+        if depth == PROBE:
+            return {"exists": await self._profile_exists(username)}
+        if depth == PREVIEW:
+            # Never start a browser for a preview; the full fetch will
+            raw = await self._fetch_profile_html(username)
+            return self._extract_profile_data(raw or {})
+
         page_content = await self._fetch_profile(username)
-        return self._extract_profile_data(page_content)
+        profile = self._extract_profile_data(page_content)
+        if profile["login_wall"]:
+            negative_cache.record("linkedin", username, AUTH_WALL)
+        elif page_content.get("timed_out") and not (profile["name"] or profile["headline"]):
+            negative_cache.record("linkedin", username, TIMEOUT)
+        return profile
 
     # ── data fetching ──────────────────────────────────────────────
 
     async def _fetch_profile(self, username: str) -> dict:
-        """Launch headless browser and grab raw page data.
+        """Try the static HTML first; render in a browser only if it had nothing."""
+        raw = await self._fetch_profile_html(username)
+        if raw is not None:
+            profile = self._extract_profile_data(raw)
+            if profile["name"] or profile["headline"] or profile["about"]:
+                return raw
+        return await self._render_profile(username)
+
+    async def _profile_exists(self, username: str) -> bool:
+        resp = await self.client.get(PROFILE_URL.format(username=username))
+        if resp.status_code == 404:
+            negative_cache.record("linkedin", username, NOT_FOUND)
+            return False
+        return True
+
+    async def _fetch_profile_html(self, username: str) -> dict | None:
+        """Read the title, meta description, h1 and headline from raw HTML."""
+        url = PROFILE_URL.format(username=username)
+        try:
+            resp = await self.client.get(url)
+            if resp.status_code != 200:
+                return None
+            page = await parse_static_page_async(resp.text, _HEADLINE_SELECTOR)
+        except Exception:
+            return None
+
+        return {
+            "name_text": page.h1,
+            "meta_description": page.meta_description,
+            "title": page.title,
+            "headline_text": page.headline,
+            "final_url": str(resp.url),
+        }
+
+    async def _render_profile(self, username: str) -> dict:
+        """Open a pooled browser page and grab raw page data.
 
         Returns a dict with raw extracted fields; empty strings on failure.
         """
         url = PROFILE_URL.format(username=username)
-        result: dict[str, str] = {
+        result: dict[str, Any] = {
             "name_text": "",
             "meta_description": "",
             "title": "",
@@ -42,55 +126,51 @@ class LinkedInConnector(BaseConnector):
         }
 
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                context = await browser.new_context(user_agent=USER_AGENT)
-                page = await context.new_page()
+            async with self.pool.page(user_agent=USER_AGENT) as page:
+                await SCRAPER_PROFILE.install(page)
+                timeout = deadline.budget_ms(GOTO_TIMEOUT_MS)
+                try:
+                    await page.goto(url, wait_until=SCRAPER_PROFILE.wait_until, timeout=timeout)
+                except PlaywrightTimeoutError:
+                    # A request deadline cutting the load short says nothing about the profile
+                    if timeout >= GOTO_TIMEOUT_MS:
+                        result["timed_out"] = True
+                except Exception:
+                    pass
+
+                # Redirects (e.g. to /authwall) have settled once an h1 exists
+                await SCRAPER_PROFILE.wait_ready(page)
+
+                result["final_url"] = page.url
+                result["title"] = await page.title()
+
+                # Name — usually in h1
+                try:
+                    name_el = await page.query_selector("h1")
+                    if name_el:
+                        result["name_text"] = (await name_el.inner_text()).strip()
+                except Exception:
+                    pass
+
+                # Meta description often contains the bio/headline
                 try:
-                    # Use networkidle to wait for redirects to settle
-                    try:
-                        await page.goto(url, wait_until="networkidle", timeout=15000)
-                    except Exception:
-                        pass
-
-                    # Give redirects a moment to settle
-                    await asyncio.sleep(1)
-
-                    result["final_url"] = page.url
-                    result["title"] = await page.title()
-
-                    # Name — usually in h1
-                    try:
-                        name_el = await page.wait_for_selector("h1", timeout=5000)
-                        if name_el:
-                            result["name_text"] = (await name_el.inner_text()).strip()
-                    except Exception:
-                        pass
-
-                    # Meta description often contains the bio/headline
-                    try:
-                        meta = await page.query_selector('meta[name="description"]')
-                        if meta:
-                            result["meta_description"] = (
-                                await meta.get_attribute("content") or ""
-                            )
-                    except Exception:
-                        pass
-
-                    # Headline — the text right below the name
-                    try:
-                        headline_el = await page.query_selector(
-                            ".top-card-layout__headline"
+                    meta = await page.query_selector('meta[name="description"]')
+                    if meta:
+                        result["meta_description"] = (
+                            await meta.get_attribute("content") or ""
                         )
-                        if headline_el:
-                            result["headline_text"] = (
-                                await headline_el.inner_text()
-                            ).strip()
-                    except Exception:
-                        pass
-
-                finally:
-                    await browser.close()
+                except Exception:
+                    pass
+
+                # Headline — the text right below the name
+                try:
+                    headline_el = await page.query_selector(_HEADLINE_SELECTOR)
+                    if headline_el:
+                        result["headline_text"] = (
+                            await headline_el.inner_text()
+                        ).strip()
+                except Exception:
+                    pass
         except Exception:
             pass
 
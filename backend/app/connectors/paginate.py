@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import random
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+# Fetches one page: (url, params) -> (items or None on 404, next page URL)
+PageFetcher = Callable[[str, "dict[str, Any] | None"], Awaitable[tuple["list | None", "str | None"]]]
+
+
+async def paginate(
+    fetch_page: PageFetcher,
+    url: str,
+    params: dict[str, Any] | None = None,
+    *,
+    max_pages: int,
+    time_budget: float,
+) -> AsyncIterator[list | None]:
+    """Yield pages by following ``rel="next"`` links as they arrive.
+
+    Stops after ``max_pages`` pages or once ``time_budget`` seconds have
+    passed, whichever comes first; the first page is always fetched.
+    """
+    deadline = time.monotonic() + time_budget
+    pages = 0
+    next_url: str | None = url
+    while next_url is not None:
+        items, next_url = await fetch_page(next_url, params)
+        params = None  # next links already carry the query string
+        pages += 1
+        yield items
+        if pages >= max_pages or time.monotonic() >= deadline:
+            return
+
+
+class ReservoirSample(Generic[T]):
+    """Uniform sample of at most ``size`` items from a stream of any length.
+
+    Classic Algorithm R; :meth:`items` returns the sample in stream order.
+    Pass ``seed`` to get the same sample back for the same stream.
+    """
+
+    def __init__(
+        self, size: int, rng: random.Random | None = None, *, seed: str | int | None = None
+    ) -> None:
+        self.size = size
+        self.seen = 0
+        self._rng = rng or random.Random(seed)
+        self._slots: list[tuple[int, T]] = []
+
+    def add(self, item: T) -> None:
+        if len(self._slots) < self.size:
+            self._slots.append((self.seen, item))
+        else:
+            j = self._rng.randrange(self.seen + 1)
+            if j < self.size:
+                self._slots[j] = (self.seen, item)
+        self.seen += 1
+
+    def extend(self, items: Iterable[T]) -> None:
+        for item in items:
+            self.add(item)
+
+    def items(self) -> list[T]:
+        return [item for _, item in sorted(self._slots, key=lambda s: s[0])]
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import importlib
+from dataclasses import dataclass
+from typing import Literal
+
+# What a fetch costs to run:
+#   http    — plain API/HTTP calls on the shared clients
+#   browser — may render pages in headless Chromium
+CostClass = Literal["http", "browser"]
+
+HTTP: CostClass = "http"
+BROWSER: CostClass = "browser"
+
+
+@dataclass(frozen=True)
+class ConnectorSpec:
+    """Everything the app needs to know about a service before importing it."""
+
+    service: str
+    # "package.module:ClassName"; imported on first use
+    class_path: str
+    cost: CostClass = HTTP
+    # Connector result cache TTL (``settings.connector_cache_ttls`` overrides)
+    cache_ttl: int = 300
+    # Fetches of this service allowed to run at once
+    max_concurrency: int = 8
+
+    def load(self) -> type:
+        module, _, name = self.class_path.partition(":")
+        return getattr(importlib.import_module(module), name)
+
+
+class ConnectorRegistry:
+    """Services keyed by name; connector classes are imported lazily.
+
+    ``classes`` holds the classes loaded so far. Tests patch it to swap in
+    fakes for a service.
+    """
+
+    def __init__(self, specs: list[ConnectorSpec]) -> None:
+        self._specs = {spec.service: spec for spec in specs}
+        self.classes: dict[str, type] = {}
+
+    def __contains__(self, service: object) -> bool:
+        return service in self._specs or service in self.classes
+
+    def services(self) -> list[str]:
+        return list(self._specs)
+
+    def spec(self, service: str) -> ConnectorSpec | None:
+        return self._specs.get(service)
+
+    def get(self, service: str) -> type | None:
+        """The connector class for ``service``, or None if it is unknown."""
+        cls = self.classes.get(service)
+        if cls is None:
+            spec = self._specs.get(service)
+            if spec is None:
+                return None
+            cls = self.classes[service] = spec.load()
+        return cls
+
+    def loaded(self, cost: CostClass | None = None) -> list[str]:
+        """Services whose connector has been imported, optionally by cost class."""
+        return [
+            service
+            for service in self.classes
+            if cost is None or (service in self._specs and self._specs[service].cost == cost)
+        ]
+
+
+connector_registry = ConnectorRegistry([
+    ConnectorSpec("github", "app.connectors.github:GitHubConnector", HTTP, cache_ttl=600),
+    ConnectorSpec("letterboxd", "app.connectors.letterboxd:LetterboxdConnector", HTTP, cache_ttl=600),
+    # Spotify resolves its OAuth token from the vault by identifier
+    ConnectorSpec("spotify", "app.connectors.spotify:SpotifyConnector", HTTP, cache_ttl=300),
+    ConnectorSpec(
+        "instagram", "app.connectors.instagram:InstagramConnector", BROWSER,
+        cache_ttl=1800, max_concurrency=2,
+    ),
+    ConnectorSpec(
+        "linkedin", "app.connectors.linkedin:LinkedInConnector", BROWSER,
+        cache_ttl=1800, max_concurrency=2,
+    ),
+])
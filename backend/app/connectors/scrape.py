@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field, replace
+from urllib.parse import urlsplit
+
+from bs4 import BeautifulSoup
+from playwright.async_api import Page, Route
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from app.services import deadline
+
+
+@dataclass
+class StaticPage:
+    """The handful of fields our scrapers read, pulled from raw HTML."""
+
+    title: str = ""
+    og_description: str = ""
+    meta_description: str = ""
+    h1: str = ""
+    headline: str = ""
+
+
+def parse_static_page(html: str, headline_selector: str | None = None) -> StaticPage:
+    soup = BeautifulSoup(html, "html.parser")
+
+    def meta(**attrs: str) -> str:
+        tag = soup.find("meta", attrs=attrs)
+        return (tag.get("content") or "").strip() if tag else ""
+
+    def text(selector: str | None) -> str:
+        el = soup.select_one(selector) if selector else None
+        return el.get_text(" ", strip=True) if el else ""
+
+    return StaticPage(
+        title=soup.title.get_text(strip=True) if soup.title else "",
+        og_description=meta(property="og:description"),
+        meta_description=meta(name="description"),
+        h1=text("h1"),
+        headline=text(headline_selector),
+    )
+
+
+async def parse_static_page_async(html: str, headline_selector: str | None = None) -> StaticPage:
+    # Profile pages run to hundreds of KB; keep the parse off the event loop
+    return await asyncio.to_thread(parse_static_page, html, headline_selector)
+
+
+# ── headless load profiles ────────────────────────────────────────
+
+# Playwright resource types we never read from; stylesheets are only
+# needed when the page is going to be screenshotted.
+HEAVY_RESOURCE_TYPES = frozenset({"image", "media", "font", "texttrack", "manifest"})
+
+
+@dataclass(frozen=True)
+class ScraperProfile:
+    """How a connector's headless page loads: what to block and when to read.
+
+    ``first_party`` lists domain suffixes requests may go to; everything else
+    (ads, analytics, other CDNs) is aborted. ``ready_selector`` should match
+    whichever element shows the page is usable, including login/auth walls,
+    so we stop waiting as soon as either appears.
+    """
+
+    first_party: tuple[str, ...]
+    blocked_types: frozenset[str] = field(
+        default_factory=lambda: HEAVY_RESOURCE_TYPES | {"stylesheet"}
+    )
+    wait_until: str = "domcontentloaded"
+    ready_selector: str | None = None
+    ready_timeout: int = 5000
+
+    def with_screenshot(self) -> ScraperProfile:
+        """Same profile, but let through what a faithful screenshot needs."""
+        return replace(self, blocked_types=self.blocked_types - {"image", "stylesheet"})
+
+    def allows(self, resource_type: str, url: str) -> bool:
+        if resource_type in self.blocked_types:
+            return False
+        host = urlsplit(url).hostname or ""
+        return any(host == d or host.endswith("." + d) for d in self.first_party)
+
+    async def install(self, page: Page) -> None:
+        await page.route("**/*", self._handle_route)
+
+    async def _handle_route(self, route: Route) -> None:
+        request = route.request
+        if self.allows(request.resource_type, request.url):
+            await route.continue_()
+        else:
+            await route.abort()
+
+    async def wait_ready(self, page: Page) -> None:
+        """Wait for the ready selector instead of sleeping a fixed time."""
+        if not self.ready_selector:
+            return
+        try:
+            await page.wait_for_selector(
+                self.ready_selector, state="attached", timeout=deadline.budget_ms(self.ready_timeout)
+            )
+        except PlaywrightTimeoutError:
+            pass
@@ -6,28 +6,68 @@ from typing import Any
 
 import httpx
 
-from app.connectors.base import BaseConnector
+from app.config import settings
+from app.connectors.base import FULL, PREVIEW, PROBE, BaseConnector, FetchDepth
+from app.connectors.paginate import paginate
+from app.services.http import http_clients
+from app.services.spotify_tokens import SpotifyTokenVault, spotify_tokens
 
 API_BASE = "https://api.spotify.com/v1"
 
 
 class SpotifyConnector(BaseConnector):
-    """Fetch Spotify listening profile using an OAuth access token."""
-
-    def __init__(self, access_token: str) -> None:
+    """Fetch Spotify listening profile using an OAuth access token.
+
+    Without an explicit ``access_token`` the token is looked up (and
+    refreshed when needed) in the vault by the identifier passed to
+    :meth:`fetch`, which is how the ingest path constructs it.
+    """
+
+    def __init__(
+        self,
+        access_token: str | None = None,
+        client: httpx.AsyncClient | None = None,
+        vault: SpotifyTokenVault | None = None,
+    ) -> None:
         self.access_token = access_token
+        self._client = client
+        self.vault = vault or spotify_tokens
+        self._username = ""
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return self._client or http_clients.get("spotify", base_url=API_BASE)
+
+    @property
+    def _auth_headers(self) -> dict[str, str]:
+        # The pooled client is shared across users, so auth travels per request
+        return {"Authorization": f"Bearer {self.access_token}"}
+
+    async def fetch(self, identifier: str = "", depth: FetchDepth = FULL) -> dict[str, Any]:
+        if self.access_token is None:
+            self._username = identifier.strip().lstrip("@")
+            self.access_token = await self.vault.access_token(self._username)
+            if self.access_token is None:
+                raise PermissionError(f"No Spotify authorization stored for {self._username}")
+
+        client = self.client
+        if depth == PROBE:
+            await self._get(client, "/me")
+            return {"exists": True}
+        if depth == PREVIEW:
+            artists = await self._fetch_top_artists(client)
+            return {
+                "top_artists": self._extract_artists(artists),
+                "top_genres": self._extract_top_genres(artists),
+            }
 
-    async def fetch(self, identifier: str = "") -> dict[str, Any]:
-        async with httpx.AsyncClient(
-            base_url=API_BASE,
-            headers={"Authorization": f"Bearer {self.access_token}"},
-            timeout=15,
-        ) as client:
-            artists, tracks, recent = await asyncio.gather(
-                self._fetch_top_artists(client),
-                self._fetch_top_tracks(client),
-                self._fetch_recently_played(client),
-            )
+        # Recently-played pages are sequential (cursor-linked) but overlap
+        # with the two top-items calls, so the extra pages add no latency
+        artists, tracks, recent = await asyncio.gather(
+            self._fetch_top_artists(client),
+            self._fetch_top_tracks(client),
+            self._fetch_recently_played(client),
+        )
 
         return {
             "top_artists": self._extract_artists(artists),
@@ -38,30 +78,46 @@ class SpotifyConnector(BaseConnector):
 
     # ── individual API calls ──────────────────────────────────────
 
-    async def _fetch_top_artists(self, client: httpx.AsyncClient) -> dict:
-        resp = await client.get(
-            "/me/top/artists", params={"limit": 50, "time_range": "medium_term"}
-        )
+    async def _get(
+        self, client: httpx.AsyncClient, url: str, params: dict[str, Any] | None = None
+    ) -> dict:
+        resp = await client.get(url, params=params, headers=self._auth_headers)
+        if resp.status_code == 401 and self._username:
+            # Vault token revoked or expired early: refresh once and retry
+            self.access_token = await self.vault.access_token(self._username, force_refresh=True)
+            resp = await client.get(url, params=params, headers=self._auth_headers)
         if resp.status_code == 401:
             raise PermissionError("Spotify token expired or invalid")
         resp.raise_for_status()
         return resp.json()
 
+    async def _fetch_top_artists(self, client: httpx.AsyncClient) -> dict:
+        return await self._get(
+            client, "/me/top/artists", {"limit": 50, "time_range": "medium_term"}
+        )
+
     async def _fetch_top_tracks(self, client: httpx.AsyncClient) -> dict:
-        resp = await client.get(
-            "/me/top/tracks", params={"limit": 50, "time_range": "medium_term"}
+        return await self._get(
+            client, "/me/top/tracks", {"limit": 50, "time_range": "medium_term"}
         )
-        if resp.status_code == 401:
-            raise PermissionError("Spotify token expired or invalid")
-        resp.raise_for_status()
-        return resp.json()
 
     async def _fetch_recently_played(self, client: httpx.AsyncClient) -> dict:
-        resp = await client.get("/me/player/recently-played", params={"limit": 50})
-        if resp.status_code == 401:
-            raise PermissionError("Spotify token expired or invalid")
-        resp.raise_for_status()
-        return resp.json()
+        """Follow ``before`` cursors back past the 50-item page limit."""
+
+        async def fetch_page(url: str, params: dict[str, Any] | None) -> tuple[list, str | None]:
+            data = await self._get(client, url, params)
+            return data.get("items", []), data.get("next")
+
+        items: list[dict] = []
+        async for page in paginate(
+            fetch_page,
+            "/me/player/recently-played",
+            {"limit": 50},
+            max_pages=settings.spotify_recent_max_pages,
+            time_budget=settings.spotify_page_time_budget,
+        ):
+            items.extend(page or [])
+        return {"items": items}
 
     # ── data extraction ───────────────────────────────────────────
 
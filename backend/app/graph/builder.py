@@ -1,10 +1,9 @@
 from __future__ import annotations
 
-from langgraph.graph import StateGraph, END
+from langgraph.graph import StateGraph, START, END
 
 from app.models.state import PipelineState
-from app.graph.nodes.ingest import ingest_node
-from app.graph.nodes.analyze import analyze_node
+from app.graph.nodes.profile import make_profile_node
 from app.graph.nodes.crossref import crossref_node
 from app.graph.nodes.venue import venue_node
 from app.graph.nodes.coach import coach_node
@@ -14,15 +13,17 @@ from app.graph.edges import should_include_venue
 def build_graph() -> StateGraph:
     graph = StateGraph(PipelineState)
 
-    graph.add_node("ingest", ingest_node)
-    graph.add_node("analyze", analyze_node)
+    # One ingest → analyze branch per user; each starts analysis as soon as
+    # its own connectors finish, and both join at crossref.
+    graph.add_node("profile_a", make_profile_node("user_a"))
+    graph.add_node("profile_b", make_profile_node("user_b"))
     graph.add_node("crossref", crossref_node)
     graph.add_node("venue", venue_node)
     graph.add_node("coach", coach_node)
 
-    graph.set_entry_point("ingest")
-    graph.add_edge("ingest", "analyze")
-    graph.add_edge("analyze", "crossref")
+    graph.add_edge(START, "profile_a")
+    graph.add_edge(START, "profile_b")
+    graph.add_edge(["profile_a", "profile_b"], "crossref")
     graph.add_conditional_edges("crossref", should_include_venue, {"venue": "venue", "coach": "coach"})
     graph.add_edge("venue", "coach")
     graph.add_edge("coach", END)
@@ -1,7 +1,11 @@
-from app.graph.nodes.ingest import ingest_node
-from app.graph.nodes.analyze import analyze_node
+from app.graph.nodes.profile import make_profile_node
 from app.graph.nodes.crossref import crossref_node
 from app.graph.nodes.venue import venue_node
 from app.graph.nodes.coach import coach_node
 
-__all__ = ["ingest_node", "analyze_node", "crossref_node", "venue_node", "coach_node"]
+__all__ = [
+    "make_profile_node",
+    "crossref_node",
+    "venue_node",
+    "coach_node",
+]
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
-from app.models.state import PipelineState
+import asyncio
+from typing import Optional
 
+from langchain_core.runnables import RunnableConfig
 
-from app.services.llm import LLMService
+from app.config import settings
+from app.models.state import PipelineState
+from app.services.llm import llm_from_config
 
 
-async def coach_node(state: PipelineState) -> dict:
-    llm = LLMService()
+async def coach_node(state: PipelineState, config: Optional[RunnableConfig] = None) -> dict:
+    llm = llm_from_config(config)
+    mode = (config or {}).get("configurable", {}).get("coaching_mode") or settings.coaching_mode
 
     cross_ref = state.get("cross_ref", {})
     user_a_dossier = state.get("user_a", {}).get("dossier", {})
@@ -17,21 +22,30 @@ async def coach_node(state: PipelineState) -> dict:
     # If venues were suggested, pick the top one as context
     selected_venue = venues[0] if venues else None
 
-    # Generate briefing for User A (how to talk to B)
-    briefing_a = await llm.generate_coaching(
-        target_user=user_a_dossier,
-        other_user=user_b_dossier,
-        cross_ref=cross_ref,
-        venue=selected_venue
-    )
-
-    # Generate briefing for User B (how to talk to A)
-    briefing_b = await llm.generate_coaching(
-        target_user=user_b_dossier,
-        other_user=user_a_dossier,
-        cross_ref=cross_ref,
-        venue=selected_venue
-    )
+    if mode == "merged":
+        # One call returns both perspectives; shared context is sent once
+        briefing_a, briefing_b = await llm.generate_dual_coaching(
+            user_a=user_a_dossier,
+            user_b=user_b_dossier,
+            cross_ref=cross_ref,
+            venue=selected_venue,
+        )
+    else:
+        # Briefing for User A (how to talk to B) and User B (how to talk to A)
+        briefing_a, briefing_b = await asyncio.gather(
+            llm.generate_coaching(
+                target_user=user_a_dossier,
+                other_user=user_b_dossier,
+                cross_ref=cross_ref,
+                venue=selected_venue
+            ),
+            llm.generate_coaching(
+                target_user=user_b_dossier,
+                other_user=user_a_dossier,
+                cross_ref=cross_ref,
+                venue=selected_venue
+            ),
+        )
 
     return {
         "coaching_a": briefing_a,
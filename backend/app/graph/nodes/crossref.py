@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+from typing import Optional
+
+from langchain_core.runnables import RunnableConfig
+
 from app.models.state import PipelineState
-from app.services.llm import LLMService
+from app.services.llm import llm_from_config
 
 
-async def crossref_node(state: PipelineState) -> dict:
-    llm = LLMService()
+async def crossref_node(state: PipelineState, config: Optional[RunnableConfig] = None) -> dict:
+    llm = llm_from_config(config)
 
     dossier_a = state.get("user_a", {}).get("dossier", {})
     dossier_b = state.get("user_b", {}).get("dossier", {})
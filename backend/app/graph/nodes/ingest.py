@@ -2,51 +2,171 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import Hashable
 from typing import Any
 
-from app.connectors import (
-    GitHubConnector,
-    LetterboxdConnector,
-    InstagramConnector,
-    LinkedInConnector,
-)
-from app.models.state import PipelineState, UserDataBundle
+from app.connectors.base import FULL, FetchDepth, depths_satisfying
+from app.connectors.registry import connector_registry
+from app.models.state import UserDataBundle
+from app.services.cache import connector_cache, negative_cache, normalize_identifier
+from app.services.ratelimit import RateLimitExceeded
+from app.services.scheduler import ingest_scheduler
+from app.services.scraper_workers import scraper_workers
+from app.services.singleflight import SingleFlight
+from app.services.spotify_tokens import spotify_tokens
 
 logger = logging.getLogger(__name__)
 
-# Map identifier keys to connector classes (no-arg constructors only)
-CONNECTOR_MAP: dict[str, type] = {
-    "github": GitHubConnector,
-    "letterboxd": LetterboxdConnector,
-    "instagram": InstagramConnector,
-    "linkedin": LinkedInConnector,
-}
+# Concurrent requests for the same (service, identifier) share one fetch
+connector_flights = SingleFlight()
 
 
-async def _fetch_one(service: str, identifier: str) -> tuple[str, dict[str, Any]]:
+async def fetch_service_data(
+    service: str,
+    identifier: str,
+    connector_cls: type,
+    *,
+    depth: FetchDepth = FULL,
+    bypass_cache: bool = False,
+    screenshot: bool = False,
+    tenant: Hashable | None = None,
+    spotify_grant: str | None = None,
+) -> dict[str, Any]:
+    """Fetch one connector's data through the shared result cache.
+
+    A cached result at ``depth`` or any deeper level is served as-is, so a
+    warmed full fetch also answers later previews.
+
+    Raises whatever the connector raises; failures are never cached.
+    ``bypass_cache`` skips the lookup (and forgets any negative outcome) but
+    still stores the fresh result. Empty results the connector recorded in
+    the negative cache are not stored as positive hits.
+    Concurrent callers for the same key join a single in-flight fetch.
+
+    ``screenshot`` asks the connector (Instagram only) to capture one; a
+    cached result without a ``screenshot_ref`` does not satisfy it.
+
+    The connector call itself waits for a slot in ``ingest_scheduler``;
+    ``tenant`` (one API request) is the unit it keeps fair across.
+
+    Spotify data is private: unless ``spotify_grant`` (the caller's
+    ``spotify_grant`` cookie) matches the account's authorization, this
+    raises PermissionError before the cache or the connector is touched.
+    """
+    if service == "spotify":
+        await spotify_tokens.check_grant(identifier, spotify_grant)
+    if bypass_cache:
+        negative_cache.invalidate(service, identifier)
+    else:
+        for level in depths_satisfying(depth):
+            cached = connector_cache.get(service, identifier, level)
+            if cached is not None and (not screenshot or "screenshot_ref" in cached):
+                return dict(cached)
+
+    async def fetch_and_store() -> dict[str, Any]:
+        if scraper_workers.handles(service):
+            connector = scraper_workers.connector(service, connector_cls)
+        else:
+            connector = connector_cls()
+        async with ingest_scheduler.slot(service, tenant):
+            if screenshot:
+                data = await connector.fetch(identifier, depth=depth, screenshot=True)
+            else:
+                data = await connector.fetch(identifier, depth=depth)
+        # Screenshots travel as screenshot_ref; never keep inline image data
+        if service == "instagram":
+            data.pop("screenshot_b64", None)
+        if not negative_cache.contains(service, identifier):
+            connector_cache.set(service, identifier, data, depth)
+        return data
+
+    key = (service, normalize_identifier(identifier), depth, screenshot)
+    return dict(await connector_flights.do(key, fetch_and_store))
+
+
+async def warm_service_data(
+    service: str,
+    identifier: str,
+    connector_cls: type,
+    *,
+    bypass_cache: bool = False,
+    spotify_grant: str | None = None,
+) -> None:
+    """Run the full fetch into the cache in the background; never raises."""
+    try:
+        await fetch_service_data(
+            service,
+            identifier,
+            connector_cls,
+            bypass_cache=bypass_cache,
+            spotify_grant=spotify_grant,
+        )
+    except Exception:
+        logger.warning("Background warm of %s for %s failed", service, identifier, exc_info=True)
+
+
+async def _fetch_one(
+    service: str,
+    identifier: str,
+    *,
+    bypass_cache: bool = False,
+    tenant: Hashable | None = None,
+    spotify_grant: str | None = None,
+) -> tuple[str, dict[str, Any]]:
     """Fetch data from a single connector, returning (service, data)."""
     try:
-        connector_cls = CONNECTOR_MAP.get(service)
+        connector_cls = connector_registry.get(service)
         if not connector_cls:
             logger.warning("No connector for service: %s", service)
             return service, {}
-        connector = connector_cls()
-        data = await connector.fetch(identifier)
-        # Strip screenshot_b64 from instagram — too large for LLM
-        if service == "instagram":
-            data.pop("screenshot_b64", None)
+        data = await fetch_service_data(
+            service,
+            identifier,
+            connector_cls,
+            bypass_cache=bypass_cache,
+            tenant=tenant,
+            spotify_grant=spotify_grant,
+        )
         return service, data
+    except RateLimitExceeded as exc:
+        logger.warning(
+            "Connector %s rate limited for %s; retry in %.0fs",
+            service, identifier, exc.retry_after,
+        )
+        return service, {}
+    except PermissionError as exc:
+        # e.g. no stored Spotify authorization for this user
+        logger.warning("Connector %s not authorized for %s: %s", service, identifier, exc)
+        return service, {}
     except Exception:
         logger.exception("Connector %s failed for %s", service, identifier)
         return service, {}
 
 
-async def _fetch_user_data(identifiers: dict[str, str | None]) -> UserDataBundle:
-    """Run all non-null connectors in parallel for a user."""
+async def _fetch_user_data(
+    identifiers: dict[str, str | None],
+    *,
+    bypass_cache: bool = False,
+    tenant: Hashable | None = None,
+    spotify_grant: str | None = None,
+) -> UserDataBundle:
+    """Run all non-null connectors in parallel for a user.
+
+    Without a ``tenant`` the call is its own tenant in the scheduler.
+    """
+    tenant = object() if tenant is None else tenant
     tasks = []
     for service, identifier in identifiers.items():
         if identifier:
-            tasks.append(_fetch_one(service, identifier))
+            tasks.append(
+                _fetch_one(
+                    service,
+                    identifier,
+                    bypass_cache=bypass_cache,
+                    tenant=tenant,
+                    spotify_grant=spotify_grant,
+                )
+            )
 
     if not tasks:
         return {}
@@ -57,21 +177,3 @@ async def _fetch_user_data(identifiers: dict[str, str | None]) -> UserDataBundle
         if data:
             bundle[service] = data
     return bundle
-
-
-async def ingest_node(state: PipelineState) -> dict:
-    user_a = state.get("user_a", {})
-    user_b = state.get("user_b", {})
-
-    ids_a = user_a.get("identifiers", {})
-    ids_b = user_b.get("identifiers", {})
-
-    raw_a, raw_b = await asyncio.gather(
-        _fetch_user_data(ids_a),
-        _fetch_user_data(ids_b),
-    )
-
-    return {
-        "user_a": {**user_a, "raw_data": raw_a},
-        "user_b": {**user_b, "raw_data": raw_b},
-    }
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from typing import Optional
+
+from langchain_core.runnables import RunnableConfig
+
+from app.graph.nodes.ingest import _fetch_user_data
+from app.models.state import PipelineState
+from app.services.llm import llm_from_config
+
+
+def make_profile_node(
+    user_key: str,
+) -> Callable[[PipelineState, Optional[RunnableConfig]], Awaitable[dict]]:
+    """Build a node that ingests and analyzes a single user end to end.
+
+    LangGraph runs nodes in lock-step supersteps, so separate ingest and
+    analyze nodes would hold user A's analysis until user B's slowest scrape
+    finishes. Keeping each user's path inside one node lets both paths run
+    independently and join at crossref. Both nodes fetch as the
+    ``configurable["tenant"]`` of the run, so one request is scheduled as
+    one tenant, and with the caller's ``configurable["spotify_grant"]``.
+    """
+
+    async def profile_node(state: PipelineState, config: Optional[RunnableConfig] = None) -> dict:
+        llm = llm_from_config(config)
+        configurable = (config or {}).get("configurable", {})
+        user = state.get(user_key, {})
+
+        raw_data = await _fetch_user_data(
+            user.get("identifiers", {}),
+            tenant=configurable.get("tenant"),
+            spotify_grant=configurable.get("spotify_grant"),
+        )
+        dossier = await llm.profile_analysis(raw_data)
+
+        return {user_key: {**user, "raw_data": raw_data, "dossier": dossier}}
+
+    profile_node.__name__ = f"profile_{user_key}"
+    return profile_node
@@ -1,12 +1,37 @@
 from __future__ import annotations
 
+import asyncio
+import logging
+from typing import Optional
+
+from langchain_core.runnables import RunnableConfig
+
+from app.config import settings
 from app.models.state import PipelineState
-from app.services.llm import LLMService
+from app.services.llm import llm_from_config
 from app.services.places import PlacesService
 
+logger = logging.getLogger(__name__)
+
+
+def _dedupe_candidates(candidates: list[dict]) -> list[dict]:
+    """Drop repeat places (same Places id, else same name + address), keeping order."""
+    seen: set[tuple] = set()
+    unique: list[dict] = []
+    for c in candidates:
+        if c.get("place_id"):
+            key = ("id", c["place_id"])
+        else:
+            key = ("name", (c.get("name") or "").strip().lower(), (c.get("address") or "").strip().lower())
+        if key in seen:
+            continue
+        seen.add(key)
+        unique.append(c)
+    return unique
 
-async def venue_node(state: PipelineState) -> dict:
-    llm = LLMService()
+
+async def venue_node(state: PipelineState, config: Optional[RunnableConfig] = None) -> dict:
+    llm = llm_from_config(config)
     places = PlacesService()
 
     cross_ref = state.get("cross_ref", {})
@@ -16,14 +41,24 @@ async def venue_node(state: PipelineState) -> dict:
     # 1. Brainstorm creative ideas and search queries
     suggested_queries = await llm.brainstorm_venue_queries(cross_ref)
 
-    # 2. Search for real-world candidates based on those queries
-    candidates = []
-    for q in suggested_queries:
+    # 2. Search for real-world candidates, all queries at once under a cap
+    limit = asyncio.Semaphore(settings.places_max_concurrency)
+
+    async def search(q: dict) -> list[dict]:
         query_text = q.get("search_query") or q.get("name")
-        real_places = await places.search_venue(query_text, location=location)
-        
+        if not query_text:
+            return []
+        try:
+            async with limit:
+                real_places = await places.search_venue(query_text, location=location)
+        except Exception:
+            logger.exception("Places search failed for %r", query_text)
+            return []
         # Take up to 5 matches per query as candidates
-        candidates.extend(real_places[:5])
+        return real_places[:5]
+
+    results = await asyncio.gather(*(search(q) for q in suggested_queries))
+    candidates = _dedupe_candidates([place for batch in results for place in batch])
 
     # 3. Rank the candidates and contextualize them for the match
     final_venues = await llm.rank_venues(candidates, cross_ref)
@@ -3,21 +3,23 @@ import json
 
 import asyncio
 import logging
+from contextlib import asynccontextmanager
 from typing import Any
 
-from fastapi import FastAPI
+from fastapi import BackgroundTasks, Cookie, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse, JSONResponse, Response
 from sse_starlette.sse import EventSourceResponse
 
 from app.config import settings
-from app.connectors import (
-    GitHubConnector,
-    LetterboxdConnector,
-    InstagramConnector,
-    LinkedInConnector,
-)
+from app.connectors.registry import BROWSER, connector_registry
 from app.graph.builder import build_graph
-from app.graph.nodes.ingest import _fetch_user_data
+from app.graph.nodes.ingest import (
+    _fetch_user_data,
+    connector_flights,
+    fetch_service_data,
+    warm_service_data,
+)
 from app.models.schemas import (
     MatchRequest,
     CoachingResponse,
@@ -30,15 +32,52 @@ from app.models.schemas import (
     MatchInput,
     MatchResult,
     ProfileResponse,
+    SpotifyAuthRequest,
     UserInput,
 )
+from app.services.cache import connector_cache, negative_cache
+from app.services.deadline import (
+    ClientDisconnected,
+    DeadlineExceeded,
+    request_deadline,
+    run_request,
+)
 from app.services.findings import generate_findings
-from app.services.llm import LLMService
+from app.services.http import http_clients
+from app.services.llm import close_llm_service, get_llm_service
+from app.services.llm_cache import crossref_cache, dossier_cache
+from app.services.scheduler import ingest_scheduler
+from app.services.scraper_workers import scraper_workers
+from app.services.screenshots import MEDIA_TYPES, screenshot_store
+from app.services.spotify_tokens import spotify_tokens
+from app.services.store import shared_store
+from app.services.validators import validator_store
 from app.services.preview import generate_preview
+from app.services.ratelimit import RateLimitExceeded, github_rate_limits
 
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Starstruck", version="0.1.0")
+# How long a browser keeps the cookie that unlocks its Spotify authorization
+SPOTIFY_GRANT_MAX_AGE = 365 * 24 * 3600
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    llm = get_llm_service()
+    if settings.llm_warm_up:
+        await llm.warm_up()
+    yield
+    await http_clients.aclose()
+    if connector_registry.loaded(BROWSER):
+        from app.services.browser import browser_pool
+
+        await browser_pool.aclose()
+    scraper_workers.shutdown()
+    await close_llm_service()
+    shared_store.close()
+
+
+app = FastAPI(title="Starstruck", version="0.1.0", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -49,14 +88,17 @@ app.add_middleware(
 )
 
 pipeline = build_graph()
-llm_service = LLMService()
 
-CONNECTOR_MAP: dict[str, type] = {
-    "github": GitHubConnector,
-    "letterboxd": LetterboxdConnector,
-    "instagram": InstagramConnector,
-    "linkedin": LinkedInConnector,
-}
+
+@app.exception_handler(DeadlineExceeded)
+async def deadline_exceeded(request: Request, exc: DeadlineExceeded):
+    return JSONResponse(status_code=504, content={"detail": "Request deadline exceeded"})
+
+
+@app.exception_handler(ClientDisconnected)
+async def client_disconnected(request: Request, exc: ClientDisconnected):
+    # Nobody is listening; the status only shows up in access logs
+    return Response(status_code=499)
 
 
 @app.get("/health")
@@ -64,33 +106,141 @@ async def health():
     return {"status": "ok"}
 
 
+@app.get("/metrics")
+async def metrics():
+    return {
+        "connector_cache": connector_cache.stats(),
+        "negative_cache": negative_cache.stats(),
+        "github_rate_limits": github_rate_limits.stats(),
+        "validators": validator_store.stats(),
+        "spotify_tokens": spotify_tokens.stats(),
+        "connector_flights": connector_flights.stats(),
+        "scraper_workers": scraper_workers.stats(),
+        "ingest_scheduler": ingest_scheduler.stats(),
+        "dossier_cache": dossier_cache.stats(),
+        "crossref_cache": crossref_cache.stats(),
+    }
+
+
 # ── New frontend-facing endpoints ─────────────────────────────
 
 
 @app.post("/api/connect", response_model=ConnectResponse)
-async def connect_service(request: ConnectRequest):
-    """Run a single connector and return a preview string."""
-    connector_cls = CONNECTOR_MAP.get(request.service)
+async def connect_service(
+    request: ConnectRequest,
+    background_tasks: BackgroundTasks,
+    spotify_grant: str | None = Cookie(default=None),
+):
+    """Run a cheap connector fetch and return a preview string.
+
+    The full fetch the pipeline needs is warmed into the cache after the
+    response is sent.
+    """
+    connector_cls = connector_registry.get(request.service)
     if not connector_cls:
         return ConnectResponse(success=False, preview=f"Unknown service: {request.service}")
 
+    # A screenshot needs the rendered page, which only the full fetch has
+    screenshot = request.screenshot and request.service == "instagram"
     try:
-        connector = connector_cls()
-        data = await connector.fetch(request.username)
+        data = await fetch_service_data(
+            request.service,
+            request.username,
+            connector_cls,
+            depth="full" if screenshot else request.depth,
+            bypass_cache=request.refresh,
+            screenshot=screenshot,
+            spotify_grant=spotify_grant,
+        )
         preview = generate_preview(request.service, data)
-        return ConnectResponse(success=True, preview=preview)
+        if data.get("exists") is False:
+            return ConnectResponse(success=False, preview=preview)
+        background_tasks.add_task(
+            warm_service_data,
+            request.service,
+            request.username,
+            connector_cls,
+            bypass_cache=request.refresh,
+            spotify_grant=spotify_grant,
+        )
+        return ConnectResponse(
+            success=True, preview=preview, screenshot_ref=data.get("screenshot_ref")
+        )
+    except RateLimitExceeded as exc:
+        minutes = max(1, round(exc.retry_after / 60))
+        return ConnectResponse(
+            success=False, preview=f"Rate limited, try again in {minutes} min"
+        )
+    except PermissionError:
+        # e.g. Spotify without the grant /api/spotify/authorize hands out
+        return ConnectResponse(
+            success=False, preview=f"Authorize {request.service.capitalize()} to connect"
+        )
     except Exception:
         logger.exception("Connector %s failed", request.service)
         return ConnectResponse(success=True, preview="Connected (limited data)")
 
 
+@app.get("/api/screenshots/{ref}")
+async def get_screenshot(ref: str):
+    """Serve a stored profile screenshot by the ref returned from /api/connect."""
+    path = screenshot_store.path_for(ref)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Screenshot not found")
+    return FileResponse(path, media_type=MEDIA_TYPES[path.suffix.lstrip(".")])
+
+
+@app.post("/api/spotify/authorize", response_model=ConnectResponse)
+async def authorize_spotify(
+    request: SpotifyAuthRequest, background_tasks: BackgroundTasks, response: Response
+):
+    """Exchange an OAuth code for tokens so ingest can fetch this user's Spotify.
+
+    The tokens are only usable by requests carrying the ``spotify_grant``
+    cookie set here.
+    """
+    try:
+        grant = await spotify_tokens.exchange_code(
+            request.username, request.code, request.redirect_uri
+        )
+    except PermissionError as exc:
+        return ConnectResponse(success=False, preview=str(exc))
+    cross_site = settings.spotify_grant_cross_site
+    response.set_cookie(
+        "spotify_grant",
+        grant,
+        max_age=SPOTIFY_GRANT_MAX_AGE,
+        httponly=True,
+        secure=cross_site,
+        samesite="none" if cross_site else "lax",
+    )
+    background_tasks.add_task(
+        warm_service_data,
+        "spotify",
+        request.username,
+        connector_registry.get("spotify"),
+        spotify_grant=grant,
+    )
+    return ConnectResponse(success=True, preview="Spotify connected")
+
+
 @app.post("/api/analyze", response_model=AnalysisResult)
-async def analyze_user(request: AnalyzeRequest):
+async def analyze_user(
+    request: AnalyzeRequest,
+    http_request: Request,
+    spotify_grant: str | None = Cookie(default=None),
+):
     """Run all connectors + LLM analysis for one user."""
-    raw_data = await _fetch_user_data(request.identifiers)
+    return await run_request(http_request, _analyze_user(request, spotify_grant))
 
-    llm = LLMService()
-    dossier = await llm.profile_analysis(raw_data)
+
+async def _analyze_user(request: AnalyzeRequest, spotify_grant: str | None) -> AnalysisResult:
+    raw_data = await _fetch_user_data(
+        request.identifiers, bypass_cache=request.refresh, spotify_grant=spotify_grant
+    )
+
+    llm = get_llm_service()
+    dossier = await llm.profile_analysis(raw_data, refresh=request.refresh)
 
     public = dossier.get("public", {})
     findings = generate_findings(dossier, raw_data)
@@ -105,19 +255,29 @@ async def analyze_user(request: AnalyzeRequest):
 
 
 @app.post("/api/match", response_model=MatchResult)
-async def match_users(request: MatchInput):
+async def match_users(
+    request: MatchInput,
+    http_request: Request,
+    spotify_grant: str | None = Cookie(default=None),
+):
     """Run full pipeline for two users: ingest → analyze → crossref."""
-    # Ingest both users in parallel
+    return await run_request(http_request, _match_users(request, spotify_grant))
+
+
+async def _match_users(request: MatchInput, spotify_grant: str | None) -> MatchResult:
+    # Ingest both users in parallel, as one tenant of the ingest scheduler
+    tenant = object()
+    fetch_options = {"bypass_cache": request.refresh, "tenant": tenant, "spotify_grant": spotify_grant}
     raw_a, raw_b = await asyncio.gather(
-        _fetch_user_data(request.user_a),
-        _fetch_user_data(request.user_b),
+        _fetch_user_data(request.user_a, **fetch_options),
+        _fetch_user_data(request.user_b, **fetch_options),
     )
 
     # Analyze both in parallel
-    llm = LLMService()
+    llm = get_llm_service()
     dossier_a, dossier_b = await asyncio.gather(
-        llm.profile_analysis(raw_a),
-        llm.profile_analysis(raw_b),
+        llm.profile_analysis(raw_a, refresh=request.refresh),
+        llm.profile_analysis(raw_b, refresh=request.refresh),
     )
 
     # Cross-reference
@@ -174,14 +334,25 @@ def _build_identifiers(user: Any) -> dict[str, str | None]:
     }
 
 
+def _pipeline_config(spotify_grant: str | None) -> dict[str, Any]:
+    # One scheduler tenant per run, shared by both users' profile nodes
+    return {
+        "configurable": {
+            "llm": get_llm_service(),
+            "tenant": object(),
+            "spotify_grant": spotify_grant,
+        }
+    }
+
+
 @app.post("/profile", response_model=ProfileResponse)
 async def analyze_profile(request: UserInput):
-    llm = LLMService()
+    llm = get_llm_service()
     
     raw_data = {}
     if request.letterboxd_username:
         # Use connector instead of Service
-        connector = LetterboxdConnector()
+        connector = connector_registry.get("letterboxd")()
         # Fetch returns dict, we put it under the service key
         raw_data["letterboxd"] = await connector.fetch(request.letterboxd_username)
     
@@ -192,7 +363,15 @@ async def analyze_profile(request: UserInput):
 
 
 @app.post("/run", response_model=CoachingResponse)
-async def run_pipeline(request: MatchRequest):
+async def run_pipeline(
+    request: MatchRequest,
+    http_request: Request,
+    spotify_grant: str | None = Cookie(default=None),
+):
+    return await run_request(http_request, _run_pipeline(request, spotify_grant))
+
+
+async def _run_pipeline(request: MatchRequest, spotify_grant: str | None) -> CoachingResponse:
     initial_state = {
         "user_a": {
             "username": request.user_a.github_username or "",
@@ -208,7 +387,7 @@ async def run_pipeline(request: MatchRequest):
         },
         "include_venue": request.include_venue,
     }
-    result = await pipeline.ainvoke(initial_state)
+    result = await pipeline.ainvoke(initial_state, config=_pipeline_config(spotify_grant))
     return CoachingResponse(
         venues=result.get("venues", []),
         coaching_a=result.get("coaching_a", {}),
@@ -218,7 +397,9 @@ async def run_pipeline(request: MatchRequest):
 
 
 @app.post("/stream")
-async def stream_pipeline(request: MatchRequest):
+async def stream_pipeline(
+    request: MatchRequest, spotify_grant: str | None = Cookie(default=None)
+):
     async def event_generator():
         initial_state = {
             "user_a": {
@@ -235,8 +416,29 @@ async def stream_pipeline(request: MatchRequest):
             },
             "include_venue": request.include_venue,
         }
-        async for event in pipeline.astream(initial_state):
-            yield {"event": "node_complete", "data": json.dumps(event)}
+        # The graph runs in its own task so the deadline never fires while
+        # this generator is suspended inside sse_starlette's send path
+        events: asyncio.Queue[dict | None] = asyncio.Queue()
+
+        async def run_graph() -> None:
+            async with request_deadline():
+                config = _pipeline_config(spotify_grant)
+                async for event in pipeline.astream(initial_state, config=config):
+                    events.put_nowait(event)
+
+        task = asyncio.ensure_future(run_graph())
+        task.add_done_callback(lambda _: events.put_nowait(None))
+        try:
+            while (event := await events.get()) is not None:
+                yield {"event": "node_complete", "data": json.dumps(event)}
+            try:
+                task.result()
+            except DeadlineExceeded:
+                yield {"event": "error", "data": json.dumps({"detail": "Request deadline exceeded"})}
+                return
+        finally:
+            # A client disconnect closes this generator; stop the graph with it
+            task.cancel()
         yield {"event": "done", "data": "{}"}
 
     return EventSourceResponse(event_generator())
@@ -244,7 +446,7 @@ async def stream_pipeline(request: MatchRequest):
 
 @app.post("/coach/chat", response_model=CoachChatResponse)
 async def coach_chat(request: CoachChatRequest):
-    reply = await llm_service.coach_chat(
+    reply = await get_llm_service().coach_chat(
         dossier_a=request.user_a_dossier,
         dossier_b=request.user_b_dossier,
         crossref=request.crossref,
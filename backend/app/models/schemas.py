@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel
 
@@ -58,15 +58,29 @@ class CoachChatResponse(BaseModel):
 class ConnectRequest(BaseModel):
     service: str
     username: str
+    refresh: bool = False
+    # probe only checks the account exists; preview is enough for the card
+    depth: Literal["probe", "preview"] = "preview"
+    # Instagram only: render the profile and store a screenshot
+    screenshot: bool = False
+
+
+class SpotifyAuthRequest(BaseModel):
+    username: str
+    code: str
+    redirect_uri: str
 
 
 class ConnectResponse(BaseModel):
     success: bool
     preview: str
+    # Served by GET /api/screenshots/{screenshot_ref}
+    screenshot_ref: str | None = None
 
 
 class AnalyzeRequest(BaseModel):
     identifiers: dict[str, str | None]
+    refresh: bool = False
 
 
 class AnalysisResult(BaseModel):
@@ -80,6 +94,7 @@ class AnalysisResult(BaseModel):
 class MatchInput(BaseModel):
     user_a: dict[str, str | None]
     user_b: dict[str, str | None]
+    refresh: bool = False
 
 
 class MatchResult(BaseModel):
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from playwright.async_api import Browser, Page, Playwright, async_playwright
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _BrowserSlot:
+    browser: Browser
+    pages_served: int = 0
+    active: int = 0
+    retired: bool = False
+
+    @property
+    def usable(self) -> bool:
+        return not self.retired and self.browser.is_connected()
+
+
+class BrowserPool:
+    """Small pool of long-lived headless Chromium browsers.
+
+    Each scrape gets its own fresh ``BrowserContext`` (no cookies or storage
+    leak between lookups), total open pages are capped by a semaphore, and a
+    browser is replaced after serving ``max_pages_per_browser`` pages or as
+    soon as it disconnects (crash, OOM kill).
+    """
+
+    def __init__(
+        self,
+        size: int | None = None,
+        max_pages: int | None = None,
+        max_pages_per_browser: int | None = None,
+    ) -> None:
+        self.size = size or settings.browser_pool_size
+        self.max_pages = max_pages or settings.browser_max_concurrent_pages
+        self.max_pages_per_browser = max_pages_per_browser or settings.browser_max_pages_per_browser
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._playwright: Playwright | None = None
+        self._slots: list[_BrowserSlot] = []
+
+    @asynccontextmanager
+    async def page(self, **context_kwargs: Any) -> AsyncIterator[Page]:
+        """Yield a page in a brand-new context; the context is closed afterwards."""
+        self._bind_loop()
+        async with self._page_slots:
+            slot = await self._acquire()
+            try:
+                context = await slot.browser.new_context(**context_kwargs)
+                try:
+                    yield await context.new_page()
+                finally:
+                    try:
+                        await context.close()
+                    except Exception:
+                        pass
+            finally:
+                slot.active -= 1
+                slot.pages_served += 1
+                if slot.pages_served >= self.max_pages_per_browser:
+                    slot.retired = True
+                await self._reap(slot)
+
+    async def aclose(self) -> None:
+        if self._loop is not asyncio.get_running_loop():
+            return
+        async with self._lock:
+            slots, self._slots = self._slots, []
+            for slot in slots:
+                await self._close_browser(slot)
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+
+    # ── browser lifecycle ─────────────────────────────────────────
+
+    def _bind_loop(self) -> None:
+        # Playwright and asyncio primitives belong to one event loop; start
+        # from scratch if we are now running under a different one.
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        self._loop = loop
+        self._playwright = None
+        self._slots = []
+        self._lock = asyncio.Lock()
+        self._page_slots = asyncio.Semaphore(self.max_pages)
+
+    async def _acquire(self) -> _BrowserSlot:
+        async with self._lock:
+            for slot in [s for s in self._slots if not s.usable]:
+                slot.retired = True
+                await self._reap(slot)
+
+            usable = [s for s in self._slots if s.usable]
+            if len(usable) < self.size:
+                slot = _BrowserSlot(browser=await self._launch())
+                self._slots.append(slot)
+            else:
+                slot = min(usable, key=lambda s: s.active)
+            slot.active += 1
+            return slot
+
+    async def _launch(self) -> Browser:
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        logger.info("Launching pooled Chromium browser")
+        return await self._playwright.chromium.launch(headless=True)
+
+    async def _reap(self, slot: _BrowserSlot) -> None:
+        """Close a retired browser once its last page is done."""
+        if slot.retired and slot.active <= 0 and slot in self._slots:
+            self._slots.remove(slot)
+            await self._close_browser(slot)
+
+    @staticmethod
+    async def _close_browser(slot: _BrowserSlot) -> None:
+        try:
+            await slot.browser.close()
+        except Exception:
+            pass
+
+
+browser_pool = BrowserPool()
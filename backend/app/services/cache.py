@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+from app.config import settings
+from app.connectors.registry import connector_registry
+
+
+class TTLCache:
+    """Size-bounded LRU cache whose entries expire after a per-entry TTL."""
+
+    def __init__(self, maxsize: int, default_ttl: float) -> None:
+        self.maxsize = maxsize
+        self.default_ttl = default_ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Any | None:
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def peek(self, key: Hashable) -> Any | None:
+        """Read without touching counters or LRU order."""
+        entry = self._data.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        ttl = self.default_ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._data),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+def normalize_identifier(identifier: str) -> str:
+    """Canonical form of a username so "@Foo " and "foo" share a cache entry."""
+    return identifier.strip().lstrip("@").lower()
+
+
+class ConnectorCache:
+    """Connector results keyed by (service, normalized identifier, depth)."""
+
+    def __init__(self, maxsize: int | None = None) -> None:
+        self._cache = TTLCache(
+            maxsize=maxsize or settings.connector_cache_max_entries,
+            default_ttl=settings.connector_cache_default_ttl,
+        )
+
+    @staticmethod
+    def ttl_for(service: str) -> float:
+        if service in settings.connector_cache_ttls:
+            return settings.connector_cache_ttls[service]
+        spec = connector_registry.spec(service)
+        return spec.cache_ttl if spec else settings.connector_cache_default_ttl
+
+    def get(self, service: str, identifier: str, depth: str = "full") -> dict[str, Any] | None:
+        return self._cache.get((service, normalize_identifier(identifier), depth))
+
+    def set(
+        self, service: str, identifier: str, data: dict[str, Any], depth: str = "full"
+    ) -> None:
+        key = (service, normalize_identifier(identifier), depth)
+        self._cache.set(key, data, ttl=self.ttl_for(service))
+
+    def invalidate(self, service: str, identifier: str, depth: str = "full") -> None:
+        self._cache.delete((service, normalize_identifier(identifier), depth))
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict[str, int]:
+        return self._cache.stats()
+
+
+# Outcomes a connector can report when a lookup produced nothing usable
+NOT_FOUND = "not_found"
+LOGIN_WALL = "login_wall"
+AUTH_WALL = "auth_wall"
+TIMEOUT = "timeout"
+
+
+class NegativeCache:
+    """Remembers lookups that came back empty so we stop re-scraping them.
+
+    Each outcome has its own base TTL. Repeated failures for the same key
+    double the TTL up to ``negative_cache_max_ttl``, so a handle that is
+    always behind a login wall backs off further each time.
+    """
+
+    def __init__(self, maxsize: int | None = None) -> None:
+        maxsize = maxsize or settings.negative_cache_max_entries
+        self._entries = TTLCache(maxsize=maxsize, default_ttl=settings.negative_cache_max_ttl)
+        # Strike counts outlive the entries themselves so backoff can grow
+        self._strikes = TTLCache(maxsize=maxsize, default_ttl=settings.negative_cache_strike_ttl)
+        self.recorded: dict[str, int] = {}
+        self.skipped: dict[str, int] = {}
+
+    @staticmethod
+    def _key(service: str, identifier: str) -> tuple[str, str]:
+        return service, normalize_identifier(identifier)
+
+    def check(self, service: str, identifier: str) -> str | None:
+        """Return the cached outcome for a lookup, counting it as a saved fetch."""
+        outcome = self._entries.get(self._key(service, identifier))
+        if outcome is not None:
+            self.skipped[outcome] = self.skipped.get(outcome, 0) + 1
+        return outcome
+
+    def record(self, service: str, identifier: str, outcome: str) -> float:
+        key = self._key(service, identifier)
+        strikes = (self._strikes.get(key) or 0) + 1
+        self._strikes.set(key, strikes)
+
+        base = settings.negative_cache_ttls.get(outcome, settings.negative_cache_default_ttl)
+        ttl = min(base * 2 ** (strikes - 1), settings.negative_cache_max_ttl)
+        self._entries.set(key, outcome, ttl=ttl)
+        self.recorded[outcome] = self.recorded.get(outcome, 0) + 1
+        return ttl
+
+    def peek(self, service: str, identifier: str) -> str | None:
+        """Like :meth:`check` but without touching the counters."""
+        return self._entries.peek(self._key(service, identifier))
+
+    def contains(self, service: str, identifier: str) -> bool:
+        return self.peek(service, identifier) is not None
+
+    def invalidate(self, service: str, identifier: str) -> None:
+        key = self._key(service, identifier)
+        self._entries.delete(key)
+        self._strikes.delete(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._strikes.clear()
+        self.recorded.clear()
+        self.skipped.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "size": len(self._entries),
+            "recorded": dict(self.recorded),
+            "skipped": dict(self.skipped),
+        }
+
+
+connector_cache = ConnectorCache()
+negative_cache = NegativeCache()
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from app.config import settings
+
+if TYPE_CHECKING:
+    from starlette.requests import Request
+
+T = TypeVar("T")
+
+# Absolute loop time by which the current request must finish; tasks the
+# request spawns (gathered connectors, graph nodes) inherit it
+_deadline: ContextVar[float | None] = ContextVar("request_deadline", default=None)
+
+
+class DeadlineExceeded(TimeoutError):
+    """The request ran out of its overall time budget."""
+
+
+class ClientDisconnected(Exception):
+    """The client went away before the response was ready."""
+
+
+def remaining() -> float | None:
+    """Seconds left before the current deadline, or None if there is none."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return max(0.0, deadline - asyncio.get_running_loop().time())
+
+
+def budget(default: float) -> float:
+    """``default`` clipped to what is left of the current deadline."""
+    left = remaining()
+    return default if left is None else min(default, left)
+
+
+def budget_ms(default_ms: float) -> float:
+    """:func:`budget` for Playwright-style millisecond timeouts (never 0, which means none)."""
+    return max(1.0, budget(default_ms / 1000) * 1000)
+
+
+def detached(fn: Callable[[], Awaitable[T]]) -> asyncio.Task[T]:
+    """Start ``fn()`` as a task that does not inherit the caller's deadline.
+
+    For work shared between requests (single-flight fetches): it must not be
+    clipped to whichever request happened to start it.
+    """
+    ctx = contextvars.copy_context()
+    ctx.run(_deadline.set, None)
+
+    async def call() -> T:
+        return await fn()
+
+    return asyncio.get_running_loop().create_task(call(), context=ctx)
+
+
+@asynccontextmanager
+async def request_deadline(seconds: float | None = None) -> AsyncIterator[None]:
+    """Run the block under a deadline ``seconds`` from now (or the outer one, if sooner).
+
+    Work still running when it expires is cancelled and
+    :class:`DeadlineExceeded` is raised.
+    """
+    loop = asyncio.get_running_loop()
+    when = loop.time() + (settings.request_deadline if seconds is None else seconds)
+    outer = _deadline.get()
+    if outer is not None:
+        when = min(when, outer)
+    token = _deadline.set(when)
+    try:
+        async with asyncio.timeout_at(when):
+            yield
+    except TimeoutError as exc:
+        if loop.time() >= when:
+            raise DeadlineExceeded("request deadline exceeded") from exc
+        raise
+    finally:
+        _deadline.reset(token)
+
+
+async def _wait_for_disconnect(request: Request) -> None:
+    # The body has been read already, so the next ASGI message is the
+    # disconnect (same approach as Starlette's streaming responses)
+    while True:
+        message = await request.receive()
+        if message["type"] == "http.disconnect":
+            return
+
+
+async def run_request(
+    request: Request, work: Coroutine[Any, Any, T], *, seconds: float | None = None
+) -> T:
+    """Run an endpoint's work under the request deadline, tied to the client.
+
+    Like a task group: the work and a disconnect watcher run side by side,
+    and whichever finishes first cancels (and waits for) the other. A
+    disconnect raises :class:`ClientDisconnected`; running out of time
+    raises :class:`DeadlineExceeded`; work cancelled by anything else
+    raises ``RuntimeError``.
+    """
+    async with request_deadline(seconds):
+        task = asyncio.ensure_future(work)
+        watcher = asyncio.ensure_future(_wait_for_disconnect(request))
+        try:
+            done, _ = await asyncio.wait({task, watcher}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for child in (task, watcher):
+                child.cancel()
+            await asyncio.gather(task, watcher, return_exceptions=True)
+        if not task.cancelled():
+            return task.result()
+        if watcher in done:
+            watcher.result()  # surfaces a failing watcher instead of hiding it
+            raise ClientDisconnected()
+        # Cancelled from inside (e.g. a shared task it awaited); a stray
+        # CancelledError here would look like this request being cancelled
+        raise RuntimeError("request work was cancelled")
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Any
+
+import httpx
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class HTTPClientRegistry:
+    """Process-wide pool of keep-alive ``httpx.AsyncClient`` instances.
+
+    One client is kept per upstream host (keyed by a short name such as
+    ``"github"``), so repeated ingests reuse warm TCP/TLS connections instead
+    of paying a fresh handshake on every call. Clients are created lazily and
+    closed from the FastAPI lifespan via :meth:`aclose`.
+    """
+
+    def __init__(self) -> None:
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def get(self, name: str, **client_kwargs: Any) -> httpx.AsyncClient:
+        """Return the shared client for ``name``, creating it on first use.
+
+        ``client_kwargs`` (``base_url``, ``headers``, ...) only apply when the
+        client is created; later callers get the existing instance.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Connection pools are bound to the loop that opened them
+            self._loop = loop
+            self._clients = {}
+        client = self._clients.get(name)
+        if client is None or client.is_closed:
+            client = self._build_client(**client_kwargs)
+            self._clients[name] = client
+        return client
+
+    async def aclose(self) -> None:
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            await client.aclose()
+
+    @staticmethod
+    def _build_client(**client_kwargs: Any) -> httpx.AsyncClient:
+        limits = httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry,
+        )
+        client_kwargs.setdefault("timeout", settings.http_timeout)
+        return httpx.AsyncClient(limits=limits, http2=_http2_enabled(), **client_kwargs)
+
+
+def no_cookies() -> CookieJar:
+    """A cookie jar that refuses every cookie.
+
+    For shared clients that scrape on behalf of many users: a session cookie
+    set while fetching one profile must not ride along on the next.
+    """
+    return CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+
+
+def _http2_enabled() -> bool:
+    if not settings.http_http2:
+        return False
+    # httpx only speaks HTTP/2 when the optional ``h2`` package is installed
+    if importlib.util.find_spec("h2") is None:
+        logger.warning("http_http2 is enabled but the 'h2' package is missing; using HTTP/1.1")
+        return False
+    return True
+
+
+http_clients = HTTPClientRegistry()
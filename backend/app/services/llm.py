@@ -1,11 +1,27 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import logging
+from typing import Any
 
-from langchain_google_genai import ChatGoogleGenerativeAI
+import httpx
+from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.runnables import RunnableConfig
+from langchain_google_genai import ChatGoogleGenerativeAI
 
 from app.config import settings
+from app.services import deadline
+from app.services.llm_cache import (
+    CrossrefCache,
+    DossierCache,
+    crossref_cache,
+    dossier_cache,
+    stable_hash,
+)
+
+logger = logging.getLogger(__name__)
 
 CROSSREF_SYSTEM_PROMPT = """\
 You are a compatibility analyst. Given two personality dossiers for {name_a} and {name_b} (each with public and private tiers), \
@@ -117,6 +133,23 @@ Return ONLY valid JSON with these exact keys:
 
 Do NOT wrap the JSON in markdown code fences. Return raw JSON only."""
 
+DUAL_COACHING_SYSTEM_PROMPT = """\
+You are an expert dating coach and conversational strategist. Given two user profiles ("user_a" and "user_b"), \
+their cross-reference analysis, and a selected venue/activity, generate a personalized briefing for EACH of the two users.
+
+"coaching_a" helps user_a navigate the interaction with user_b; "coaching_b" helps user_b navigate it with user_a. \
+Write each briefing from its own user's perspective — do not copy one into the other.
+
+Return ONLY valid JSON with exactly two keys, "coaching_a" and "coaching_b". Each value is an object with these exact keys:
+
+"match_intel": 2-3 sentences on why this match has potential (or what the main challenge is).
+"conversation_playbook": list of 3 specific, open-ended questions or topics to bring up, based on shared interests.
+"minefield_map": list of 2 topics or sensitivities to be careful about (based on tension points or private traits).
+"venue_cheat_sheet": 1-2 sentences on why the suggested venue contributes to the vibe.
+"vibe_calibration": A tip on the energy to bring (e.g. "High energy", "Chill and observant").
+
+Do NOT wrap the JSON in markdown code fences. Return raw JSON only."""
+
 
 def _empty_crossref() -> dict:
     return {
@@ -145,14 +178,53 @@ def _empty_dossier() -> dict:
 
 
 class LLMService:
-    def __init__(self) -> None:
-        self._llm = ChatGoogleGenerativeAI(
-            model="gemini-2.0-flash",
+    def __init__(
+        self,
+        llm: BaseChatModel | None = None,
+        dossier_cache: DossierCache | None = None,
+        crossref_cache: CrossrefCache | None = None,
+    ) -> None:
+        self.dossier_cache = dossier_cache
+        self.crossref_cache = crossref_cache
+        self._llm = llm or ChatGoogleGenerativeAI(
+            model=settings.llm_model,
             google_api_key=settings.gemini_api_key,
             temperature=0.7,
+            # Passed through to the SDK's httpx clients so calls share one pool
+            client_args={
+                "limits": httpx.Limits(
+                    max_connections=settings.llm_max_connections,
+                    max_keepalive_connections=settings.llm_max_connections,
+                ),
+            },
         )
 
-    async def profile_analysis(self, raw_data: dict, name: str = "") -> dict:
+    async def warm_up(self) -> None:
+        """Open a pooled connection to the model API before the first request.
+
+        Bounded by ``llm_timeout`` so an unreachable API cannot hold up startup.
+        """
+        try:
+            async with asyncio.timeout(settings.llm_timeout):
+                await self._llm.async_client.models.get(model=self._llm.model)
+        except Exception:
+            logger.warning("LLM warm-up failed", exc_info=True)
+
+    async def aclose(self) -> None:
+        close = getattr(self._llm, "aclose", None)
+        if close is not None:
+            await close()
+
+    async def _invoke(self, messages: list) -> Any:
+        """Call the model, capped by ``llm_timeout`` and the request deadline."""
+        async with asyncio.timeout(deadline.budget(settings.llm_timeout)):
+            return await self._llm.ainvoke(messages)
+
+    @property
+    def model_name(self) -> str:
+        return getattr(self._llm, "model", None) or settings.llm_model
+
+    async def profile_analysis(self, raw_data: dict, name: str = "", *, refresh: bool = False) -> dict:
         filtered = {k: v for k, v in raw_data.items() if v}
         if not filtered:
             return _empty_dossier()
@@ -161,7 +233,16 @@ class LLMService:
         human_content = json.dumps(filtered, indent=2, default=str)
         prompt = PROFILE_SYSTEM_PROMPT.format(name=name or "this person")
 
-        response = await self._llm.ainvoke([
+        cache = self.dossier_cache
+        cache_key = None
+        if cache is not None:
+            cache_key = cache.key_for(filtered, prompt, self.model_name, name)
+            if not refresh:
+                cached = await cache.get(cache_key)
+                if cached is not None:
+                    return cached
+
+        response = await self._invoke([
             SystemMessage(content=prompt),
             HumanMessage(content=human_content),
         ])
@@ -172,6 +253,8 @@ class LLMService:
 
         dossier = json.loads(text)
         dossier["data_sources"] = data_sources
+        if cache_key is not None:
+            await cache.set(cache_key, dossier)
         return dossier
 
     async def cross_reference(self, dossier_a: dict, dossier_b: dict, name_a: str = "", name_b: str = "") -> tuple[dict, bool]:
@@ -180,17 +263,26 @@ class LLMService:
         if not has_a or not has_b:
             return _empty_crossref(), False
 
+        label_a = name_a or "Person A"
+        label_b = name_b or "Person B"
+
+        cache = self.crossref_cache
+        cache_key = hash_a = None
+        if cache is not None:
+            hash_a, hash_b = stable_hash(dossier_a), stable_hash(dossier_b)
+            cache_key = cache.key_for(hash_a, hash_b, CROSSREF_SYSTEM_PROMPT, self.model_name)
+            cached = await cache.get(cache_key, hash_a, label_a, label_b)
+            if cached is not None:
+                return cached
+
         human_content = json.dumps(
             {name_a or "person_a": dossier_a, name_b or "person_b": dossier_b},
             indent=2,
             default=str,
         )
-        prompt = CROSSREF_SYSTEM_PROMPT.format(
-            name_a=name_a or "Person A",
-            name_b=name_b or "Person B",
-        )
+        prompt = CROSSREF_SYSTEM_PROMPT.format(name_a=label_a, name_b=label_b)
 
-        response = await self._llm.ainvoke([
+        response = await self._invoke([
             SystemMessage(content=prompt),
             HumanMessage(content=human_content),
         ])
@@ -201,12 +293,14 @@ class LLMService:
 
         result = json.loads(text)
         venue_appropriate = result.pop("venue_appropriate", False)
+        if cache_key is not None:
+            await cache.set(cache_key, hash_a, label_a, label_b, result, venue_appropriate)
         return result, venue_appropriate
 
     async def brainstorm_venue_queries(self, context: dict) -> list[dict]:
         human_content = json.dumps(context, indent=2, default=str)
 
-        response = await self._llm.ainvoke([
+        response = await self._invoke([
             SystemMessage(content=VENUE_SYSTEM_PROMPT),
             HumanMessage(content=f"BRAINSTORM MODE: Suggest queries based on this analysis:\n{human_content}"),
         ])
@@ -228,7 +322,7 @@ class LLMService:
         }
         human_content = json.dumps(data, indent=2, default=str)
 
-        response = await self._llm.ainvoke([
+        response = await self._invoke([
             SystemMessage(content=VENUE_SYSTEM_PROMPT),
             HumanMessage(content=f"RANK MODE: Select the best 3 venues from these candidates:\n{human_content}"),
         ])
@@ -252,7 +346,7 @@ class LLMService:
         }
         human_content = json.dumps(data, indent=2, default=str)
 
-        response = await self._llm.ainvoke([
+        response = await self._invoke([
             SystemMessage(content=COACHING_SYSTEM_PROMPT),
             HumanMessage(content=f"Generate coaching briefing for the target user:\n{human_content}"),
         ])
@@ -266,6 +360,33 @@ class LLMService:
         except json.JSONDecodeError:
             return {}
 
+    async def generate_dual_coaching(
+        self, user_a: dict, user_b: dict, cross_ref: dict, venue: dict | None
+    ) -> tuple[dict, dict]:
+        """Both users' briefings from one LLM call (shared context sent once)."""
+        data = {
+            "user_a_profile": user_a,
+            "user_b_profile": user_b,
+            "cross_reference": cross_ref,
+            "selected_venue": venue,
+        }
+        human_content = json.dumps(data, indent=2, default=str)
+
+        response = await self._invoke([
+            SystemMessage(content=DUAL_COACHING_SYSTEM_PROMPT),
+            HumanMessage(content=f"Generate coaching briefings for both users:\n{human_content}"),
+        ])
+
+        text = response.content.strip()
+        if text.startswith("```"):
+            text = text.split("\n", 1)[1].rsplit("```", 1)[0].strip()
+
+        try:
+            result = json.loads(text)
+        except json.JSONDecodeError:
+            return {}, {}
+        return result.get("coaching_a", {}), result.get("coaching_b", {})
+
     async def coach_chat(
         self,
         dossier_a: dict,
@@ -293,8 +414,39 @@ class LLMService:
                 messages.append(AIMessage(content=msg["content"]))
         messages.append(HumanMessage(content=message))
 
-        response = await self._llm.ainvoke(messages)
+        response = await self._invoke(messages)
         return response.content.strip()
 
     async def analyze_image(self, image_url: str) -> dict:
         return {}
+
+
+_shared_service: LLMService | None = None
+
+
+def get_llm_service() -> LLMService:
+    """Return the process-wide LLMService, creating it on first use."""
+    global _shared_service
+    if _shared_service is None:
+        _shared_service = LLMService(
+            dossier_cache=dossier_cache if settings.llm_cache_enabled else None,
+            crossref_cache=crossref_cache if settings.llm_cache_enabled else None,
+        )
+    return _shared_service
+
+
+async def close_llm_service() -> None:
+    global _shared_service
+    service, _shared_service = _shared_service, None
+    if service is not None:
+        await service.aclose()
+
+
+def llm_from_config(config: RunnableConfig | None) -> LLMService:
+    """LLMService injected through the graph config, else the shared one.
+
+    Nodes must annotate ``config`` as ``Optional[RunnableConfig]``; LangGraph
+    silently skips injection for the ``RunnableConfig | None`` spelling.
+    """
+    configurable = (config or {}).get("configurable", {})
+    return configurable.get("llm") or get_llm_service()
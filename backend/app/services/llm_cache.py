@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from typing import Any
+
+from app.config import settings
+from app.services.store import SQLiteStore, shared_store
+
+
+def stable_hash(*parts: Any) -> str:
+    """SHA-256 over a canonical JSON encoding of ``parts``."""
+    payload = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class DossierCache:
+    """Persistent profile_analysis results keyed by what went into the prompt.
+
+    The key covers the filtered raw data, the system prompt text (so editing
+    the prompt acts as a version bump), the model name and the display name.
+    """
+
+    namespace = "dossier"
+
+    def __init__(self, store: SQLiteStore | None = None) -> None:
+        self.store = store or shared_store
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key_for(filtered: dict, prompt: str, model: str, name: str = "") -> str:
+        return stable_hash(filtered, prompt, model, name)
+
+    async def get(self, key: str) -> dict | None:
+        dossier = await self.store.get(self.namespace, key)
+        if dossier is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return dossier
+
+    async def set(self, key: str, dossier: dict) -> None:
+        await self.store.set(
+            self.namespace,
+            key,
+            dossier,
+            ttl=settings.dossier_cache_ttl,
+            max_entries=settings.llm_cache_max_entries,
+        )
+
+    async def invalidate(self, key: str) -> None:
+        await self.store.delete(self.namespace, key)
+
+    async def clear(self) -> None:
+        await self.store.clear(self.namespace)
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+
+class CrossrefCache:
+    """Persistent cross_reference results keyed by the unordered dossier pair.
+
+    ``cross_reference(a, b)`` and ``cross_reference(b, a)`` share one entry.
+    The entry remembers which dossier was "A" and the labels the model was
+    given, so a hit in either direction is re-labelled to the caller's names.
+    """
+
+    namespace = "crossref"
+
+    def __init__(self, store: SQLiteStore | None = None) -> None:
+        self.store = store or shared_store
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key_for(hash_a: str, hash_b: str, prompt: str, model: str) -> str:
+        return stable_hash(sorted((hash_a, hash_b)), prompt, model)
+
+    async def get(
+        self, key: str, hash_a: str, label_a: str, label_b: str
+    ) -> tuple[dict, bool] | None:
+        entry = await self.store.get(self.namespace, key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+
+        if entry["first"] == hash_a:
+            mapping = {entry["label_a"]: label_a, entry["label_b"]: label_b}
+        else:
+            mapping = {entry["label_a"]: label_b, entry["label_b"]: label_a}
+        return relabel(entry["result"], mapping), entry["venue_appropriate"]
+
+    async def set(
+        self,
+        key: str,
+        hash_a: str,
+        label_a: str,
+        label_b: str,
+        result: dict,
+        venue_appropriate: bool,
+    ) -> None:
+        entry = {
+            "first": hash_a,
+            "label_a": label_a,
+            "label_b": label_b,
+            "result": result,
+            "venue_appropriate": venue_appropriate,
+        }
+        await self.store.set(
+            self.namespace,
+            key,
+            entry,
+            ttl=settings.crossref_cache_ttl,
+            max_entries=settings.llm_cache_max_entries,
+        )
+
+    async def clear(self) -> None:
+        await self.store.clear(self.namespace)
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+
+def relabel(value: Any, mapping: dict[str, str]) -> Any:
+    """Swap person labels in every string of ``value`` (simultaneously)."""
+    mapping = {old: new for old, new in mapping.items() if old and old != new}
+    if not mapping:
+        return value
+    pattern = re.compile(
+        r"(?<!\w)(" + "|".join(re.escape(k) for k in sorted(mapping, key=len, reverse=True)) + r")(?!\w)"
+    )
+
+    def walk(v: Any) -> Any:
+        if isinstance(v, str):
+            return pattern.sub(lambda m: mapping[m.group(1)], v)
+        if isinstance(v, list):
+            return [walk(x) for x in v]
+        if isinstance(v, dict):
+            return {k: walk(x) for k, x in v.items()}
+        return v
+
+    return walk(value)
+
+
+dossier_cache = DossierCache()
+crossref_cache = CrossrefCache()
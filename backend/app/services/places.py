@@ -1,10 +1,16 @@
 import httpx
 from app.config import settings
+from app.services.http import http_clients
 
 class PlacesService:
-    def __init__(self):
+    def __init__(self, client: httpx.AsyncClient | None = None):
         self.api_key = settings.google_maps_api_key
         self.base_url = "https://places.googleapis.com/v1/places:searchText"
+        self._client = client
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return self._client or http_clients.get("places")
 
     async def search_venue(self, query: str, location: str | None = None) -> list[dict]:
         """
@@ -18,31 +24,31 @@ class PlacesService:
         headers = {
             "Content-Type": "application/json",
             "X-Goog-Api-Key": self.api_key,
-            "X-Goog-FieldMask": "places.displayName,places.formattedAddress,places.rating,places.priceLevel,places.types,places.regularOpeningHours"
+            "X-Goog-FieldMask": "places.id,places.displayName,places.formattedAddress,places.rating,places.priceLevel,places.types,places.regularOpeningHours"
         }
         
         data = {
             "textQuery": f"{query} in {location}" if location else query
         }
 
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(self.base_url, json=data, headers=headers)
-            
-            if resp.status_code != 200:
-                print(f"Error calling Places API: {resp.text}")
-                return []
-            
-            results = resp.json().get("places", [])
-            
-            # Map to something the VenueRecommendation schema likes
-            formatted = []
-            for p in results:
-                formatted.append({
-                    "name": p.get("displayName", {}).get("text", "Unknown Venue"),
-                    "address": p.get("formattedAddress", ""),
-                    "rating": p.get("rating"),
-                    "price_level": p.get("priceLevel"),
-                    "types": p.get("types", []),
-                    "opening_hours": p.get("regularOpeningHours", {}).get("weekdayDescriptions", [])
-                })
-            return formatted
+        resp = await self.client.post(self.base_url, json=data, headers=headers)
+        
+        if resp.status_code != 200:
+            print(f"Error calling Places API: {resp.text}")
+            return []
+        
+        results = resp.json().get("places", [])
+        
+        # Map to something the VenueRecommendation schema likes
+        formatted = []
+        for p in results:
+            formatted.append({
+                "place_id": p.get("id"),
+                "name": p.get("displayName", {}).get("text", "Unknown Venue"),
+                "address": p.get("formattedAddress", ""),
+                "rating": p.get("rating"),
+                "price_level": p.get("priceLevel"),
+                "types": p.get("types", []),
+                "opening_hours": p.get("regularOpeningHours", {}).get("weekdayDescriptions", [])
+            })
+        return formatted
@@ -56,6 +56,9 @@ PREVIEW_GENERATORS: dict[str, callable] = {
 
 
 def generate_preview(service: str, data: dict) -> str:
+    if data.keys() == {"exists"}:
+        # Result of a probe-depth fetch
+        return "Connected" if data["exists"] else "Account not found"
     gen = PREVIEW_GENERATORS.get(service)
     if gen:
         return gen(data)
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitExceeded(Exception):
+    """Every budget for a resource is spent and the reset is too far away."""
+
+    def __init__(self, resource: str, reset_at: float) -> None:
+        self.resource = resource
+        self.reset_at = reset_at
+        super().__init__(f"{resource} rate limit exhausted until {reset_at:.0f}")
+
+    @property
+    def retry_after(self) -> float:
+        return max(0.0, self.reset_at - time.time())
+
+
+@dataclass
+class Budget:
+    """What is left of one credential's quota for one API resource."""
+
+    token: str
+    resource: str
+    label: str
+    remaining: int | None = None
+    limit: int | None = None
+    reset_at: float = 0.0
+    disabled: bool = False
+
+    @property
+    def auth_headers(self) -> dict[str, str]:
+        return {"Authorization": f"bearer {self.token}"} if self.token else {}
+
+    def spendable(self, now: float, reserve: int) -> int:
+        """Requests this budget can still take right now (large if unknown)."""
+        if self.disabled:
+            return 0
+        if self.remaining is None or self.reset_at <= now:
+            return self.limit or 1 << 30
+        return self.remaining - reserve
+
+
+class RateLimitScheduler:
+    """Hands out GitHub credentials by remaining budget.
+
+    Budgets are tracked per (token, resource) from the ``X-RateLimit-*``
+    response headers. :meth:`acquire` picks the budget with the most
+    headroom; when all are below the reserve it waits for the earliest
+    reset if that is within ``max_wait``, otherwise raises
+    :class:`RateLimitExceeded`. The anonymous (per-IP) budget is always in
+    the pool for REST calls; GraphQL requires a token.
+    """
+
+    def __init__(
+        self,
+        tokens: list[str] | None = None,
+        reserve: int | None = None,
+        max_wait: float | None = None,
+    ) -> None:
+        self.reserve = settings.github_ratelimit_reserve if reserve is None else reserve
+        self.max_wait = settings.github_ratelimit_max_wait if max_wait is None else max_wait
+        tokens = list(dict.fromkeys(t for t in (tokens or []) if t))
+        self._budgets: dict[str, list[Budget]] = {
+            "core": [Budget(t, "core", f"token-{i + 1}") for i, t in enumerate(tokens)]
+            + [Budget("", "core", "anonymous")],
+            "graphql": [Budget(t, "graphql", f"token-{i + 1}") for i, t in enumerate(tokens)],
+        }
+        self.waits = 0
+        self.rejected = 0
+        self.limited_responses = 0
+
+    def has_budget(self, resource: str) -> bool:
+        return any(not b.disabled for b in self._budgets.get(resource, []))
+
+    async def acquire(self, resource: str = "core") -> Budget:
+        while True:
+            budgets = [b for b in self._budgets.get(resource, []) if not b.disabled]
+            if not budgets:
+                raise RateLimitExceeded(resource, time.time())
+            now = time.time()
+            best = max(budgets, key=lambda b: b.spendable(now, self.reserve))
+            if best.spendable(now, self.reserve) > 0:
+                if best.remaining is not None and best.reset_at > now:
+                    # Reserve the request now so concurrent callers spread out
+                    best.remaining -= 1
+                return best
+
+            reset_at = min(b.reset_at for b in budgets)
+            delay = reset_at - now
+            if delay > self.max_wait:
+                self.rejected += 1
+                raise RateLimitExceeded(resource, reset_at)
+            self.waits += 1
+            logger.info("GitHub %s budget low; waiting %.1fs for reset", resource, delay)
+            await asyncio.sleep(max(delay, 0.0))
+
+    def update(self, budget: Budget, status_code: int, headers: Mapping[str, str]) -> bool:
+        """Record a response's rate-limit headers; True if it was rate limited."""
+        headers = {k.lower(): v for k, v in headers.items()}
+        remaining = headers.get("x-ratelimit-remaining")
+        if remaining is not None:
+            budget.remaining = int(remaining)
+        if (limit := headers.get("x-ratelimit-limit")) is not None:
+            budget.limit = int(limit)
+        if (reset := headers.get("x-ratelimit-reset")) is not None:
+            budget.reset_at = float(reset)
+
+        limited = status_code == 429 or (
+            status_code == 403 and (remaining == "0" or "retry-after" in headers)
+        )
+        if limited:
+            self.limited_responses += 1
+            budget.remaining = 0
+            if retry_after := headers.get("retry-after"):
+                budget.reset_at = max(budget.reset_at, time.time() + float(retry_after))
+            elif budget.reset_at <= time.time():
+                budget.reset_at = time.time() + 60
+        return limited
+
+    def disable(self, budget: Budget) -> None:
+        """Take a rejected token out of rotation."""
+        if budget.token and not budget.disabled:
+            logger.warning("GitHub %s was rejected; removing it from rotation", budget.label)
+            for b in self._budgets["core"] + self._budgets["graphql"]:
+                if b.token == budget.token:
+                    b.disabled = True
+
+    def stats(self) -> dict:
+        now = time.time()
+        return {
+            "budgets": [
+                {
+                    "label": b.label,
+                    "resource": b.resource,
+                    "remaining": b.remaining,
+                    "limit": b.limit,
+                    "resets_in": max(0, round(b.reset_at - now)) if b.reset_at else None,
+                    "disabled": b.disabled,
+                }
+                for budgets in self._budgets.values()
+                for b in budgets
+            ],
+            "waits": self.waits,
+            "rejected": self.rejected,
+            "limited_responses": self.limited_responses,
+        }
+
+
+github_rate_limits = RateLimitScheduler(settings.github_tokens + [settings.github_token])
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Hashable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from app.config import settings
+from app.connectors.registry import connector_registry
+
+
+@dataclass
+class _ServiceQueue:
+    limit: int
+    active: int = 0
+    # tenant -> its waiters, in the order tenants get their next turn
+    waiting: OrderedDict[Hashable, deque[asyncio.Future[None]]] = field(
+        default_factory=OrderedDict
+    )
+    granted: int = 0
+    waited: int = 0
+    wait_total: float = 0.0
+    wait_max: float = 0.0
+
+    @property
+    def queued(self) -> int:
+        return sum(len(q) for q in self.waiting.values())
+
+
+class FairScheduler:
+    """Per-service concurrency limits with round-robin fairness across tenants.
+
+    Each service runs at most its limit of fetches at once (the registry's
+    ``max_concurrency`` unless ``settings.connector_concurrency`` overrides
+    it). When a service is saturated, callers queue per tenant (one API
+    request) and freed slots go to tenants in turn, so a request with many
+    lookups cannot starve the others.
+    """
+
+    def __init__(self, limits: dict[str, int] | None = None) -> None:
+        self._limits = limits
+        self._queues: dict[str, _ServiceQueue] = {}
+
+    def limit_for(self, service: str) -> int:
+        limits = settings.connector_concurrency if self._limits is None else self._limits
+        if service in limits:
+            return limits[service]
+        spec = connector_registry.spec(service)
+        return spec.max_concurrency if spec else settings.connector_default_concurrency
+
+    @asynccontextmanager
+    async def slot(self, service: str, tenant: Hashable | None = None) -> AsyncIterator[None]:
+        """Hold one of ``service``'s slots for the duration of the block."""
+        queue = self._queue(service)
+        await self._acquire(queue, object() if tenant is None else tenant)
+        try:
+            yield
+        finally:
+            self._release(queue)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            service: {
+                "limit": q.limit,
+                "active": q.active,
+                "queued": q.queued,
+                "granted": q.granted,
+                "waited": q.waited,
+                "avg_wait": round(q.wait_total / q.waited, 3) if q.waited else 0.0,
+                "max_wait": round(q.wait_max, 3),
+            }
+            for service, q in self._queues.items()
+        }
+
+    def _queue(self, service: str) -> _ServiceQueue:
+        queue = self._queues.get(service)
+        if queue is None:
+            queue = self._queues[service] = _ServiceQueue(limit=max(1, self.limit_for(service)))
+        return queue
+
+    async def _acquire(self, queue: _ServiceQueue, tenant: Hashable) -> None:
+        if queue.active < queue.limit and not queue.waiting:
+            queue.active += 1
+            queue.granted += 1
+            return
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        queue.waiting.setdefault(tenant, deque()).append(waiter)
+        started = time.monotonic()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Granted just as we were cancelled; pass the slot on
+                self._release(queue)
+            else:
+                self._discard(queue, tenant, waiter)
+            raise
+        waited = time.monotonic() - started
+        queue.waited += 1
+        queue.wait_total += waited
+        queue.wait_max = max(queue.wait_max, waited)
+
+    def _release(self, queue: _ServiceQueue) -> None:
+        queue.active -= 1
+        while queue.waiting and queue.active < queue.limit:
+            tenant, waiters = next(iter(queue.waiting.items()))
+            waiter = waiters.popleft()
+            if waiters:
+                # This tenant goes to the back of the line for its next turn
+                queue.waiting.move_to_end(tenant)
+            else:
+                del queue.waiting[tenant]
+            if not waiter.done():
+                queue.active += 1
+                queue.granted += 1
+                waiter.set_result(None)
+
+    @staticmethod
+    def _discard(queue: _ServiceQueue, tenant: Hashable, waiter: asyncio.Future[None]) -> None:
+        waiters = queue.waiting.get(tenant)
+        if waiters is None:
+            return
+        try:
+            waiters.remove(waiter)
+        except ValueError:
+            return
+        if not waiters:
+            del queue.waiting[tenant]
+
+
+ingest_scheduler = FairScheduler()
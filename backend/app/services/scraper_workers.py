@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any
+
+from app.config import settings
+from app.connectors.registry import BROWSER, connector_registry
+from app.services.cache import negative_cache
+
+logger = logging.getLogger(__name__)
+
+
+class ScraperWorkerError(RuntimeError):
+    """A scraper worker process died (crash, OOM kill) mid-job."""
+
+
+# ── worker process side ───────────────────────────────────────────
+
+# One event loop per worker, kept across jobs so the browser pool stays warm
+_worker_loop: asyncio.AbstractEventLoop | None = None
+_worker_max_rss: int = 0
+
+
+def _init_worker(max_rss_mb: int) -> None:
+    global _worker_loop, _worker_max_rss
+    _worker_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_worker_loop)
+    _worker_max_rss = max_rss_mb * 1024 * 1024
+
+
+def _tree_rss_bytes(root: int) -> int:
+    """RSS of ``root`` and all its descendants (Chromium included); 0 off Linux."""
+    proc = Path("/proc")
+    if not proc.is_dir():
+        return 0
+    page = os.sysconf("SC_PAGE_SIZE")
+    parents: dict[int, int] = {}
+    rss: dict[int, int] = {}
+    for entry in proc.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text()
+            pages = int((entry / "statm").read_text().split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+        # Fields after the parenthesised command: state, ppid, ...
+        parents[int(entry.name)] = int(stat.rsplit(")", 1)[1].split()[1])
+        rss[int(entry.name)] = pages * page
+
+    total, frontier = 0, [root]
+    while frontier:
+        pid = frontier.pop()
+        total += rss.get(pid, 0)
+        frontier.extend(child for child, parent in parents.items() if parent == pid)
+    return total
+
+
+def _run_fetch(
+    connector_cls: type,
+    service: str,
+    identifier: str,
+    depth: str,
+    kwargs: dict[str, Any],
+    known_outcome: str | None,
+) -> tuple[dict[str, Any], str | None, bool]:
+    """Run one connector fetch in this worker.
+
+    Returns the data, the negative-cache outcome the fetch left behind (so
+    the API process can remember it) and whether the browsers were dropped
+    for exceeding the memory cap.
+    """
+    from app.services.browser import browser_pool
+
+    if known_outcome is not None and not negative_cache.contains(service, identifier):
+        negative_cache.record(service, identifier, known_outcome)
+    connector = connector_cls()
+    data = _worker_loop.run_until_complete(connector.fetch(identifier, depth=depth, **kwargs))
+    outcome = negative_cache.peek(service, identifier)
+
+    recycled = False
+    if _worker_max_rss and _tree_rss_bytes(os.getpid()) > _worker_max_rss:
+        _worker_loop.run_until_complete(browser_pool.aclose())
+        recycled = True
+    return data, outcome, recycled
+
+
+# ── API process side ──────────────────────────────────────────────
+
+class ScraperWorkerPool:
+    """Dispatch browser-cost connector fetches to worker processes.
+
+    The API process only submits jobs and awaits their results; Chromium
+    lives in the workers. Each worker runs at most ``max_tasks`` jobs before
+    it is replaced, and drops its browsers after any job that leaves its
+    process tree above ``max_rss_mb``. A crashed worker fails the jobs it
+    held with :class:`ScraperWorkerError` and the pool is rebuilt.
+
+    Negative-cache outcomes cross the process boundary in both directions,
+    so login walls seen by a worker are remembered by the API process.
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        max_tasks: int | None = None,
+        max_rss_mb: int | None = None,
+        services: set[str] | None = None,
+    ) -> None:
+        self.workers = settings.scraper_workers if workers is None else workers
+        self.max_tasks = max_tasks or settings.scraper_worker_max_tasks
+        self.max_rss_mb = settings.scraper_worker_max_rss_mb if max_rss_mb is None else max_rss_mb
+        # Defaults to every browser-cost service in the registry
+        self._services = services
+        self._executor: ProcessPoolExecutor | None = None
+        self.dispatched = 0
+        self.crashed = 0
+        self.memory_recycles = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.workers > 0
+
+    def handles(self, service: str) -> bool:
+        if not self.enabled:
+            return False
+        if self._services is None:
+            self._services = {
+                s for s in connector_registry.services()
+                if connector_registry.spec(s).cost == BROWSER
+            }
+        return service in self._services
+
+    def connector(self, service: str, connector_cls: type) -> RemoteConnector:
+        return RemoteConnector(self, service, connector_cls)
+
+    async def run(
+        self,
+        connector_cls: type,
+        service: str,
+        identifier: str,
+        depth: str,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        known = negative_cache.peek(service, identifier)
+        executor = self._ensure_executor()
+        self.dispatched += 1
+        try:
+            data, outcome, recycled = await asyncio.wrap_future(
+                executor.submit(
+                    _run_fetch, connector_cls, service, identifier, depth, kwargs, known
+                )
+            )
+        except BrokenProcessPool as exc:
+            self.crashed += 1
+            self._discard(executor)
+            raise ScraperWorkerError(f"scraper worker died fetching {service}") from exc
+        if outcome is not None and outcome != known:
+            negative_cache.record(service, identifier, outcome)
+        if recycled:
+            self.memory_recycles += 1
+        return data
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "dispatched": self.dispatched,
+            "crashed": self.crashed,
+            "memory_recycles": self.memory_recycles,
+        }
+
+    def _ensure_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                # max_tasks_per_child needs a non-fork start method
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.max_rss_mb,),
+                max_tasks_per_child=self.max_tasks,
+            )
+        return self._executor
+
+    def _discard(self, executor: ProcessPoolExecutor) -> None:
+        if self._executor is executor:
+            self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+class RemoteConnector:
+    """Connector stand-in whose ``fetch`` runs in a scraper worker."""
+
+    def __init__(self, pool: ScraperWorkerPool, service: str, connector_cls: type) -> None:
+        self.pool = pool
+        self.service = service
+        self.connector_cls = connector_cls
+
+    async def fetch(self, identifier: str, depth: str = "full", **kwargs: Any) -> dict[str, Any]:
+        return await self.pool.run(self.connector_cls, self.service, identifier, depth, **kwargs)
+
+
+scraper_workers = ScraperWorkerPool()
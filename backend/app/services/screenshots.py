@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import io
+import logging
+import re
+from pathlib import Path
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    from PIL import Image
+except ImportError:  # environments that predate the Pillow requirement keep PNGs
+    Image = None
+
+_REF_PATTERN = re.compile(r"^[0-9a-f]{32}\.(webp|png)$")
+
+MEDIA_TYPES = {"webp": "image/webp", "png": "image/png"}
+
+
+def compact_image(png: bytes, max_width: int, quality: int) -> tuple[bytes, str]:
+    """Downscale to ``max_width`` and re-encode as WebP; PNG passthrough without Pillow."""
+    if Image is None:
+        return png, "png"
+    try:
+        with Image.open(io.BytesIO(png)) as img:
+            img = img.convert("RGB")
+            if img.width > max_width:
+                img = img.resize((max_width, round(img.height * max_width / img.width)))
+            out = io.BytesIO()
+            img.save(out, format="WEBP", quality=quality)
+            return out.getvalue(), "webp"
+    except Exception:
+        logger.warning("Could not re-encode screenshot; storing original PNG", exc_info=True)
+        return png, "png"
+
+
+class ScreenshotStore:
+    """Content-addressed screenshot files; results carry a short ref instead of bytes."""
+
+    def __init__(self, root: str | None = None) -> None:
+        self.root = Path(root or settings.screenshot_dir)
+
+    async def put(self, png: bytes) -> str:
+        # Decoding, resizing and hashing are CPU work; keep them off the loop
+        return await asyncio.to_thread(self._put, png)
+
+    def path_for(self, ref: str) -> Path | None:
+        """File for ``ref``, or None if the ref is malformed or unknown."""
+        if not _REF_PATTERN.match(ref):
+            return None
+        path = self.root / ref
+        return path if path.is_file() else None
+
+    def _put(self, png: bytes) -> str:
+        data, ext = compact_image(png, settings.screenshot_max_width, settings.screenshot_quality)
+        ref = f"{hashlib.sha256(data).hexdigest()[:32]}.{ext}"
+        path = self.root / ref
+        if not path.exists():
+            self.root.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_bytes(data)
+            tmp.replace(path)
+        return ref
+
+
+screenshot_store = ScreenshotStore()
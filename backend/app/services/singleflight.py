@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+from app.services import deadline
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Collapse concurrent calls for the same key into one shared task.
+
+    Every caller awaits the same task and receives its result or exception.
+    Callers are shielded from each other: cancelling one waiter does not
+    cancel the underlying work for the rest. Once the last waiter has gone
+    (client disconnect, expired deadline) the shared task is cancelled too,
+    so abandoned work stops holding browsers and API quota. The shared task
+    runs without a request deadline; each waiter is still bounded by its own.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[Hashable, asyncio.Task[Any]] = {}
+        self._waiters: dict[Hashable, int] = {}
+        self.started = 0
+        self.joined = 0
+        self.abandoned = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._inflight.get(key)
+        if task is None or task.done():
+            task = deadline.detached(fn)
+            self._inflight[key] = task
+            self._waiters[key] = 0
+            task.add_done_callback(lambda t: self._forget(key, t))
+            self.started += 1
+        else:
+            self.joined += 1
+        self._waiters[key] += 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            if self._inflight.get(key) is task:
+                self._waiters[key] -= 1
+                if self._waiters[key] == 0 and not task.done():
+                    # Drop the entry first so a caller arriving before the
+                    # cancellation lands starts fresh instead of joining it
+                    self.abandoned += 1
+                    self._drop(key)
+                    task.cancel()
+
+    def _drop(self, key: Hashable) -> None:
+        del self._inflight[key]
+        del self._waiters[key]
+
+    def _forget(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        if self._inflight.get(key) is task:
+            self._drop(key)
+        # Mark the exception as retrieved even if every waiter went away
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "in_flight": len(self._inflight),
+            "started": self.started,
+            "joined": self.joined,
+            "abandoned": self.abandoned,
+        }
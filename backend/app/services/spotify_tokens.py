@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import hashlib
+import hmac
+import secrets
+import time
+
+import httpx
+
+from app.config import settings
+from app.services.cache import normalize_identifier
+from app.services.http import http_clients
+from app.services.singleflight import SingleFlight
+from app.services.store import SQLiteStore, shared_store
+
+TOKEN_URL = "https://accounts.spotify.com/api/token"
+ME_URL = "https://api.spotify.com/v1/me"
+
+# Refresh this many seconds before the access token actually expires
+_EXPIRY_SKEW = 60
+
+
+class SpotifyTokenVault:
+    """Server-side Spotify OAuth tokens per user, refreshed on demand.
+
+    Tokens live in the shared SQLite store (namespace ``spotify_tokens``)
+    keyed by the normalized Spotify username used as the connector
+    identifier. Concurrent refreshes for one user share a single request.
+
+    Each authorization also issues a random grant. Only its hash is stored.
+    The caller must present the grant (see :meth:`check_grant`) before
+    anything derived from the account is served.
+    """
+
+    namespace = "spotify_tokens"
+
+    def __init__(
+        self,
+        store: SQLiteStore | None = None,
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
+        self.store = store or shared_store
+        self._client = client
+        self._refreshes = SingleFlight()
+        self.refreshed = 0
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return self._client or http_clients.get("spotify_accounts")
+
+    async def save(
+        self,
+        username: str,
+        access_token: str,
+        refresh_token: str,
+        expires_in: float,
+        *,
+        grant_hash: str | None = None,
+    ) -> None:
+        await self.store.set(
+            self.namespace,
+            normalize_identifier(username),
+            {
+                "access_token": access_token,
+                "refresh_token": refresh_token,
+                "expires_at": time.time() + expires_in,
+                "grant_hash": grant_hash,
+            },
+        )
+
+    async def exchange_code(self, username: str, code: str, redirect_uri: str) -> str:
+        """Finish the authorization-code flow, store the user's tokens and
+        return the grant that unlocks them.
+
+        The tokens are only stored if they belong to ``username``'s Spotify
+        account, so nobody can attach their account to another identifier.
+        Authorizing again replaces the previous grant.
+        """
+        payload = await self._token_request(
+            {"grant_type": "authorization_code", "code": code, "redirect_uri": redirect_uri},
+            rejected="Spotify rejected the authorization code",
+        )
+        account_id = await self._account_id(payload["access_token"])
+        if normalize_identifier(account_id) != normalize_identifier(username):
+            raise PermissionError("Spotify account does not match this username")
+        grant = secrets.token_urlsafe(32)
+        await self.save(
+            account_id,
+            payload["access_token"],
+            payload["refresh_token"],
+            payload["expires_in"],
+            grant_hash=_hash_grant(grant),
+        )
+        return grant
+
+    async def check_grant(self, username: str, grant: str | None) -> None:
+        """Raise PermissionError unless ``grant`` unlocks ``username``'s tokens."""
+        entry = await self.store.get(self.namespace, normalize_identifier(username))
+        if entry is None:
+            raise PermissionError(f"No Spotify authorization stored for {username}")
+        stored = entry.get("grant_hash")
+        if not grant or not stored or not hmac.compare_digest(stored, _hash_grant(grant)):
+            raise PermissionError("Spotify was authorized from a different session")
+
+    async def access_token(self, username: str, *, force_refresh: bool = False) -> str | None:
+        """A usable access token for ``username``, or None if none is stored."""
+        key = normalize_identifier(username)
+        entry = await self.store.get(self.namespace, key)
+        if entry is None:
+            return None
+        if not force_refresh and entry["expires_at"] - _EXPIRY_SKEW > time.time():
+            return entry["access_token"]
+        return await self._refreshes.do(key, lambda: self._refresh(key, entry))
+
+    async def delete(self, username: str) -> None:
+        await self.store.delete(self.namespace, normalize_identifier(username))
+
+    def stats(self) -> dict[str, int]:
+        return {"refreshed": self.refreshed}
+
+    async def _refresh(self, key: str, entry: dict) -> str:
+        payload = await self._token_request(
+            {"grant_type": "refresh_token", "refresh_token": entry["refresh_token"]},
+            rejected="Spotify refresh token expired or revoked",
+        )
+        self.refreshed += 1
+        # Spotify only sometimes rotates the refresh token
+        await self.save(
+            key,
+            payload["access_token"],
+            payload.get("refresh_token") or entry["refresh_token"],
+            payload["expires_in"],
+            grant_hash=entry.get("grant_hash"),
+        )
+        return payload["access_token"]
+
+    async def _account_id(self, access_token: str) -> str:
+        resp = await self.client.get(
+            ME_URL, headers={"Authorization": f"Bearer {access_token}"}
+        )
+        if resp.status_code in (401, 403):
+            raise PermissionError("Spotify rejected the new access token")
+        resp.raise_for_status()
+        return resp.json()["id"]
+
+    async def _token_request(self, data: dict[str, str], *, rejected: str) -> dict:
+        if not settings.spotify_client_id or not settings.spotify_client_secret:
+            raise PermissionError("Spotify client credentials are not configured")
+        resp = await self.client.post(
+            TOKEN_URL,
+            data=data,
+            auth=(settings.spotify_client_id, settings.spotify_client_secret),
+        )
+        if resp.status_code in (400, 401):
+            raise PermissionError(rejected)
+        resp.raise_for_status()
+        return resp.json()
+
+
+def _hash_grant(grant: str) -> str:
+    return hashlib.sha256(grant.encode()).hexdigest()
+
+
+spotify_tokens = SpotifyTokenVault()
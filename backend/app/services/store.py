@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from app.config import settings
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS kv (
+    namespace   TEXT NOT NULL,
+    key         TEXT NOT NULL,
+    value       TEXT NOT NULL,
+    expires_at  REAL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+)
+"""
+
+
+class SQLiteStore:
+    """Small persistent key/value store for JSON values, split by namespace.
+
+    Backs the caches that must survive restarts (dossiers, crossrefs, HTTP
+    validators). Calls run in a worker thread so the event loop never blocks
+    on disk I/O.
+    """
+
+    def __init__(self, path: str | None = None) -> None:
+        self.path = path or settings.cache_db_path
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    async def get(self, namespace: str, key: str) -> Any | None:
+        return await asyncio.to_thread(self._get, namespace, key)
+
+    async def set(
+        self,
+        namespace: str,
+        key: str,
+        value: Any,
+        ttl: float | None = None,
+        max_entries: int | None = None,
+    ) -> None:
+        await asyncio.to_thread(self._set, namespace, key, value, ttl, max_entries)
+
+    async def delete(self, namespace: str, key: str) -> None:
+        await asyncio.to_thread(self._execute, "DELETE FROM kv WHERE namespace = ? AND key = ?", (namespace, key))
+
+    async def clear(self, namespace: str) -> None:
+        await asyncio.to_thread(self._execute, "DELETE FROM kv WHERE namespace = ?", (namespace,))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ── sync internals (run in worker threads) ────────────────────
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.path != ":memory:":
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(_SCHEMA)
+            self._conn.commit()
+        return self._conn
+
+    def _execute(self, sql: str, params: tuple) -> None:
+        with self._lock:
+            conn = self._connection()
+            conn.execute(sql, params)
+            conn.commit()
+
+    def _get(self, namespace: str, key: str) -> Any | None:
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT value, expires_at FROM kv WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                conn.execute("DELETE FROM kv WHERE namespace = ? AND key = ?", (namespace, key))
+                conn.commit()
+                return None
+            conn.execute(
+                "UPDATE kv SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                (now, namespace, key),
+            )
+            conn.commit()
+        return json.loads(value)
+
+    def _set(
+        self,
+        namespace: str,
+        key: str,
+        value: Any,
+        ttl: float | None,
+        max_entries: int | None,
+    ) -> None:
+        now = time.time()
+        expires_at = now + ttl if ttl else None
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO kv (namespace, key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (namespace, key, json.dumps(value, default=str), expires_at, now),
+            )
+            if max_entries is not None:
+                # Least-recently-used entries beyond the cap are dropped
+                conn.execute(
+                    """
+                    DELETE FROM kv WHERE namespace = ? AND key IN (
+                        SELECT key FROM kv WHERE namespace = ?
+                        ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                    )
+                    """,
+                    (namespace, namespace, max_entries),
+                )
+            conn.commit()
+
+
+shared_store = SQLiteStore()
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from typing import Any
+
+import httpx
+
+from app.config import settings
+from app.services.store import SQLiteStore, shared_store
+
+
+class ValidatorStore:
+    """ETag / Last-Modified validators plus the parsed body, keyed by URL.
+
+    Connectors send :meth:`conditional_headers` with their GET and, on a
+    304, reuse the stored body instead of downloading and parsing again.
+    Stored bodies must be JSON-serializable.
+    """
+
+    namespace = "validators"
+
+    def __init__(self, store: SQLiteStore | None = None) -> None:
+        self.store = store or shared_store
+        self.revalidated = 0
+        self.refetched = 0
+
+    @staticmethod
+    def key_for(url: str | httpx.URL, params: dict[str, Any] | None = None) -> str:
+        return str(httpx.URL(url, params=params))
+
+    async def get(self, key: str) -> dict | None:
+        return await self.store.get(self.namespace, key)
+
+    @staticmethod
+    def conditional_headers(entry: dict | None) -> dict[str, str]:
+        if entry is None:
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def reuse(self, entry: dict) -> Any:
+        """Body to use for a 304 response."""
+        self.revalidated += 1
+        return entry["body"]
+
+    async def remember(self, key: str, resp: httpx.Response, body: Any) -> None:
+        """Store a 200 response's validators and parsed body, if it has any."""
+        self.refetched += 1
+        etag = resp.headers.get("etag")
+        last_modified = resp.headers.get("last-modified")
+        if not etag and not last_modified:
+            return
+        await self.store.set(
+            self.namespace,
+            key,
+            {"etag": etag, "last_modified": last_modified, "body": body},
+            ttl=settings.validator_cache_ttl,
+            max_entries=settings.validator_cache_max_entries,
+        )
+
+    async def clear(self) -> None:
+        await self.store.clear(self.namespace)
+
+    def stats(self) -> dict[str, int]:
+        return {"revalidated": self.revalidated, "refetched": self.refetched}
+
+
+validator_store = ValidatorStore()
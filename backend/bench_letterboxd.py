@@ -0,0 +1,54 @@
+"""Compare the streaming Letterboxd parser with feedparser on synthetic feeds.
+
+Usage: python bench_letterboxd.py [items ...]
+"""
+
+import sys
+import timeit
+
+from app.connectors.letterboxd import _parse_with_feedparser, parse_feed
+
+ITEM = """
+    <item>
+      <title>Film {i}, 2024 - ★★★½</title>
+      <link>https://letterboxd.com/someone/film/film-{i}/</link>
+      <guid isPermaLink="false">letterboxd-review-{i}</guid>
+      <pubDate>Mon, 01 Jan 2024 00:00:00 +1300</pubDate>
+      <letterboxd:watchedDate>2024-01-01</letterboxd:watchedDate>
+      <letterboxd:rewatch>No</letterboxd:rewatch>
+      <letterboxd:filmTitle>Film {i}</letterboxd:filmTitle>
+      <letterboxd:filmYear>2024</letterboxd:filmYear>
+      <letterboxd:memberRating>3.5</letterboxd:memberRating>
+      <tmdb:movieId>{i}</tmdb:movieId>
+      <description><![CDATA[<p><img src="https://a.ltrbxd.com/{i}.jpg"/></p><p>Watched on Monday.</p>]]></description>
+      <dc:creator>someone</dc:creator>
+    </item>"""
+
+
+def make_feed(items: int) -> bytes:
+    body = "".join(ITEM.format(i=i) for i in range(items))
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>\n'
+        '<rss version="2.0" xmlns:letterboxd="https://letterboxd.com" '
+        'xmlns:tmdb="https://themoviedb.org" xmlns:dc="http://purl.org/dc/elements/1.1/">'
+        f"<channel><title>Letterboxd - someone</title>{body}</channel></rss>"
+    ).encode("utf-8")
+
+
+def main() -> None:
+    sizes = [int(a) for a in sys.argv[1:]] or [50, 500, 5000]
+    for items in sizes:
+        feed = make_feed(items)
+        assert parse_feed(feed) == _parse_with_feedparser(feed)
+        runs = max(3, 2000 // items)
+        stream = min(timeit.repeat(lambda: parse_feed(feed), number=runs, repeat=3)) / runs
+        legacy = min(timeit.repeat(lambda: _parse_with_feedparser(feed), number=runs, repeat=3)) / runs
+        print(
+            f"{items:>5} items ({len(feed) / 1024:7.0f} KiB): "
+            f"stream {stream * 1000:8.2f} ms  feedparser {legacy * 1000:8.2f} ms  "
+            f"x{legacy / stream:.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.graph.nodes.profile import make_profile_node
+from app.services.cache import connector_cache, negative_cache
+from app.services.screenshots import screenshot_store
+from app.services.spotify_tokens import spotify_tokens
+from app.services.store import SQLiteStore
+from app.services.validators import validator_store
+
+
+@pytest.fixture(autouse=True)
+def _clear_connector_cache():
+    """Process-wide caches must not leak results between tests."""
+    connector_cache.clear()
+    negative_cache.clear()
+    yield
+    connector_cache.clear()
+    negative_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def _isolated_stores(monkeypatch, tmp_path):
+    """Keep validators, OAuth tokens and screenshots out of the on-disk cache."""
+    monkeypatch.setattr(validator_store, "store", SQLiteStore(":memory:"))
+    monkeypatch.setattr(spotify_tokens, "store", SQLiteStore(":memory:"))
+    monkeypatch.setattr(screenshot_store, "root", tmp_path / "screenshots")
+
+
+@pytest.fixture
+def run_profiles():
+    """Run both users' profile nodes on the ``raw_data`` already in ``state``.
+
+    Ingest is stubbed to return each user's ``raw_data``; ``llm`` is injected
+    through the graph config (None uses the shared LLMService).
+    """
+
+    async def run(state, llm=None):
+        config = {"configurable": {"llm": llm}} if llm is not None else None
+        result = {}
+        for user_key in ("user_a", "user_b"):
+            raw_data = state.get(user_key, {}).get("raw_data", {})
+            with patch(
+                "app.graph.nodes.profile._fetch_user_data", AsyncMock(return_value=raw_data)
+            ):
+                result.update(await make_profile_node(user_key)(state, config))
+        return result
+
+    return run
@@ -1,16 +1,15 @@
-"""Tests for the analyze node and LLMService.profile_analysis.
+"""Tests for per-user profile analysis and LLMService.profile_analysis.
 
 Unit tests use mocks (no Gemini calls).
 Integration tests hit real Gemini API (marked with @pytest.mark.integration).
 """
 
 import json
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from app.services.llm import LLMService, _empty_dossier
-from app.graph.nodes.analyze import analyze_node
 
 
 # ── sample data ──────────────────────────────────────────────────
@@ -98,6 +97,8 @@ def _make_llm_service():
     with patch.object(LLMService, "__init__", lambda self: None):
         svc = LLMService()
         svc._llm = AsyncMock()
+        svc.dossier_cache = None
+        svc.crossref_cache = None
     return svc
 
 
@@ -180,39 +181,31 @@ class TestDataFiltering:
         assert set(result["data_sources"]) == {"github", "spotify", "letterboxd"}
 
 
-# ── unit: analyze_node with mocked LLMService ───────────────────
+# ── unit: profile nodes with mocked LLMService ──────────────────
 
-class TestAnalyzeNodeUnit:
-    @pytest.mark.asyncio
-    async def test_both_users_get_dossiers(self):
-        fake_dossier = _empty_dossier()
+def _mock_llm():
+    llm = MagicMock()
+    llm.profile_analysis = AsyncMock(return_value=_empty_dossier())
+    return llm
 
-        with patch("app.graph.nodes.analyze.LLMService") as MockLLM:
-            instance = MockLLM.return_value
-            instance.profile_analysis = AsyncMock(return_value=fake_dossier)
 
-            state = {
-                "user_a": {"username": "alice", "raw_data": {"github": SAMPLE_GITHUB}},
-                "user_b": {"username": "bob", "raw_data": {"spotify": SAMPLE_SPOTIFY}},
-            }
-            result = await analyze_node(state)
+TWO_USERS = {
+    "user_a": {"username": "alice", "raw_data": {"github": SAMPLE_GITHUB}},
+    "user_b": {"username": "bob", "raw_data": {"spotify": SAMPLE_SPOTIFY}},
+}
 
-        assert result["user_a"]["dossier"] == fake_dossier
-        assert result["user_b"]["dossier"] == fake_dossier
 
+class TestProfileNodeUnit:
     @pytest.mark.asyncio
-    async def test_preserves_original_user_data(self):
-        fake_dossier = _empty_dossier()
+    async def test_both_users_get_dossiers(self, run_profiles):
+        result = await run_profiles(TWO_USERS, _mock_llm())
 
-        with patch("app.graph.nodes.analyze.LLMService") as MockLLM:
-            instance = MockLLM.return_value
-            instance.profile_analysis = AsyncMock(return_value=fake_dossier)
+        assert result["user_a"]["dossier"] == _empty_dossier()
+        assert result["user_b"]["dossier"] == _empty_dossier()
 
-            state = {
-                "user_a": {"username": "alice", "raw_data": {"github": SAMPLE_GITHUB}},
-                "user_b": {"username": "bob", "raw_data": {"spotify": SAMPLE_SPOTIFY}},
-            }
-            result = await analyze_node(state)
+    @pytest.mark.asyncio
+    async def test_preserves_original_user_data(self, run_profiles):
+        result = await run_profiles(TWO_USERS, _mock_llm())
 
         assert result["user_a"]["username"] == "alice"
         assert result["user_a"]["raw_data"] == {"github": SAMPLE_GITHUB}
@@ -220,52 +213,31 @@ class TestAnalyzeNodeUnit:
         assert result["user_b"]["raw_data"] == {"spotify": SAMPLE_SPOTIFY}
 
     @pytest.mark.asyncio
-    async def test_calls_profile_analysis_for_each_user(self):
-        fake_dossier = _empty_dossier()
+    async def test_calls_profile_analysis_for_each_user(self, run_profiles):
+        llm = _mock_llm()
+        await run_profiles(TWO_USERS, llm)
 
-        with patch("app.graph.nodes.analyze.LLMService") as MockLLM:
-            instance = MockLLM.return_value
-            instance.profile_analysis = AsyncMock(return_value=fake_dossier)
-
-            state = {
-                "user_a": {"username": "alice", "raw_data": {"github": SAMPLE_GITHUB}},
-                "user_b": {"username": "bob", "raw_data": {"spotify": SAMPLE_SPOTIFY}},
-            }
-            await analyze_node(state)
-
-        assert instance.profile_analysis.call_count == 2
-        instance.profile_analysis.assert_any_call({"github": SAMPLE_GITHUB})
-        instance.profile_analysis.assert_any_call({"spotify": SAMPLE_SPOTIFY})
+        assert llm.profile_analysis.call_count == 2
+        llm.profile_analysis.assert_any_call({"github": SAMPLE_GITHUB})
+        llm.profile_analysis.assert_any_call({"spotify": SAMPLE_SPOTIFY})
 
     @pytest.mark.asyncio
-    async def test_handles_empty_state(self):
-        fake_dossier = _empty_dossier()
-
-        with patch("app.graph.nodes.analyze.LLMService") as MockLLM:
-            instance = MockLLM.return_value
-            instance.profile_analysis = AsyncMock(return_value=fake_dossier)
+    async def test_handles_empty_state(self, run_profiles):
+        result = await run_profiles({}, _mock_llm())
 
-            result = await analyze_node({})
-
-        assert result["user_a"]["dossier"] == fake_dossier
-        assert result["user_b"]["dossier"] == fake_dossier
+        assert result["user_a"]["dossier"] == _empty_dossier()
+        assert result["user_b"]["dossier"] == _empty_dossier()
 
     @pytest.mark.asyncio
-    async def test_handles_missing_raw_data(self):
-        fake_dossier = _empty_dossier()
-
-        with patch("app.graph.nodes.analyze.LLMService") as MockLLM:
-            instance = MockLLM.return_value
-            instance.profile_analysis = AsyncMock(return_value=fake_dossier)
-
-            state = {
-                "user_a": {"username": "alice"},
-                "user_b": {"username": "bob"},
-            }
-            result = await analyze_node(state)
+    async def test_handles_missing_raw_data(self, run_profiles):
+        state = {
+            "user_a": {"username": "alice"},
+            "user_b": {"username": "bob"},
+        }
+        result = await run_profiles(state, _mock_llm())
 
-        assert result["user_a"]["dossier"] == fake_dossier
-        assert result["user_b"]["dossier"] == fake_dossier
+        assert result["user_a"]["dossier"] == _empty_dossier()
+        assert result["user_b"]["dossier"] == _empty_dossier()
 
 
 # ── unit: JSON parsing edge cases ───────────────────────────────
@@ -380,14 +352,14 @@ class TestProfileAnalysisIntegration:
 
 
 @pytest.mark.integration
-class TestAnalyzeNodeIntegration:
+class TestProfileNodeIntegration:
     @pytest.mark.asyncio
-    async def test_full_node_both_users(self):
+    async def test_full_node_both_users(self, run_profiles):
         state = {
             "user_a": {"username": "alice", "raw_data": {"github": SAMPLE_GITHUB, "spotify": SAMPLE_SPOTIFY}},
             "user_b": {"username": "bob", "raw_data": {"github": SAMPLE_GITHUB}},
         }
-        result = await analyze_node(state)
+        result = await run_profiles(state, LLMService())
 
         for user_key in ("user_a", "user_b"):
             _assert_valid_dossier(result[user_key]["dossier"])
@@ -396,7 +368,7 @@ class TestAnalyzeNodeIntegration:
         assert result["user_b"]["username"] == "bob"
 
     @pytest.mark.asyncio
-    async def test_full_node_all_three_sources(self):
+    async def test_full_node_all_three_sources(self, run_profiles):
         state = {
             "user_a": {"username": "alice", "raw_data": {
                 "github": SAMPLE_GITHUB, "spotify": SAMPLE_SPOTIFY, "letterboxd": SAMPLE_LETTERBOXD,
@@ -405,7 +377,7 @@ class TestAnalyzeNodeIntegration:
                 "github": SAMPLE_GITHUB, "letterboxd": SAMPLE_LETTERBOXD,
             }},
         }
-        result = await analyze_node(state)
+        result = await run_profiles(state, LLMService())
 
         _assert_valid_dossier(result["user_a"]["dossier"], {"github", "spotify", "letterboxd"})
         _assert_valid_dossier(result["user_b"]["dossier"], {"github", "letterboxd"})
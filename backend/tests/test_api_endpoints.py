@@ -15,7 +15,9 @@ from app.services.preview import (
     generate_preview,
 )
 from app.services.findings import generate_findings
-from app.graph.nodes.ingest import _fetch_user_data
+from app.graph.nodes.ingest import _fetch_user_data, fetch_service_data
+from app.services.cache import connector_cache
+from app.services.spotify_tokens import _hash_grant, spotify_tokens
 
 
 # ── Fake data ────────────────────────────────────────────────────
@@ -166,7 +168,7 @@ def _make_connector_cls(return_value=None, side_effect=None):
     mock = AsyncMock(return_value=return_value, side_effect=side_effect)
 
     class FakeConnector:
-        async def fetch(self, identifier):
+        async def fetch(self, identifier, depth="full"):
             return await mock(identifier)
 
     return FakeConnector, mock
@@ -180,7 +182,7 @@ class TestIngestNode:
         LBCls, _ = _make_connector_cls(return_value=FAKE_LETTERBOXD_DATA)
 
         mock_map = {"github": GHCls, "letterboxd": LBCls}
-        with patch.dict("app.graph.nodes.ingest.CONNECTOR_MAP", mock_map, clear=True):
+        with patch.dict("app.connectors.registry.connector_registry.classes", mock_map, clear=True):
             result = await _fetch_user_data(identifiers)
 
         assert "github" in result
@@ -192,7 +194,7 @@ class TestIngestNode:
 
         GHCls, _ = _make_connector_cls(return_value=FAKE_GITHUB_DATA)
         mock_map = {"github": GHCls}
-        with patch.dict("app.graph.nodes.ingest.CONNECTOR_MAP", mock_map, clear=True):
+        with patch.dict("app.connectors.registry.connector_registry.classes", mock_map, clear=True):
             result = await _fetch_user_data(identifiers)
 
         assert "github" in result
@@ -203,7 +205,7 @@ class TestIngestNode:
 
         GHCls, _ = _make_connector_cls(side_effect=Exception("API error"))
         mock_map = {"github": GHCls}
-        with patch.dict("app.graph.nodes.ingest.CONNECTOR_MAP", mock_map, clear=True):
+        with patch.dict("app.connectors.registry.connector_registry.classes", mock_map, clear=True):
             result = await _fetch_user_data(identifiers)
 
         assert result == {}
@@ -224,7 +226,7 @@ def async_client():
 class TestConnectEndpoint:
     async def test_connect_github(self, async_client):
         GHCls, _ = _make_connector_cls(return_value=FAKE_GITHUB_DATA)
-        with patch.dict("app.main.CONNECTOR_MAP", {"github": GHCls}):
+        with patch.dict("app.connectors.registry.connector_registry.classes", {"github": GHCls}):
             resp = await async_client.post("/api/connect", json={
                 "service": "github",
                 "username": "testuser",
@@ -235,6 +237,36 @@ class TestConnectEndpoint:
         assert data["success"] is True
         assert "2 repos" in data["preview"]
 
+    async def test_connect_previews_then_warms_full_fetch(self, async_client):
+        depths = []
+
+        class Recording:
+            async def fetch(self, identifier, depth="full"):
+                depths.append(depth)
+                return FAKE_GITHUB_DATA
+
+        with patch.dict("app.connectors.registry.connector_registry.classes", {"github": Recording}):
+            resp = await async_client.post("/api/connect", json={
+                "service": "github",
+                "username": "testuser",
+            })
+
+        assert resp.json()["success"] is True
+        assert depths == ["preview", "full"]
+
+    async def test_connect_probe_missing_account(self, async_client):
+        GHCls, _ = _make_connector_cls(return_value={"exists": False})
+        with patch.dict("app.connectors.registry.connector_registry.classes", {"github": GHCls}):
+            resp = await async_client.post("/api/connect", json={
+                "service": "github",
+                "username": "ghost",
+                "depth": "probe",
+            })
+
+        data = resp.json()
+        assert data["success"] is False
+        assert data["preview"] == "Account not found"
+
     async def test_connect_unknown_service(self, async_client):
         resp = await async_client.post("/api/connect", json={
             "service": "tiktok",
@@ -246,7 +278,7 @@ class TestConnectEndpoint:
 
     async def test_connect_handles_failure(self, async_client):
         GHCls, _ = _make_connector_cls(side_effect=Exception("timeout"))
-        with patch.dict("app.main.CONNECTOR_MAP", {"github": GHCls}):
+        with patch.dict("app.connectors.registry.connector_registry.classes", {"github": GHCls}):
             resp = await async_client.post("/api/connect", json={
                 "service": "github",
                 "username": "testuser",
@@ -257,11 +289,71 @@ class TestConnectEndpoint:
         assert data["success"] is True
         assert "limited" in data["preview"].lower()
 
+    async def test_connect_unauthorized_spotify(self, async_client):
+        SpCls, _ = _make_connector_cls(side_effect=PermissionError("No Spotify authorization"))
+        with patch.dict("app.connectors.registry.connector_registry.classes", {"spotify": SpCls}):
+            resp = await async_client.post("/api/connect", json={
+                "service": "spotify",
+                "username": "testuser",
+            })
+
+        data = resp.json()
+        assert data["success"] is False
+        assert data["preview"] == "Authorize Spotify to connect"
+
+
+class TestSpotifyGrant:
+    @pytest.fixture(autouse=True)
+    async def _authorized(self):
+        await spotify_tokens.save("listener", "access", "refresh", 3600, grant_hash=_hash_grant("g"))
+
+    async def test_cached_data_needs_the_grant(self):
+        connector_cache.set("spotify", "listener", FAKE_SPOTIFY_DATA, "full")
+        SpCls, _ = _make_connector_cls(return_value=FAKE_SPOTIFY_DATA)
+
+        with pytest.raises(PermissionError):
+            await fetch_service_data("spotify", "listener", SpCls, spotify_grant="guess")
+        assert await fetch_service_data("spotify", "listener", SpCls, spotify_grant="g") == FAKE_SPOTIFY_DATA
+
+    async def test_analyze_without_cookie_skips_spotify(self, async_client):
+        SpCls, mock = _make_connector_cls(return_value=FAKE_SPOTIFY_DATA)
+        with patch.dict("app.connectors.registry.connector_registry.classes", {"spotify": SpCls}), \
+             patch("app.main.get_llm_service") as get_llm:
+            get_llm.return_value.profile_analysis = AsyncMock(return_value={})
+            await async_client.post("/api/analyze", json={"identifiers": {"spotify": "listener"}})
+
+        mock.assert_not_awaited()
+        get_llm.return_value.profile_analysis.assert_awaited_once_with({}, refresh=False)
+
+    async def test_connect_with_cookie(self, async_client):
+        SpCls, _ = _make_connector_cls(return_value=FAKE_SPOTIFY_DATA)
+        async_client.cookies.set("spotify_grant", "g")
+        with patch.dict("app.connectors.registry.connector_registry.classes", {"spotify": SpCls}):
+            resp = await async_client.post("/api/connect", json={
+                "service": "spotify",
+                "username": "listener",
+            })
+
+        assert resp.json()["success"] is True
+
+    async def test_authorize_sets_cookie(self, async_client):
+        with patch.object(spotify_tokens, "exchange_code", AsyncMock(return_value="fresh")), \
+             patch("app.main.warm_service_data", AsyncMock()):
+            resp = await async_client.post("/api/spotify/authorize", json={
+                "username": "listener",
+                "code": "c",
+                "redirect_uri": "http://localhost/cb",
+            })
+
+        assert resp.json()["success"] is True
+        assert resp.cookies["spotify_grant"] == "fresh"
+        assert "httponly" in resp.headers["set-cookie"].lower()
+
 
 class TestAnalyzeEndpoint:
     async def test_analyze_user(self, async_client):
         with patch("app.main._fetch_user_data", new_callable=AsyncMock) as mock_fetch, \
-             patch("app.main.LLMService") as MockLLM:
+             patch("app.main.get_llm_service") as MockLLM:
             mock_fetch.return_value = {"github": FAKE_GITHUB_DATA}
             MockLLM.return_value.profile_analysis = AsyncMock(return_value=FAKE_DOSSIER)
 
@@ -277,6 +369,22 @@ class TestAnalyzeEndpoint:
         assert len(data["findings"]) > 0
 
 
+class TestProfileEndpoint:
+    async def test_profile_uses_letterboxd(self, async_client):
+        LBCls, mock = _make_connector_cls(return_value=FAKE_LETTERBOXD_DATA)
+        with patch.dict("app.connectors.registry.connector_registry.classes", {"letterboxd": LBCls}), \
+             patch("app.main.get_llm_service") as MockLLM:
+            MockLLM.return_value.profile_analysis = AsyncMock(return_value=FAKE_DOSSIER)
+
+            resp = await async_client.post("/profile", json={"letterboxd_username": "someone"})
+
+        assert resp.status_code == 200
+        mock.assert_awaited_once_with("someone")
+        MockLLM.return_value.profile_analysis.assert_awaited_once_with(
+            {"letterboxd": FAKE_LETTERBOXD_DATA}
+        )
+
+
 class TestMatchEndpoint:
     async def test_match_users(self, async_client):
         fake_crossref = {
@@ -287,7 +395,7 @@ class TestMatchEndpoint:
         }
 
         with patch("app.main._fetch_user_data", new_callable=AsyncMock) as mock_fetch, \
-             patch("app.main.LLMService") as MockLLM:
+             patch("app.main.get_llm_service") as MockLLM:
             mock_fetch.return_value = {"github": FAKE_GITHUB_DATA}
             MockLLM.return_value.profile_analysis = AsyncMock(return_value=FAKE_DOSSIER)
             MockLLM.return_value.cross_reference = AsyncMock(
@@ -305,3 +413,20 @@ class TestMatchEndpoint:
         assert "cross_ref" in data
         assert "public_profile" in data
         assert "private_profile" in data
+
+    async def test_match_refresh_reaches_dossier_cache(self, async_client):
+        with patch("app.main._fetch_user_data", new_callable=AsyncMock) as mock_fetch, \
+             patch("app.main.get_llm_service") as MockLLM:
+            mock_fetch.return_value = {"github": FAKE_GITHUB_DATA}
+            MockLLM.return_value.profile_analysis = AsyncMock(return_value=FAKE_DOSSIER)
+            MockLLM.return_value.cross_reference = AsyncMock(return_value=({}, False))
+
+            await async_client.post("/api/match", json={
+                "user_a": {"github": "user1"},
+                "user_b": {"github": "user2"},
+                "refresh": True,
+            })
+
+        calls = MockLLM.return_value.profile_analysis.await_args_list
+        assert len(calls) == 2
+        assert all(call.kwargs["refresh"] is True for call in calls)
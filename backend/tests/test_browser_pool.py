@@ -0,0 +1,113 @@
+"""Tests for the pooled Playwright browser manager.
+
+Browsers are faked so these run without Chromium installed.
+"""
+
+import asyncio
+
+import pytest
+
+from app.services.browser import BrowserPool
+
+
+# ── fakes ─────────────────────────────────────────────────────────
+
+class FakeContext:
+    def __init__(self):
+        self.closed = False
+
+    async def new_page(self):
+        return object()
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.connected = True
+        self.closed = False
+        self.contexts: list[FakeContext] = []
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self, **kwargs):
+        ctx = FakeContext()
+        self.contexts.append(ctx)
+        return ctx
+
+    async def close(self):
+        self.closed = True
+        self.connected = False
+
+
+@pytest.fixture
+def pool():
+    pool = BrowserPool(size=1, max_pages=2, max_pages_per_browser=3)
+    pool.launched = []
+
+    async def fake_launch():
+        browser = FakeBrowser()
+        pool.launched.append(browser)
+        return browser
+
+    pool._launch = fake_launch
+    return pool
+
+
+# ── unit: reuse and isolation ─────────────────────────────────────
+
+class TestBrowserReuse:
+    async def test_browser_reused_across_pages(self, pool):
+        for _ in range(2):
+            async with pool.page(user_agent="ua"):
+                pass
+        assert len(pool.launched) == 1
+
+    async def test_fresh_context_per_page_and_closed(self, pool):
+        async with pool.page():
+            pass
+        async with pool.page():
+            pass
+        contexts = pool.launched[0].contexts
+        assert len(contexts) == 2
+        assert all(c.closed for c in contexts)
+
+
+# ── unit: recycling ───────────────────────────────────────────────
+
+class TestBrowserRecycling:
+    async def test_replaced_after_max_pages(self, pool):
+        for _ in range(4):
+            async with pool.page():
+                pass
+        assert len(pool.launched) == 2
+        assert pool.launched[0].closed
+
+    async def test_replaced_after_crash(self, pool):
+        async with pool.page():
+            pass
+        pool.launched[0].connected = False
+        async with pool.page():
+            pass
+        assert len(pool.launched) == 2
+
+
+# ── unit: concurrency cap ─────────────────────────────────────────
+
+class TestPageConcurrency:
+    async def test_concurrent_pages_capped(self, pool):
+        active = 0
+        peak = 0
+
+        async def scrape():
+            nonlocal active, peak
+            async with pool.page():
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*(scrape() for _ in range(6)))
+        assert peak == 2
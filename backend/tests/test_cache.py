@@ -0,0 +1,207 @@
+"""Tests for the TTL cache and the connector result cache."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.graph.nodes.ingest import _fetch_user_data, fetch_service_data
+from app.services import cache as cache_module
+from app.services.cache import (
+    LOGIN_WALL,
+    NOT_FOUND,
+    ConnectorCache,
+    NegativeCache,
+    TTLCache,
+    normalize_identifier,
+)
+
+
+# ── unit: TTLCache ────────────────────────────────────────────────
+
+class TestTTLCache:
+    def test_hit_and_miss_counters(self):
+        cache = TTLCache(maxsize=4, default_ttl=60)
+        assert cache.get("a") is None
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_expired_entry_is_a_miss(self):
+        cache = TTLCache(maxsize=4, default_ttl=60)
+        with patch.object(cache_module.time, "monotonic", return_value=100.0):
+            cache.set("a", 1, ttl=10)
+        with patch.object(cache_module.time, "monotonic", return_value=111.0):
+            assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache(maxsize=2, default_ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.stats()["evictions"] == 1
+
+    def test_zero_ttl_not_stored(self):
+        cache = TTLCache(maxsize=2, default_ttl=60)
+        cache.set("a", 1, ttl=0)
+        assert len(cache) == 0
+
+
+# ── unit: identifier normalization ────────────────────────────────
+
+class TestNormalizeIdentifier:
+    @pytest.mark.parametrize("raw", ["octocat", "@octocat", "  OctoCat ", "@OCTOCAT"])
+    def test_variants_collapse(self, raw):
+        assert normalize_identifier(raw) == "octocat"
+
+    def test_connector_cache_uses_normalized_key(self):
+        cache = ConnectorCache(maxsize=8)
+        cache.set("github", "@OctoCat", {"repos": []})
+        assert cache.get("github", "octocat") == {"repos": []}
+        assert cache.get("letterboxd", "octocat") is None
+
+
+# ── unit: negative cache ──────────────────────────────────────────
+
+class TestNegativeCache:
+    def test_record_then_check_counts_skip(self):
+        cache = NegativeCache(maxsize=8)
+        assert cache.check("github", "ghost") is None
+        cache.record("github", "@Ghost", NOT_FOUND)
+        assert cache.check("github", "ghost") == NOT_FOUND
+        assert cache.stats() == {"size": 1, "recorded": {NOT_FOUND: 1}, "skipped": {NOT_FOUND: 1}}
+
+    def test_repeated_strikes_double_ttl_up_to_cap(self, monkeypatch):
+        monkeypatch.setattr(cache_module.settings, "negative_cache_ttls", {LOGIN_WALL: 100})
+        monkeypatch.setattr(cache_module.settings, "negative_cache_max_ttl", 350)
+        cache = NegativeCache(maxsize=8)
+        ttls = [cache.record("instagram", "walled", LOGIN_WALL) for _ in range(4)]
+        assert ttls == [100, 200, 350, 350]
+
+    def test_contains_respects_expiry_and_counters(self):
+        cache = NegativeCache(maxsize=8)
+        with patch.object(cache_module.time, "monotonic", return_value=100.0):
+            cache.record("linkedin", "someone", LOGIN_WALL)
+            assert cache.contains("linkedin", "someone")
+        with patch.object(cache_module.time, "monotonic", return_value=100.0 + 7 * 24 * 3600):
+            assert not cache.contains("linkedin", "someone")
+        assert cache.stats()["skipped"] == {}
+
+    def test_invalidate_resets_strikes(self):
+        cache = NegativeCache(maxsize=8)
+        first = cache.record("github", "ghost", NOT_FOUND)
+        cache.record("github", "ghost", NOT_FOUND)
+        cache.invalidate("github", "ghost")
+        assert cache.check("github", "ghost") is None
+        assert cache.record("github", "ghost", NOT_FOUND) == first
+
+
+# ── unit: fetch path ──────────────────────────────────────────────
+
+def _counting_connector(data):
+    mock = AsyncMock(return_value=data)
+
+    class FakeConnector:
+        async def fetch(self, identifier, depth="full"):
+            return dict(await mock(identifier))
+
+    return FakeConnector, mock
+
+
+class TestFetchServiceData:
+    async def test_second_fetch_served_from_cache(self):
+        cls, mock = _counting_connector({"languages": ["Go"]})
+        first = await fetch_service_data("github", "octocat", cls)
+        second = await fetch_service_data("github", "@OctoCat", cls)
+        assert first == second == {"languages": ["Go"]}
+        assert mock.call_count == 1
+
+    async def test_bypass_refetches_and_refreshes(self):
+        cls, mock = _counting_connector({"languages": ["Go"]})
+        await fetch_service_data("github", "octocat", cls)
+        await fetch_service_data("github", "octocat", cls, bypass_cache=True)
+        assert mock.call_count == 2
+
+    async def test_failures_not_cached(self):
+        mock = AsyncMock(side_effect=[Exception("boom"), {"languages": ["Go"]}])
+
+        class Flaky:
+            async def fetch(self, identifier, depth="full"):
+                return await mock(identifier)
+
+        with pytest.raises(Exception):
+            await fetch_service_data("github", "octocat", Flaky)
+        assert await fetch_service_data("github", "octocat", Flaky) == {"languages": ["Go"]}
+
+    async def test_instagram_screenshot_not_cached(self):
+        cls, _ = _counting_connector({"bio": "hi", "screenshot_b64": "abc", "login_wall": False})
+        await fetch_service_data("instagram", "someone", cls)
+        cached = cache_module.connector_cache.get("instagram", "someone")
+        assert "screenshot_b64" not in cached
+
+    async def test_screenshot_request_skips_cached_result_without_ref(self):
+        calls = []
+
+        class Shooter:
+            async def fetch(self, identifier, depth="full", *, screenshot=False):
+                calls.append(screenshot)
+                data = {"bio": "hi", "login_wall": False}
+                if screenshot:
+                    data["screenshot_ref"] = "0" * 32 + ".png"
+                return data
+
+        await fetch_service_data("instagram", "someone", Shooter)
+        shot = await fetch_service_data("instagram", "someone", Shooter, screenshot=True)
+        again = await fetch_service_data("instagram", "someone", Shooter, screenshot=True)
+
+        assert calls == [False, True]
+        assert shot["screenshot_ref"] == again["screenshot_ref"]
+
+    async def test_user_data_shares_cache(self):
+        cls, mock = _counting_connector({"languages": ["Go"]})
+        with patch.dict("app.connectors.registry.connector_registry.classes", {"github": cls}, clear=True):
+            await _fetch_user_data({"github": "octocat"})
+            await _fetch_user_data({"github": "octocat"})
+        assert mock.call_count == 1
+
+    async def test_negative_outcome_not_cached_as_hit(self):
+        mock = AsyncMock(return_value={"languages": []})
+
+        class Missing:
+            async def fetch(self, identifier, depth="full"):
+                cache_module.negative_cache.record("github", identifier, NOT_FOUND)
+                return await mock(identifier)
+
+        await fetch_service_data("github", "ghost", Missing)
+        assert cache_module.connector_cache.get("github", "ghost") is None
+
+    async def test_bypass_forgets_negative_outcome(self):
+        cache_module.negative_cache.record("github", "ghost", NOT_FOUND)
+        cls, _ = _counting_connector({"languages": ["Go"]})
+        await fetch_service_data("github", "ghost", cls, bypass_cache=True)
+        assert not cache_module.negative_cache.contains("github", "ghost")
+
+
+class TestFetchDepth:
+    async def test_full_result_serves_preview(self):
+        cls, mock = _counting_connector({"languages": ["Go"]})
+        await fetch_service_data("github", "octocat", cls)
+        assert await fetch_service_data("github", "octocat", cls, depth="preview") == {"languages": ["Go"]}
+        assert mock.call_count == 1
+
+    async def test_preview_does_not_serve_full(self):
+        depths = []
+
+        class Recording:
+            async def fetch(self, identifier, depth="full"):
+                depths.append(depth)
+                return {"languages": ["Go"]}
+
+        await fetch_service_data("github", "octocat", Recording, depth="preview")
+        await fetch_service_data("github", "octocat", Recording, depth="preview")
+        await fetch_service_data("github", "octocat", Recording)
+        assert depths == ["preview", "full"]
@@ -0,0 +1,80 @@
+"""Tests for coach_node coaching modes and LLMService.generate_dual_coaching."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+from app.graph.nodes.coach import coach_node
+from app.services.llm import LLMService
+
+
+STATE = {
+    "user_a": {"dossier": {"public": {"vibe": "coder"}}},
+    "user_b": {"dossier": {"public": {"vibe": "cinephile"}}},
+    "cross_ref": {"shared": []},
+    "venues": [{"name": "Jazz Bar"}],
+}
+
+
+def _config(svc, mode):
+    return {"configurable": {"llm": svc, "coaching_mode": mode}}
+
+
+# ── unit: coach_node modes ────────────────────────────────────────
+
+class TestCoachNodeModes:
+    async def test_parallel_runs_both_calls_concurrently(self):
+        svc = MagicMock(spec=LLMService)
+        running = 0
+        peak = 0
+
+        async def coaching(target_user, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return {"match_intel": target_user["public"]["vibe"]}
+
+        svc.generate_coaching = AsyncMock(side_effect=coaching)
+        result = await coach_node(STATE, _config(svc, "parallel"))
+
+        assert peak == 2
+        assert result["coaching_a"] == {"match_intel": "coder"}
+        assert result["coaching_b"] == {"match_intel": "cinephile"}
+
+    async def test_merged_uses_single_call(self):
+        svc = MagicMock(spec=LLMService)
+        svc.generate_dual_coaching = AsyncMock(return_value=({"match_intel": "a"}, {"match_intel": "b"}))
+        svc.generate_coaching = AsyncMock()
+
+        result = await coach_node(STATE, _config(svc, "merged"))
+
+        svc.generate_dual_coaching.assert_awaited_once()
+        assert svc.generate_dual_coaching.call_args.kwargs["venue"] == {"name": "Jazz Bar"}
+        svc.generate_coaching.assert_not_called()
+        assert result == {"coaching_a": {"match_intel": "a"}, "coaching_b": {"match_intel": "b"}}
+
+
+# ── unit: dual coaching parsing ───────────────────────────────────
+
+def _service(content):
+    chat = MagicMock()
+    chat.ainvoke = AsyncMock(return_value=MagicMock(content=content))
+    return LLMService(llm=chat)
+
+
+class TestGenerateDualCoaching:
+    async def test_splits_both_briefings(self):
+        svc = _service(json.dumps({"coaching_a": {"match_intel": "a"}, "coaching_b": {"match_intel": "b"}}))
+        a, b = await svc.generate_dual_coaching({}, {}, {}, None)
+        assert a == {"match_intel": "a"}
+        assert b == {"match_intel": "b"}
+
+    async def test_handles_fenced_json(self):
+        svc = _service('```json\n{"coaching_a": {"x": 1}, "coaching_b": {"y": 2}}\n```')
+        assert await svc.generate_dual_coaching({}, {}, {}, None) == ({"x": 1}, {"y": 2})
+
+    async def test_invalid_json_returns_empty(self):
+        svc = _service("not json")
+        assert await svc.generate_dual_coaching({}, {}, {}, None) == ({}, {})
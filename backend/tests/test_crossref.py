@@ -123,6 +123,8 @@ def _make_llm_service():
     with patch.object(LLMService, "__init__", lambda self: None):
         svc = LLMService()
         svc._llm = AsyncMock()
+        svc.dossier_cache = None
+        svc.crossref_cache = None
     return svc
 
 
@@ -225,7 +227,7 @@ class TestCrossrefNodeUnit:
             "citations": ["c1"],
         }
 
-        with patch("app.graph.nodes.crossref.LLMService") as MockLLM:
+        with patch("app.graph.nodes.crossref.llm_from_config") as MockLLM:
             instance = MockLLM.return_value
             instance.cross_reference = AsyncMock(return_value=(fake_crossref, True))
 
@@ -240,7 +242,7 @@ class TestCrossrefNodeUnit:
 
     @pytest.mark.asyncio
     async def test_empty_dossiers_no_gemini_call(self):
-        with patch("app.graph.nodes.crossref.LLMService") as MockLLM:
+        with patch("app.graph.nodes.crossref.llm_from_config") as MockLLM:
             instance = MockLLM.return_value
             instance.cross_reference = AsyncMock(return_value=(_empty_crossref(), False))
 
@@ -255,7 +257,7 @@ class TestCrossrefNodeUnit:
 
     @pytest.mark.asyncio
     async def test_handles_missing_dossiers(self):
-        with patch("app.graph.nodes.crossref.LLMService") as MockLLM:
+        with patch("app.graph.nodes.crossref.llm_from_config") as MockLLM:
             instance = MockLLM.return_value
             instance.cross_reference = AsyncMock(return_value=(_empty_crossref(), False))
 
@@ -270,7 +272,7 @@ class TestCrossrefNodeUnit:
 
     @pytest.mark.asyncio
     async def test_handles_empty_state(self):
-        with patch("app.graph.nodes.crossref.LLMService") as MockLLM:
+        with patch("app.graph.nodes.crossref.llm_from_config") as MockLLM:
             instance = MockLLM.return_value
             instance.cross_reference = AsyncMock(return_value=(_empty_crossref(), False))
 
@@ -353,10 +355,8 @@ class TestCrossrefNodeIntegration:
         assert isinstance(result["include_venue"], bool)
 
     @pytest.mark.asyncio
-    async def test_full_pipeline_analyze_to_crossref(self):
-        """End-to-end: analyze_node → crossref_node."""
-        from app.graph.nodes.analyze import analyze_node
-
+    async def test_full_pipeline_analyze_to_crossref(self, run_profiles):
+        """End-to-end: profile nodes → crossref_node."""
         state = {
             "user_a": {"username": "alice", "raw_data": {
                 "github": SAMPLE_GITHUB, "spotify": SAMPLE_SPOTIFY, "letterboxd": SAMPLE_LETTERBOXD,
@@ -366,7 +366,7 @@ class TestCrossrefNodeIntegration:
             }},
         }
 
-        analyze_result = await analyze_node(state)
+        analyze_result = await run_profiles(state)
         merged = {**state, **analyze_result}
         crossref_result = await crossref_node(merged)
 
@@ -0,0 +1,193 @@
+"""Tests for request deadlines and cancellation on disconnect."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from langgraph.graph import END, START, StateGraph
+from typing_extensions import TypedDict
+
+from app.main import app
+from app.services import deadline
+from app.services.deadline import (
+    ClientDisconnected,
+    DeadlineExceeded,
+    request_deadline,
+    run_request,
+)
+from app.services.llm import LLMService
+
+
+class FakeRequest:
+    """Just enough of a Starlette request for run_request."""
+
+    def __init__(self):
+        self.gone = asyncio.Event()
+
+    async def receive(self):
+        await self.gone.wait()
+        return {"type": "http.disconnect"}
+
+
+class TestRequestDeadline:
+    async def test_expiry_cancels_work(self):
+        cancelled = False
+
+        async def slow():
+            nonlocal cancelled
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+
+        with pytest.raises(DeadlineExceeded):
+            async with request_deadline(0.01):
+                await slow()
+        assert cancelled
+
+    async def test_inner_deadline_never_extends_outer(self):
+        async with request_deadline(1):
+            async with request_deadline(60):
+                assert deadline.remaining() <= 1
+        assert deadline.remaining() is None
+
+    async def test_budget_clips_defaults(self):
+        assert deadline.budget(15) == 15
+        async with request_deadline(2):
+            assert deadline.budget(15) <= 2
+            assert deadline.budget_ms(500) == 500
+
+    async def test_spawned_tasks_inherit_deadline(self):
+        async def left():
+            return deadline.remaining()
+
+        async with request_deadline(5):
+            assert (await asyncio.gather(left()))[0] <= 5
+
+    async def test_detached_task_has_no_deadline(self):
+        async def left():
+            return deadline.remaining()
+
+        async with request_deadline(5):
+            assert await deadline.detached(left) is None
+            assert deadline.remaining() <= 5
+
+
+class TestRunRequest:
+    async def test_returns_result(self):
+        async def work():
+            return "ok"
+
+        assert await run_request(FakeRequest(), work()) == "ok"
+
+    async def test_work_errors_propagate(self):
+        async def work():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            await run_request(FakeRequest(), work())
+
+    async def test_work_cancelled_from_inside_is_an_error(self):
+        async def work():
+            shared = asyncio.get_running_loop().create_future()
+            shared.cancel()
+            await shared
+
+        with pytest.raises(RuntimeError):
+            await run_request(FakeRequest(), work())
+
+    async def test_disconnect_cancels_work(self):
+        request = FakeRequest()
+        started, cancelled = asyncio.Event(), asyncio.Event()
+
+        async def work():
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        runner = asyncio.create_task(run_request(request, work()))
+        await started.wait()
+        request.gone.set()
+
+        with pytest.raises(ClientDisconnected):
+            await runner
+        assert cancelled.is_set()
+
+
+class HangingLLM:
+    async def ainvoke(self, messages):
+        await asyncio.sleep(10)
+
+
+class TestLLMTimeout:
+    async def test_llm_call_bounded_by_deadline(self):
+        service = LLMService(llm=HangingLLM())
+
+        with pytest.raises(DeadlineExceeded):
+            async with request_deadline(0.01):
+                await service.brainstorm_venue_queries({})
+
+    async def test_llm_timeout_without_deadline(self, monkeypatch):
+        monkeypatch.setattr(deadline.settings, "llm_timeout", 0.01)
+
+        with pytest.raises(TimeoutError):
+            await LLMService(llm=HangingLLM()).brainstorm_venue_queries({})
+
+
+class TestGraphNodes:
+    async def test_nodes_see_request_deadline(self):
+        class State(TypedDict):
+            left: float | None
+
+        async def node(state):
+            return {"left": deadline.remaining()}
+
+        graph = StateGraph(State)
+        graph.add_node("node", node)
+        graph.add_edge(START, "node")
+        graph.add_edge("node", END)
+
+        async with request_deadline(5):
+            result = await graph.compile().ainvoke({"left": None})
+        assert result["left"] is not None and result["left"] <= 5
+
+
+class TestEndpoints:
+    async def test_match_past_deadline_is_504(self, monkeypatch):
+        monkeypatch.setattr(deadline.settings, "request_deadline", 0.05)
+
+        async def slow_fetch(*args, **kwargs):
+            await asyncio.sleep(10)
+
+        with patch("app.main._fetch_user_data", side_effect=slow_fetch):
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+                resp = await ac.post("/api/match", json={
+                    "user_a": {"github": "user1"},
+                    "user_b": {"github": "user2"},
+                })
+
+        assert resp.status_code == 504
+
+    async def test_stream_past_deadline_sends_error_event(self, monkeypatch):
+        monkeypatch.setattr(deadline.settings, "request_deadline", 0.05)
+
+        class SlowPipeline:
+            async def astream(self, state, config=None):
+                yield {"profile_a": {}}
+                await asyncio.sleep(10)
+                yield {"profile_b": {}}
+
+        with patch("app.main.pipeline", SlowPipeline()), patch("app.main.get_llm_service"):
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+                resp = await ac.post("/stream", json={
+                    "user_a": {"github_username": "user1"},
+                    "user_b": {"github_username": "user2"},
+                })
+
+        events = [line for line in resp.text.splitlines() if line.startswith("event:")]
+        assert events == ["event: node_complete", "event: error"]
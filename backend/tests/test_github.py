@@ -4,9 +4,13 @@ Unit tests exercise extraction logic with fake data.
 Integration tests hit the real GitHub API (marked with @pytest.mark.integration).
 """
 
+import json
+
+import httpx
 import pytest
 
-from app.connectors.github import GitHubConnector
+from app.connectors.github import API_BASE, GitHubConnector
+from app.services.cache import NOT_FOUND, negative_cache
 
 
 # ── fixtures ──────────────────────────────────────────────────────
@@ -155,6 +159,153 @@ class TestExtractStarredTopics:
         assert connector._extract_starred_topics([{"topics": []}, {"topics": []}]) == []
 
 
+# ── unit: negative cache ──────────────────────────────────────────
+
+class TestMissingUser:
+    async def test_404_is_remembered(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            return httpx.Response(404)
+
+        client = httpx.AsyncClient(base_url=API_BASE, transport=httpx.MockTransport(handler))
+        connector = GitHubConnector(client=client, token="")
+
+        first = await connector.fetch("no-such-user")
+        second = await connector.fetch("no-such-user")
+
+        assert first == second == {
+            "languages": [],
+            "repos": [],
+            "commit_hours": [],
+            "starred_topics": [],
+        }
+        assert len(calls) == 3
+        assert negative_cache.stats()["skipped"] == {NOT_FOUND: 1}
+
+
+class TestFetchDepth:
+    async def test_preview_only_lists_repos(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            return httpx.Response(200, json=FAKE_REPOS)
+
+        client = httpx.AsyncClient(base_url=API_BASE, transport=httpx.MockTransport(handler))
+        result = await GitHubConnector(client=client, token="").fetch("octocat", depth="preview")
+
+        assert calls == ["/users/octocat/repos"]
+        assert set(result) == {"languages", "repos"}
+
+    async def test_probe_missing_user(self):
+        client = httpx.AsyncClient(
+            base_url=API_BASE, transport=httpx.MockTransport(lambda r: httpx.Response(404))
+        )
+        assert await GitHubConnector(client=client, token="").fetch("ghost", depth="probe") == {"exists": False}
+        assert negative_cache.contains("github", "ghost")
+
+
+# ── unit: GraphQL backend ─────────────────────────────────────────
+
+FAKE_GRAPHQL_USER = {
+    "login": "octocat",
+    "repositories": {"nodes": [
+        {
+            "name": "hello-world",
+            "description": None,
+            "stargazerCount": 42,
+            "primaryLanguage": {"name": "Python"},
+            "languages": {"nodes": [{"name": "Python"}, {"name": "Shell"}]},
+        },
+        {
+            "name": "dotfiles",
+            "description": "My config",
+            "stargazerCount": 1,
+            "primaryLanguage": None,
+            "languages": {"nodes": []},
+        },
+    ]},
+    "recent": {"nodes": [
+        {"defaultBranchRef": {"target": {"history": {"nodes": [
+            {"committedDate": "2024-01-15T23:30:00Z", "author": {"user": {"login": "OctoCat"}}},
+            {"committedDate": "2024-01-15T09:00:00Z", "author": {"user": {"login": "someone-else"}}},
+            {"committedDate": "2024-01-14T02:10:00Z", "author": {"user": None}},
+        ]}}}},
+        {"defaultBranchRef": None},
+    ]},
+    "starredRepositories": {"nodes": [
+        {"repositoryTopics": {"nodes": [{"topic": {"name": "rust"}}, {"topic": {"name": "cli"}}]}},
+        {"repositoryTopics": {"nodes": [{"topic": {"name": "rust"}}]}},
+    ]},
+}
+
+
+def _graphql_connector(handler):
+    client = httpx.AsyncClient(base_url=API_BASE, transport=httpx.MockTransport(handler))
+    return GitHubConnector(client=client, token="t0ken")
+
+
+class TestGraphQLBackend:
+    async def test_single_query_feeds_extractors(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"data": {"user": FAKE_GRAPHQL_USER}})
+
+        result = await _graphql_connector(handler).fetch("octocat")
+
+        assert [(r.method, r.url.path) for r in requests] == [("POST", "/graphql")]
+        assert requests[0].headers["Authorization"] == "bearer t0ken"
+        assert result == {
+            "languages": ["Python", "Shell"],
+            "repos": [
+                {"name": "hello-world", "description": "", "stars": 42, "language": "Python"},
+                {"name": "dotfiles", "description": "My config", "stars": 1, "language": ""},
+            ],
+            "commit_hours": [23],
+            "starred_topics": ["rust", "cli"],
+        }
+
+    async def test_preview_query_skips_activity(self):
+        queries = []
+
+        def handler(request):
+            queries.append(json.loads(request.content)["query"])
+            return httpx.Response(200, json={"data": {"user": FAKE_GRAPHQL_USER}})
+
+        result = await _graphql_connector(handler).fetch("octocat", depth="preview")
+
+        assert "starredRepositories" not in queries[0]
+        assert set(result) == {"languages", "repos"}
+
+    async def test_missing_user_is_remembered(self):
+        def handler(request):
+            return httpx.Response(200, json={
+                "data": {"user": None},
+                "errors": [{"type": "NOT_FOUND", "message": "Could not resolve to a User"}],
+            })
+
+        assert await _graphql_connector(handler).fetch("ghost", depth="probe") == {"exists": False}
+        assert negative_cache.contains("github", "ghost")
+
+    async def test_rejected_token_falls_back_to_rest(self):
+        paths = []
+
+        def handler(request):
+            paths.append(request.url.path)
+            if request.url.path == "/graphql":
+                return httpx.Response(401)
+            return httpx.Response(200, json=FAKE_REPOS)
+
+        result = await _graphql_connector(handler).fetch("octocat", depth="preview")
+
+        assert paths == ["/graphql", "/users/octocat/repos"]
+        assert len(result["repos"]) == len(FAKE_REPOS)
+
+
 # ── integration: real API calls ───────────────────────────────────
 
 @pytest.mark.integration
@@ -0,0 +1,74 @@
+"""Tests for the compiled LangGraph pipeline topology."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.graph.builder import build_graph
+from app.services.llm import LLMService
+
+
+def _mock_service():
+    svc = MagicMock(spec=LLMService)
+    svc.profile_analysis = AsyncMock(side_effect=lambda raw, *a, **kw: {"public": {"vibe": str(sorted(raw))}})
+    svc.cross_reference = AsyncMock(return_value=({"shared": []}, False))
+    svc.generate_coaching = AsyncMock(return_value={"match_intel": "ok"})
+    return svc
+
+
+STATE = {
+    "user_a": {"identifiers": {"github": "fast"}},
+    "user_b": {"identifiers": {"letterboxd": "slow"}},
+    "include_venue": False,
+}
+
+
+class TestPerUserBranches:
+    async def test_analysis_starts_before_other_user_ingest_finishes(self):
+        svc = _mock_service()
+        a_analyzed = asyncio.Event()
+        original = svc.profile_analysis.side_effect
+
+        async def analyze(raw, *args, **kwargs):
+            if "github" in raw:
+                a_analyzed.set()
+            return original(raw)
+
+        async def fetch(identifiers, **kwargs):
+            if "letterboxd" in identifiers:
+                # User B's ingest only completes once A has been analyzed
+                await a_analyzed.wait()
+            return {service: {"id": ident} for service, ident in identifiers.items()}
+
+        svc.profile_analysis.side_effect = analyze
+        with patch("app.graph.nodes.profile._fetch_user_data", side_effect=fetch):
+            result = await asyncio.wait_for(
+                build_graph().ainvoke(STATE, config={"configurable": {"llm": svc}}),
+                timeout=2,
+            )
+
+        assert result["user_a"]["raw_data"] == {"github": {"id": "fast"}}
+        assert result["user_b"]["dossier"] == {"public": {"vibe": "['letterboxd']"}}
+        assert svc.cross_reference.call_count == 1
+
+    async def test_stream_reports_per_user_nodes(self):
+        svc = _mock_service()
+        with patch("app.graph.nodes.profile._fetch_user_data", new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.return_value = {}
+            events = [
+                e async for e in build_graph().astream(STATE, config={"configurable": {"llm": svc}})
+            ]
+
+        nodes = [name for event in events for name in event]
+        assert set(nodes[:2]) == {"profile_a", "profile_b"}
+        assert nodes[2:] == ["crossref", "coach"]
+
+    async def test_both_users_fetch_as_the_run_tenant(self):
+        svc = _mock_service()
+        tenant = object()
+        with patch("app.graph.nodes.profile._fetch_user_data", new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.return_value = {}
+            await build_graph().ainvoke(
+                STATE, config={"configurable": {"llm": svc, "tenant": tenant}}
+            )
+
+        assert [c.kwargs["tenant"] for c in mock_fetch.call_args_list] == [tenant, tenant]
@@ -0,0 +1,90 @@
+"""Tests for the shared HTTP client registry and connector client injection."""
+
+import httpx
+import pytest
+
+from app.connectors.github import GitHubConnector
+from app.connectors.instagram import InstagramConnector
+from app.connectors.letterboxd import LetterboxdConnector
+from app.connectors.linkedin import LinkedInConnector
+from app.services.http import HTTPClientRegistry, no_cookies
+
+
+# ── unit: registry ────────────────────────────────────────────────
+
+class TestHTTPClientRegistry:
+    async def test_reuses_client_per_name(self):
+        registry = HTTPClientRegistry()
+        first = registry.get("github", base_url="https://api.github.com")
+        second = registry.get("github")
+        assert first is second
+        await registry.aclose()
+
+    async def test_separate_pools_per_host(self):
+        registry = HTTPClientRegistry()
+        assert registry.get("github") is not registry.get("letterboxd")
+        await registry.aclose()
+
+    async def test_aclose_closes_and_rebuilds(self):
+        registry = HTTPClientRegistry()
+        client = registry.get("github")
+        await registry.aclose()
+        assert client.is_closed
+        assert registry.get("github") is not client
+        await registry.aclose()
+
+
+    async def test_cookieless_client_never_sends_cookies(self):
+        sent = []
+
+        def handler(request):
+            sent.append(request.headers.get("cookie"))
+            return httpx.Response(200, headers={"set-cookie": "csrftoken=abc; Path=/"})
+
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handler), cookies=no_cookies()
+        ) as client:
+            await client.get("https://www.instagram.com/first/")
+            await client.get("https://www.instagram.com/second/")
+
+        assert sent == [None, None]
+
+    @pytest.mark.parametrize("connector", [InstagramConnector, LinkedInConnector])
+    async def test_scraper_clients_drop_cookies(self, connector):
+        client = connector().client
+        request = httpx.Request("GET", "https://www.example.com/")
+        client.cookies.extract_cookies(
+            httpx.Response(200, headers={"set-cookie": "session=abc; Path=/"}, request=request)
+        )
+        assert not client.cookies
+
+
+# ── unit: injected clients ────────────────────────────────────────
+
+class TestClientInjection:
+    async def test_github_uses_injected_client(self):
+        seen: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.url.path)
+            return httpx.Response(200, json=[])
+
+        client = httpx.AsyncClient(
+            base_url="https://api.github.com", transport=httpx.MockTransport(handler)
+        )
+        result = await GitHubConnector(client=client).fetch("octocat")
+
+        assert sorted(seen) == [
+            "/users/octocat/events/public",
+            "/users/octocat/repos",
+            "/users/octocat/starred",
+        ]
+        assert result["repos"] == []
+        assert not client.is_closed
+        await client.aclose()
+
+    async def test_letterboxd_404_returns_empty(self):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(lambda r: httpx.Response(404)))
+        result = await LetterboxdConnector(client=client).fetch("nobody")
+        assert result == {"recent_films": []}
+        await client.aclose()
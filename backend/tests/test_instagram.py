@@ -5,10 +5,13 @@ Integration tests hit real Instagram (marked with @pytest.mark.integration).
 """
 
 import base64
+from unittest.mock import AsyncMock
 
+import httpx
 import pytest
 
 from app.connectors.instagram import InstagramConnector
+from app.services.cache import LOGIN_WALL, negative_cache
 
 
 # ── fixtures ──────────────────────────────────────────────────────
@@ -161,6 +164,119 @@ class TestLoginWallDetection:
         assert result["screenshot_b64"] == ""
 
 
+# ── unit: static HTML fast path ──────────────────────────────────
+
+STATIC_HTML = """
+<html><head>
+<title>Architectural Digest (@archdigest) • Instagram photos and videos</title>
+<meta property="og:description" content="5M Followers, 900 Following, 12,000 Posts - See Instagram photos and videos from Architectural Digest (@archdigest)">
+</head><body></body></html>
+"""
+
+LOGIN_HTML = "<html><head><title>Login • Instagram</title></head><body></body></html>"
+
+
+def _connector_with_html(html, status=200):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(lambda r: httpx.Response(status, text=html)))
+    return InstagramConnector(client=client)
+
+
+class TestStaticFastPath:
+    async def test_meta_tags_skip_browser(self):
+        connector = _connector_with_html(STATIC_HTML)
+        connector._render_profile = AsyncMock(side_effect=AssertionError("should not render"))
+
+        result = await connector.fetch("archdigest")
+
+        assert "5M Followers" in result["bio"]
+        assert result["login_wall"] is False
+
+    async def test_login_page_falls_back_to_browser(self):
+        connector = _connector_with_html(LOGIN_HTML)
+        connector._render_profile = AsyncMock(return_value=FAKE_PROFILE_FULL)
+
+        result = await connector.fetch("archdigest")
+
+        connector._render_profile.assert_awaited_once_with("archdigest")
+        assert "Architectural Digest" in result["bio"]
+
+    async def test_http_error_falls_back_to_browser(self):
+        connector = _connector_with_html("", status=429)
+        connector._render_profile = AsyncMock(return_value=FAKE_PROFILE_EMPTY)
+
+        await connector.fetch("archdigest")
+
+        connector._render_profile.assert_awaited_once()
+
+
+class TestFetchDepth:
+    async def test_preview_never_renders(self):
+        connector = _connector_with_html(LOGIN_HTML)
+        connector._render_profile = AsyncMock(side_effect=AssertionError("should not render"))
+
+        result = await connector.fetch("archdigest", depth="preview")
+
+        assert result["login_wall"] is True
+        assert not negative_cache.contains("instagram", "archdigest")
+
+
+class TestScreenshotCapture:
+    async def test_off_by_default(self):
+        connector = _connector_with_html(STATIC_HTML)
+
+        result = await connector.fetch("archdigest")
+
+        assert "screenshot_ref" not in result
+        assert result["screenshot_b64"] == ""
+
+    async def test_opt_in_renders_and_stores_by_ref(self):
+        connector = _connector_with_html(STATIC_HTML)
+        connector._render_profile = AsyncMock(return_value=dict(FAKE_PROFILE_FULL))
+
+        result = await connector.fetch("archdigest", screenshot=True)
+
+        connector._render_profile.assert_awaited_once_with("archdigest", screenshot=True)
+        assert result["screenshot_b64"] == ""
+        assert connector.screenshots.path_for(result["screenshot_ref"]) is not None
+
+    async def test_no_ref_on_login_wall(self):
+        connector = _connector_with_html(LOGIN_HTML)
+        connector._render_profile = AsyncMock(return_value=dict(FAKE_PROFILE_LOGIN_WALL))
+
+        result = await connector.fetch("walled", screenshot=True)
+
+        assert "screenshot_ref" not in result
+
+
+class TestNegativeCache:
+    async def test_login_wall_is_remembered(self):
+        connector = _connector_with_html(LOGIN_HTML)
+        connector._render_profile = AsyncMock(return_value=FAKE_PROFILE_LOGIN_WALL)
+
+        first = await connector.fetch("walled")
+        second = await connector.fetch("walled")
+
+        assert first == second == {"bio": "", "screenshot_b64": "", "login_wall": True}
+        connector._render_profile.assert_awaited_once()
+        assert negative_cache.stats()["skipped"] == {LOGIN_WALL: 1}
+
+    async def test_timeout_is_remembered(self):
+        connector = _connector_with_html("", status=503)
+        connector._render_profile = AsyncMock(return_value={**FAKE_PROFILE_EMPTY, "timed_out": True})
+
+        await connector.fetch("slow")
+        await connector.fetch("slow")
+
+        connector._render_profile.assert_awaited_once()
+
+    async def test_successful_profile_not_remembered(self):
+        connector = _connector_with_html(STATIC_HTML)
+
+        await connector.fetch("archdigest")
+
+        assert not negative_cache.contains("instagram", "archdigest")
+
+
 # ── integration: real Instagram ──────────────────────────────────
 
 @pytest.mark.integration
@@ -4,9 +4,12 @@ Unit tests exercise extraction logic with fake RSS data.
 Integration tests hit the real Letterboxd RSS feed (marked with @pytest.mark.integration).
 """
 
+import httpx
 import pytest
 
-from app.connectors.letterboxd import LetterboxdConnector
+from app.connectors.letterboxd import LetterboxdConnector, parse_feed
+from app.services.store import SQLiteStore
+from app.services.validators import ValidatorStore
 
 
 # ── fixtures ──────────────────────────────────────────────────────
@@ -159,6 +162,88 @@ class TestFullExtraction:
         assert films[2]["rating"] == 1.5  # ★½
 
 
+# ── unit: streaming feed parser ──────────────────────────────────
+
+def _rss(items: str) -> bytes:
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        '<rss version="2.0" xmlns:letterboxd="https://letterboxd.com">'
+        f"<channel><title>Letterboxd</title>{items}</channel></rss>"
+    ).encode("utf-8")
+
+
+def _item(i: int, rating: str | None = "3.5") -> str:
+    rating_el = f"<letterboxd:memberRating>{rating}</letterboxd:memberRating>" if rating else ""
+    return (
+        f"<item><title>Film {i}, 2024 - ★★★½</title>"
+        f"<link>https://letterboxd.com/u/film/{i}/</link>"
+        f"<letterboxd:filmTitle>Film {i}</letterboxd:filmTitle>{rating_el}</item>"
+    )
+
+
+class TestParseFeed:
+    def test_reads_only_needed_fields(self):
+        feed = parse_feed(_rss(_item(1)))
+        assert feed == {"entries": [{
+            "title": "Film 1, 2024 - ★★★½",
+            "link": "https://letterboxd.com/u/film/1/",
+            "letterboxd_memberrating": "3.5",
+        }]}
+
+    def test_missing_rating_is_none(self):
+        [entry] = parse_feed(_rss(_item(1, rating=None)))["entries"]
+        assert entry["letterboxd_memberrating"] is None
+
+    def test_stops_at_limit(self):
+        feed = parse_feed(_rss("".join(_item(i) for i in range(100))), limit=5)
+        assert [e["link"].rsplit("/", 2)[1] for e in feed["entries"]] == ["0", "1", "2", "3", "4"]
+
+    def test_stops_before_trailing_garbage(self):
+        content = _rss("".join(_item(i) for i in range(3))).replace(b"</channel>", b"<<<broken")
+        assert len(parse_feed(content, limit=3)["entries"]) == 3
+
+
+    def test_feeds_extractor_end_to_end(self, connector):
+        films = connector._extract_films(parse_feed(_rss(_item(7))))
+        assert films == [{"title": "Film 7, 2024", "rating": 3.5, "link": "https://letterboxd.com/u/film/7/"}]
+
+
+def _streaming_connector(content, chunk_size=1024):
+    """Connector whose feed arrives in ``chunk_size`` pieces; returns (connector, sent)."""
+    sent = []
+
+    async def body():
+        for start in range(0, len(content), chunk_size):
+            sent.append(start)
+            yield content[start : start + chunk_size]
+
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, content=body()))
+    )
+    connector = LetterboxdConnector(client=client, validators=ValidatorStore(SQLiteStore(":memory:")))
+    return connector, sent
+
+
+class TestStreamingFetch:
+    async def test_stops_downloading_at_limit(self):
+        content = _rss("".join(_item(i) for i in range(500)))
+        connector, sent = _streaming_connector(content)
+
+        feed = await connector._fetch_feed("prolific")
+
+        assert len(feed["entries"]) == 20
+        # Only the first few of ~100 chunks were ever pulled from the server
+        assert len(sent) * 1024 < len(content) / 4
+
+    async def test_malformed_feed_falls_back_to_feedparser(self):
+        content = _rss(_item(1) + "<item><title>Unclosed & broken</title>")
+        connector, _ = _streaming_connector(content, chunk_size=64)
+
+        feed = await connector._fetch_feed("broken")
+
+        assert feed["entries"][0]["link"] == "https://letterboxd.com/u/film/1/"
+
+
 # ── integration: real RSS feed ───────────────────────────────────
 
 @pytest.mark.integration
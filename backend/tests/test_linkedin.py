@@ -4,9 +4,13 @@ Unit tests exercise extraction logic with fake page data.
 Integration tests hit real LinkedIn (marked with @pytest.mark.integration).
 """
 
+from unittest.mock import AsyncMock
+
+import httpx
 import pytest
 
 from app.connectors.linkedin import LinkedInConnector
+from app.services.cache import AUTH_WALL, TIMEOUT, negative_cache
 
 
 # ── fixtures ──────────────────────────────────────────────────────
@@ -165,6 +169,69 @@ class TestAuthWallDetection:
         assert connector._extract_profile_data(FAKE_PROFILE_FULL)["login_wall"] is False
 
 
+# ── unit: static HTML fast path ──────────────────────────────────
+
+STATIC_HTML = """
+<html><head>
+<title>Jane Doe - Senior Engineer - BigCo | LinkedIn</title>
+<meta name="description" content="Experienced engineer focused on distributed systems.">
+</head><body>
+<h1>Jane Doe</h1>
+<h2 class="top-card-layout__headline">Senior Engineer at BigCo</h2>
+</body></html>
+"""
+
+AUTHWALL_HTML = "<html><head><title>Sign Up | LinkedIn</title></head><body><h1>Join LinkedIn</h1></body></html>"
+
+
+def _connector_with_html(html, status=200):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(lambda r: httpx.Response(status, text=html)))
+    return LinkedInConnector(client=client)
+
+
+class TestStaticFastPath:
+    async def test_static_fields_skip_browser(self):
+        connector = _connector_with_html(STATIC_HTML)
+        connector._render_profile = AsyncMock(side_effect=AssertionError("should not render"))
+
+        result = await connector.fetch("janedoe")
+
+        assert result["name"] == "Jane Doe"
+        assert result["headline"] == "Senior Engineer at BigCo"
+        assert "distributed systems" in result["about"]
+
+    async def test_authwall_falls_back_to_browser(self):
+        connector = _connector_with_html(AUTHWALL_HTML)
+        connector._render_profile = AsyncMock(return_value=FAKE_PROFILE_FULL)
+
+        result = await connector.fetch("janedoe")
+
+        connector._render_profile.assert_awaited_once_with("janedoe")
+        assert result["name"] == "Jane Doe"
+
+
+class TestNegativeCache:
+    async def test_auth_wall_is_remembered(self):
+        connector = _connector_with_html(AUTHWALL_HTML)
+        connector._render_profile = AsyncMock(return_value=FAKE_PROFILE_LOGIN_WALL)
+
+        await connector.fetch("walled")
+        result = await connector.fetch("walled")
+
+        assert result["login_wall"] is True
+        connector._render_profile.assert_awaited_once()
+        assert negative_cache.stats()["skipped"] == {AUTH_WALL: 1}
+
+    async def test_timeout_hit_is_not_a_login_wall(self):
+        negative_cache.record("linkedin", "slow", TIMEOUT)
+        connector = _connector_with_html(AUTHWALL_HTML)
+        connector._render_profile = AsyncMock(side_effect=AssertionError("should not render"))
+
+        result = await connector.fetch("slow")
+
+        assert result == {"name": "", "headline": "", "about": "", "login_wall": False}
+
+
 # ── integration: real LinkedIn ───────────────────────────────────
 
 @pytest.mark.integration
@@ -0,0 +1,176 @@
+"""Tests for the persistent store and the content-addressed dossier cache."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.llm import LLMService
+from app.services.llm_cache import CrossrefCache, DossierCache, relabel, stable_hash
+from app.services.store import SQLiteStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SQLiteStore(str(tmp_path / "cache.sqlite3"))
+    yield store
+    store.close()
+
+
+def _service(store, payload):
+    chat = MagicMock()
+    chat.model = "gemini-test"
+    chat.ainvoke = AsyncMock(return_value=MagicMock(content=json.dumps(payload)))
+    return LLMService(llm=chat, dossier_cache=DossierCache(store)), chat
+
+
+FAKE_DOSSIER = {"public": {"vibe": "builder", "tags": []}, "private": {}}
+
+
+# ── unit: SQLiteStore ─────────────────────────────────────────────
+
+class TestSQLiteStore:
+    async def test_roundtrip_and_delete(self, store):
+        await store.set("ns", "k", {"a": 1})
+        assert await store.get("ns", "k") == {"a": 1}
+        await store.delete("ns", "k")
+        assert await store.get("ns", "k") is None
+
+    async def test_namespaces_isolated(self, store):
+        await store.set("one", "k", 1)
+        assert await store.get("two", "k") is None
+
+    async def test_expired_entry_dropped(self, store):
+        await store.set("ns", "k", 1, ttl=-1)
+        assert await store.get("ns", "k") is None
+
+    async def test_evicts_beyond_max_entries(self, store):
+        for i in range(4):
+            await store.set("ns", f"k{i}", i, max_entries=2)
+        assert await store.get("ns", "k0") is None
+        assert await store.get("ns", "k3") == 3
+
+    async def test_persists_across_instances(self, tmp_path):
+        path = str(tmp_path / "p.sqlite3")
+        first = SQLiteStore(path)
+        await first.set("ns", "k", "v")
+        first.close()
+        second = SQLiteStore(path)
+        assert await second.get("ns", "k") == "v"
+        second.close()
+
+
+# ── unit: stable hashing ──────────────────────────────────────────
+
+class TestStableHash:
+    def test_key_order_independent(self):
+        assert stable_hash({"a": 1, "b": 2}) == stable_hash({"b": 2, "a": 1})
+
+    def test_prompt_changes_key(self):
+        data = {"github": {"languages": ["Go"]}}
+        assert DossierCache.key_for(data, "p1", "m") != DossierCache.key_for(data, "p2", "m")
+
+
+# ── unit: profile_analysis caching ────────────────────────────────
+
+class TestProfileAnalysisCache:
+    async def test_unchanged_data_skips_llm(self, store):
+        svc, chat = _service(store, FAKE_DOSSIER)
+        raw = {"github": {"languages": ["Go"]}, "spotify": {}}
+
+        first = await svc.profile_analysis(raw)
+        second = await svc.profile_analysis(dict(raw))
+
+        assert chat.ainvoke.call_count == 1
+        assert first == second
+        assert second["data_sources"] == ["github"]
+        assert svc.dossier_cache.stats() == {"hits": 1, "misses": 1}
+
+    async def test_changed_data_calls_llm(self, store):
+        svc, chat = _service(store, FAKE_DOSSIER)
+        await svc.profile_analysis({"github": {"languages": ["Go"]}})
+        await svc.profile_analysis({"github": {"languages": ["Rust"]}})
+        assert chat.ainvoke.call_count == 2
+
+    async def test_refresh_bypasses_lookup(self, store):
+        svc, chat = _service(store, FAKE_DOSSIER)
+        raw = {"github": {"languages": ["Go"]}}
+        await svc.profile_analysis(raw)
+        await svc.profile_analysis(raw, refresh=True)
+        assert chat.ainvoke.call_count == 2
+
+    async def test_clear_invalidates(self, store):
+        svc, chat = _service(store, FAKE_DOSSIER)
+        raw = {"github": {"languages": ["Go"]}}
+        await svc.profile_analysis(raw)
+        await svc.dossier_cache.clear()
+        await svc.profile_analysis(raw)
+        assert chat.ainvoke.call_count == 2
+
+
+# ── unit: symmetric crossref cache ────────────────────────────────
+
+DOSSIER_A = {"public": {"vibe": "night owl coder"}, "private": {"traits": ["builder"]}}
+DOSSIER_B = {"public": {"vibe": "film buff"}, "private": {"traits": ["critic"]}}
+
+FAKE_CROSSREF = {
+    "shared": [{"signal": "late nights", "detail": "Person A codes at 2am, Person B watches films", "source": "both"}],
+    "complementary": [],
+    "tension_points": [],
+    "citations": ["Person A: night owl"],
+    "venue_appropriate": True,
+}
+
+
+def _crossref_service(store):
+    chat = MagicMock()
+    chat.model = "gemini-test"
+    chat.ainvoke = AsyncMock(return_value=MagicMock(content=json.dumps(FAKE_CROSSREF)))
+    return LLMService(llm=chat, crossref_cache=CrossrefCache(store)), chat
+
+
+class TestCrossrefCache:
+    async def test_same_direction_hit(self, store):
+        svc, chat = _crossref_service(store)
+        first = await svc.cross_reference(DOSSIER_A, DOSSIER_B)
+        second = await svc.cross_reference(DOSSIER_A, DOSSIER_B)
+        assert chat.ainvoke.call_count == 1
+        assert first == second
+
+    async def test_reverse_direction_relabels(self, store):
+        svc, chat = _crossref_service(store)
+        await svc.cross_reference(DOSSIER_A, DOSSIER_B)
+        result, venue = await svc.cross_reference(DOSSIER_B, DOSSIER_A)
+
+        assert chat.ainvoke.call_count == 1
+        assert venue is True
+        assert result["shared"][0]["detail"] == "Person B codes at 2am, Person A watches films"
+        assert result["citations"] == ["Person B: night owl"]
+
+    async def test_named_reverse_lookup(self, store):
+        svc, chat = _crossref_service(store)
+        await svc.cross_reference(DOSSIER_A, DOSSIER_B)
+        result, _ = await svc.cross_reference(DOSSIER_B, DOSSIER_A, name_a="Bea", name_b="Al")
+        assert result["citations"] == ["Al: night owl"]
+        assert chat.ainvoke.call_count == 1
+
+    async def test_venue_flag_not_in_result(self, store):
+        svc, _ = _crossref_service(store)
+        await svc.cross_reference(DOSSIER_A, DOSSIER_B)
+        result, _ = await svc.cross_reference(DOSSIER_A, DOSSIER_B)
+        assert "venue_appropriate" not in result
+
+    async def test_different_pair_misses(self, store):
+        svc, chat = _crossref_service(store)
+        await svc.cross_reference(DOSSIER_A, DOSSIER_B)
+        await svc.cross_reference(DOSSIER_A, {"public": {"vibe": "other"}})
+        assert chat.ainvoke.call_count == 2
+
+
+class TestRelabel:
+    def test_swap_is_simultaneous(self):
+        out = relabel("Person A likes Person B", {"Person A": "Person B", "Person B": "Person A"})
+        assert out == "Person B likes Person A"
+
+    def test_does_not_touch_longer_words(self):
+        assert relabel("Alice and Alicent", {"Alice": "Bob"}) == "Bob and Alicent"
@@ -0,0 +1,75 @@
+"""Tests for the shared LLMService lifecycle and graph-config injection."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.graph.builder import build_graph
+from app.services import llm as llm_module
+from app.services.llm import LLMService, get_llm_service, llm_from_config
+
+
+def _mock_service():
+    svc = MagicMock(spec=LLMService)
+    svc.profile_analysis = AsyncMock(return_value={"public": {"tags": []}})
+    svc.cross_reference = AsyncMock(return_value=({"shared": []}, False))
+    svc.generate_coaching = AsyncMock(return_value={"match_intel": "ok"})
+    return svc
+
+
+# ── unit: singleton ───────────────────────────────────────────────
+
+class TestSharedService:
+    def test_get_llm_service_is_singleton(self):
+        with patch.object(llm_module, "_shared_service", None), \
+             patch.object(llm_module, "LLMService") as MockLLM:
+            first = get_llm_service()
+            second = get_llm_service()
+        assert first is second
+        assert MockLLM.call_count == 1
+
+    def test_config_injection_wins(self):
+        injected = _mock_service()
+        assert llm_from_config({"configurable": {"llm": injected}}) is injected
+
+    def test_falls_back_to_shared(self):
+        shared = _mock_service()
+        with patch.object(llm_module, "_shared_service", shared):
+            assert llm_from_config(None) is shared
+            assert llm_from_config({"configurable": {}}) is shared
+
+    async def test_warm_up_swallows_errors(self):
+        chat = MagicMock()
+        chat.model = "gemini-test"
+        chat.async_client.models.get = AsyncMock(side_effect=RuntimeError("offline"))
+        await LLMService(llm=chat).warm_up()
+        chat.async_client.models.get.assert_awaited_once_with(model="gemini-test")
+
+    async def test_warm_up_gives_up_on_slow_api(self, monkeypatch):
+        monkeypatch.setattr(llm_module.settings, "llm_timeout", 0.01)
+
+        async def hang(**kwargs):
+            await asyncio.sleep(10)
+
+        chat = MagicMock()
+        chat.async_client.models.get = hang
+        await asyncio.wait_for(LLMService(llm=chat).warm_up(), 1)
+
+
+# ── unit: graph receives the injected service ─────────────────────
+
+class TestGraphInjection:
+    async def test_nodes_use_configured_llm(self):
+        svc = _mock_service()
+        state = {
+            "user_a": {"identifiers": {"github": "a"}},
+            "user_b": {"identifiers": {"github": "b"}},
+            "include_venue": False,
+        }
+        with patch("app.graph.nodes.profile._fetch_user_data", new_callable=AsyncMock) as mock_fetch, \
+             patch.object(llm_module, "get_llm_service", side_effect=AssertionError("not injected")):
+            mock_fetch.return_value = {"github": {"languages": ["Go"]}}
+            result = await build_graph().ainvoke(state, config={"configurable": {"llm": svc}})
+
+        assert svc.profile_analysis.call_count == 2
+        assert svc.cross_reference.call_count == 1
+        assert result["coaching_a"] == {"match_intel": "ok"}
@@ -0,0 +1,121 @@
+"""Tests for Link-header pagination and reservoir sampling."""
+
+import random
+
+import httpx
+import pytest
+
+from app.connectors import github as github_module
+from app.connectors.github import API_BASE, GitHubConnector
+from app.connectors.paginate import ReservoirSample, paginate
+
+
+# ── unit: ReservoirSample ─────────────────────────────────────────
+
+class TestReservoirSample:
+    def test_keeps_everything_under_size(self):
+        sample = ReservoirSample(10)
+        sample.extend(range(5))
+        assert sample.items() == [0, 1, 2, 3, 4]
+
+    def test_bounded_and_in_stream_order(self):
+        sample = ReservoirSample(10, rng=random.Random(0))
+        sample.extend(range(1000))
+        items = sample.items()
+        assert len(items) == 10
+        assert items == sorted(items)
+        assert sample.seen == 1000
+
+    def test_seed_makes_sample_repeatable(self):
+        first = ReservoirSample(10, seed="github:/users/a/repos")
+        second = ReservoirSample(10, seed="github:/users/a/repos")
+        first.extend(range(1000))
+        second.extend(range(1000))
+        assert first.items() == second.items()
+
+    def test_roughly_uniform(self):
+        hits = [0] * 10
+        rng = random.Random(1)
+        for _ in range(2000):
+            sample = ReservoirSample(1, rng=rng)
+            sample.extend(range(10))
+            hits[sample.items()[0]] += 1
+        assert min(hits) > 120
+
+
+# ── unit: paginate ────────────────────────────────────────────────
+
+def _pages(n):
+    async def fetch_page(url, params):
+        page = int(url.rsplit("=", 1)[1]) if "=" in url else 1
+        return [page], (f"/items?page={page + 1}" if page < n else None)
+
+    return fetch_page
+
+
+class TestPaginate:
+    async def test_follows_until_last_page(self):
+        pages = [p async for p in paginate(_pages(3), "/items", max_pages=10, time_budget=60)]
+        assert pages == [[1], [2], [3]]
+
+    async def test_page_cap(self):
+        pages = [p async for p in paginate(_pages(5), "/items", max_pages=2, time_budget=60)]
+        assert pages == [[1], [2]]
+
+    async def test_time_budget_still_yields_first_page(self):
+        pages = [p async for p in paginate(_pages(5), "/items", max_pages=10, time_budget=0)]
+        assert pages == [[1]]
+
+
+# ── unit: GitHub listings ─────────────────────────────────────────
+
+def _paged_github(total_pages, per_page=100):
+    requested = []
+
+    def handler(request):
+        page = int(request.url.params.get("page", 1))
+        requested.append(page)
+        items = [
+            {"name": f"r{page}-{i}", "language": "Go", "owner": {}}
+            for i in range(per_page)
+        ]
+        headers = {}
+        if page < total_pages:
+            next_url = f"{API_BASE}{request.url.path}?per_page={per_page}&page={page + 1}"
+            headers["Link"] = f'<{next_url}>; rel="next"'
+        return httpx.Response(200, json=items, headers=headers)
+
+    client = httpx.AsyncClient(base_url=API_BASE, transport=httpx.MockTransport(handler))
+    return GitHubConnector(client=client, token=""), client, requested
+
+
+class TestGitHubPagination:
+    @pytest.fixture(autouse=True)
+    def _small_limits(self, monkeypatch):
+        monkeypatch.setattr(github_module.settings, "github_max_pages", 3)
+        monkeypatch.setattr(github_module.settings, "github_sample_size", 50)
+
+    async def test_samples_across_followed_pages(self):
+        connector, client, requested = _paged_github(total_pages=10)
+
+        repos = await connector._fetch_repos(client, "prolific")
+
+        assert requested == [1, 2, 3]
+        assert len(repos) == 50
+        assert set(repos[0]) == {"name", "description", "stargazers_count", "language"}
+
+    async def test_same_listing_gives_same_sample(self):
+        first_connector, first_client, _ = _paged_github(total_pages=10)
+        second_connector, second_client, _ = _paged_github(total_pages=10)
+
+        first = await first_connector._fetch_repos(first_client, "prolific")
+        second = await second_connector._fetch_repos(second_client, "prolific")
+
+        assert first == second
+
+    async def test_preview_reads_one_page(self):
+        connector, _, requested = _paged_github(total_pages=10)
+
+        await connector.fetch("prolific", depth="preview")
+
+        assert requested == [1]
@@ -1,21 +1,20 @@
 """End-to-end pipeline tests.
 
 1. Unit test: fake data through ALL connectors → extract → build UserDataBundle
-   → analyze_node (mocked LLM) → crossref_node (mocked LLM) → validate output shape
+   → profile nodes (mocked LLM) → crossref_node (mocked LLM) → validate output shape
 2. Integration tests: real API calls for connector subsets
 
 These follow the same test patterns as test_github.py and test_spotify.py.
 """
 
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from app.connectors.github import GitHubConnector
 from app.connectors.spotify import SpotifyConnector
 from app.connectors.letterboxd import LetterboxdConnector
 from app.connectors.linkedin import LinkedInConnector
 from app.connectors.instagram import InstagramConnector
-from app.graph.nodes.analyze import analyze_node
 from app.graph.nodes.crossref import crossref_node
 from app.models.state import PipelineState, UserDataBundle
 
@@ -204,12 +203,12 @@ class TestBundleConstruction:
         _validate_bundle_shape(bundle)
 
 
-# ── Step 3: analyze_node with mocked LLM ────────────────────────
+# ── Step 3: profile nodes with mocked LLM ───────────────────────
 
-class TestAnalyzeNodeWithFakeData:
+class TestProfileNodesWithFakeData:
     @pytest.mark.asyncio
-    async def test_analyze_produces_dossiers(self):
-        """Feed fake bundle through analyze_node, mock the LLM, verify dossiers."""
+    async def test_analyze_produces_dossiers(self, run_profiles):
+        """Feed fake bundles through the profile nodes, mock the LLM, verify dossiers."""
         bundle_a = _build_bundle(
             github=FAKE_GITHUB_DATA,
             spotify=FAKE_SPOTIFY_DATA,
@@ -223,11 +222,9 @@ class TestAnalyzeNodeWithFakeData:
         )
         state = _build_pipeline_state(bundle_a, bundle_b)
 
-        with patch("app.graph.nodes.analyze.LLMService") as MockLLM:
-            mock_instance = MockLLM.return_value
-            mock_instance.profile_analysis = AsyncMock(return_value=FAKE_DOSSIER)
-
-            result = await analyze_node(state)
+        mock_instance = MagicMock()
+        mock_instance.profile_analysis = AsyncMock(return_value=FAKE_DOSSIER)
+        result = await run_profiles(state, mock_instance)
 
         assert "user_a" in result
         assert "user_b" in result
@@ -237,15 +234,13 @@ class TestAnalyzeNodeWithFakeData:
         assert result["user_a"]["raw_data"] == bundle_a
 
     @pytest.mark.asyncio
-    async def test_analyze_calls_llm_for_each_user(self):
+    async def test_analyze_calls_llm_for_each_user(self, run_profiles):
         bundle = _build_bundle(github=FAKE_GITHUB_DATA)
         state = _build_pipeline_state(bundle, bundle)
 
-        with patch("app.graph.nodes.analyze.LLMService") as MockLLM:
-            mock_instance = MockLLM.return_value
-            mock_instance.profile_analysis = AsyncMock(return_value=FAKE_DOSSIER)
-
-            await analyze_node(state)
+        mock_instance = MagicMock()
+        mock_instance.profile_analysis = AsyncMock(return_value=FAKE_DOSSIER)
+        await run_profiles(state, mock_instance)
 
         assert mock_instance.profile_analysis.call_count == 2
 
@@ -270,7 +265,7 @@ class TestCrossrefNodeWithFakeData:
         # cross_reference returns (result_dict, venue_appropriate_bool)
         fake_crossref_no_venue = {k: v for k, v in FAKE_CROSSREF.items() if k != "venue_appropriate"}
 
-        with patch("app.graph.nodes.crossref.LLMService") as MockLLM:
+        with patch("app.graph.nodes.crossref.llm_from_config") as MockLLM:
             mock_instance = MockLLM.return_value
             mock_instance.cross_reference = AsyncMock(
                 return_value=(fake_crossref_no_venue, True)
@@ -291,12 +286,12 @@ class TestCrossrefNodeWithFakeData:
 
 class TestFullPipelineFakeData:
     @pytest.mark.asyncio
-    async def test_ingest_to_crossref_full_pipeline(self):
+    async def test_ingest_to_crossref_full_pipeline(self, run_profiles):
         """
         End-to-end with fake data:
         1. Extract data from all connectors (fake)
         2. Build UserDataBundle
-        3. Run analyze_node (mocked LLM)
+        3. Run the profile nodes (mocked LLM)
         4. Run crossref_node (mocked LLM)
         5. Validate final output shape
         """
@@ -383,10 +378,9 @@ class TestFullPipelineFakeData:
         # Step 3: Analyze
         state = _build_pipeline_state(bundle_a, bundle_b)
 
-        with patch("app.graph.nodes.analyze.LLMService") as MockLLM:
-            mock_instance = MockLLM.return_value
-            mock_instance.profile_analysis = AsyncMock(return_value=FAKE_DOSSIER)
-            analyzed = await analyze_node(state)
+        mock_instance = MagicMock()
+        mock_instance.profile_analysis = AsyncMock(return_value=FAKE_DOSSIER)
+        analyzed = await run_profiles(state, mock_instance)
 
         assert analyzed["user_a"]["dossier"]["public"]["vibe"] != ""
         assert analyzed["user_b"]["dossier"]["public"]["vibe"] != ""
@@ -406,7 +400,7 @@ class TestFullPipelineFakeData:
             "citations": ["Both code late at night"],
         }
 
-        with patch("app.graph.nodes.crossref.LLMService") as MockLLM:
+        with patch("app.graph.nodes.crossref.llm_from_config") as MockLLM:
             mock_instance = MockLLM.return_value
             mock_instance.cross_reference = AsyncMock(
                 return_value=(fake_crossref_result, True)
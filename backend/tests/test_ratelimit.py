@@ -0,0 +1,103 @@
+"""Tests for the GitHub rate-limit scheduler and token rotation."""
+
+import time
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from app.connectors.github import API_BASE, GitHubConnector
+from app.services import ratelimit as ratelimit_module
+from app.services.ratelimit import RateLimitExceeded, RateLimitScheduler
+
+
+def _limit_headers(remaining, reset_in=3600, limit=5000):
+    return {
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Reset": str(int(time.time() + reset_in)),
+    }
+
+
+# ── unit: scheduler ───────────────────────────────────────────────
+
+class TestScheduler:
+    async def test_prefers_budget_with_most_headroom(self):
+        scheduler = RateLimitScheduler(["a", "b"], reserve=0, max_wait=0)
+        first = await scheduler.acquire()
+        scheduler.update(first, 200, _limit_headers(10))
+        second = await scheduler.acquire()
+        assert (first.token, second.token) == ("a", "b")
+
+    async def test_reservation_spreads_concurrent_callers(self):
+        scheduler = RateLimitScheduler([], reserve=0, max_wait=0)
+        anon = await scheduler.acquire()
+        scheduler.update(anon, 200, _limit_headers(1, limit=60))
+        await scheduler.acquire()
+        with pytest.raises(RateLimitExceeded):
+            await scheduler.acquire()
+
+    async def test_raises_when_reset_is_too_far(self):
+        scheduler = RateLimitScheduler([], reserve=2, max_wait=5)
+        anon = await scheduler.acquire()
+        scheduler.update(anon, 200, _limit_headers(2, reset_in=600, limit=60))
+        with pytest.raises(RateLimitExceeded) as info:
+            await scheduler.acquire()
+        assert 590 < info.value.retry_after <= 600
+        assert scheduler.stats()["rejected"] == 1
+
+    async def test_waits_for_near_reset(self):
+        scheduler = RateLimitScheduler([], reserve=0, max_wait=60)
+        anon = await scheduler.acquire()
+        scheduler.update(anon, 200, _limit_headers(0, reset_in=10, limit=60))
+
+        async def fake_sleep(delay):
+            anon.reset_at = time.time() - 1
+
+        with patch.object(ratelimit_module.asyncio, "sleep", AsyncMock(side_effect=fake_sleep)) as sleep:
+            assert await scheduler.acquire() is anon
+        assert 0 < sleep.await_args.args[0] <= 10
+        assert scheduler.stats()["waits"] == 1
+
+    def test_graphql_needs_a_token(self):
+        assert not RateLimitScheduler([]).has_budget("graphql")
+        assert RateLimitScheduler(["a"]).has_budget("graphql")
+
+    def test_stats_never_expose_tokens(self):
+        stats = RateLimitScheduler(["secret"]).stats()
+        assert "secret" not in repr(stats)
+        assert {b["label"] for b in stats["budgets"]} == {"token-1", "anonymous"}
+
+
+# ── unit: connector rotation ──────────────────────────────────────
+
+class TestConnectorRotation:
+    async def test_rate_limited_token_rotates_to_next(self):
+        seen = []
+
+        def handler(request):
+            auth = request.headers.get("Authorization", "")
+            seen.append(auth)
+            if auth == "bearer a":
+                return httpx.Response(403, headers=_limit_headers(0))
+            return httpx.Response(200, json=[], headers=_limit_headers(4999))
+
+        client = httpx.AsyncClient(base_url=API_BASE, transport=httpx.MockTransport(handler))
+        scheduler = RateLimitScheduler(["a", "b"], reserve=0, max_wait=0)
+        connector = GitHubConnector(client=client, rate_limits=scheduler)
+
+        resp = await connector._request(client, "GET", "/users/octocat/repos")
+
+        assert resp.status_code == 200
+        assert seen == ["bearer a", "bearer b"]
+        assert scheduler.stats()["limited_responses"] == 1
+
+    async def test_exhausted_budget_surfaces_instead_of_empty_data(self):
+        def handler(request):
+            return httpx.Response(403, headers=_limit_headers(0, limit=60))
+
+        client = httpx.AsyncClient(base_url=API_BASE, transport=httpx.MockTransport(handler))
+        connector = GitHubConnector(client=client, token="")
+
+        with pytest.raises(RateLimitExceeded):
+            await connector.fetch("octocat", depth="preview")
@@ -0,0 +1,47 @@
+"""Tests for the lazy connector registry."""
+
+import subprocess
+import sys
+
+from app.connectors.registry import BROWSER, ConnectorRegistry, ConnectorSpec, connector_registry
+from app.services import cache as cache_module
+from app.services.cache import ConnectorCache
+
+
+class TestConnectorRegistry:
+    def test_imports_on_first_use(self):
+        registry = ConnectorRegistry([ConnectorSpec("github", "app.connectors.github:GitHubConnector")])
+
+        assert registry.loaded() == []
+        cls = registry.get("github")
+
+        assert cls.__name__ == "GitHubConnector"
+        assert registry.get("github") is cls
+        assert registry.loaded() == ["github"]
+
+    def test_unknown_service(self):
+        assert connector_registry.get("tiktok") is None
+        assert "tiktok" not in connector_registry
+
+    def test_browser_services(self):
+        browser = {s for s in connector_registry.services() if connector_registry.spec(s).cost == BROWSER}
+        assert browser == {"instagram", "linkedin"}
+
+    def test_app_startup_skips_playwright(self):
+        code = (
+            "import sys, app.main; "
+            "assert not [m for m in sys.modules if m.startswith('playwright')]"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+
+class TestCacheTTLs:
+    def test_declared_ttl(self):
+        assert ConnectorCache.ttl_for("instagram") == connector_registry.spec("instagram").cache_ttl
+
+    def test_settings_override(self, monkeypatch):
+        monkeypatch.setattr(cache_module.settings, "connector_cache_ttls", {"instagram": 5})
+        assert ConnectorCache.ttl_for("instagram") == 5
+
+    def test_unknown_service_uses_default(self):
+        assert ConnectorCache.ttl_for("tiktok") == cache_module.settings.connector_cache_default_ttl
@@ -0,0 +1,107 @@
+"""Tests for the fair per-service ingest scheduler."""
+
+import asyncio
+
+import pytest
+
+from app.graph.nodes.ingest import _fetch_user_data
+from app.services import scheduler as scheduler_module
+from app.services.scheduler import FairScheduler
+
+
+async def _hold(scheduler, service, tenant, order, release):
+    async with scheduler.slot(service, tenant):
+        order.append(tenant)
+        await release.wait()
+
+
+class TestFairScheduler:
+    async def test_limit_caps_concurrency(self):
+        scheduler = FairScheduler(limits={"github": 2})
+        running = peak = 0
+
+        async def job():
+            nonlocal running, peak
+            async with scheduler.slot("github"):
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(job() for _ in range(10)))
+
+        assert peak == 2
+        stats = scheduler.stats()["github"]
+        assert stats["granted"] == 10
+        assert stats["active"] == stats["queued"] == 0
+        assert stats["waited"] == 8
+
+    async def test_round_robin_across_tenants(self):
+        scheduler = FairScheduler(limits={"instagram": 1})
+        order = []
+        gate = asyncio.Event()
+        blocker = asyncio.create_task(_hold(scheduler, "instagram", "first", order, gate))
+        await asyncio.sleep(0)
+
+        # A burst from one tenant queues ahead of a single lookup from another
+        release = asyncio.Event()
+        release.set()
+        tasks = [
+            asyncio.create_task(_hold(scheduler, "instagram", "greedy", order, release))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(_hold(scheduler, "instagram", "polite", order, release)))
+        await asyncio.sleep(0)
+        assert scheduler.stats()["instagram"]["queued"] == 4
+
+        gate.set()
+        await asyncio.gather(blocker, *tasks)
+
+        assert order == ["first", "greedy", "polite", "greedy", "greedy"]
+
+    async def test_cancelled_waiter_leaves_queue(self):
+        scheduler = FairScheduler(limits={"linkedin": 1})
+        gate = asyncio.Event()
+        holder = asyncio.create_task(_hold(scheduler, "linkedin", "a", [], gate))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(_hold(scheduler, "linkedin", "b", [], gate))
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        gate.set()
+        await holder
+
+        stats = scheduler.stats()["linkedin"]
+        assert stats["queued"] == 0 and stats["active"] == 0
+
+    def test_limits_come_from_registry_and_settings(self, monkeypatch):
+        scheduler = FairScheduler()
+        assert scheduler.limit_for("instagram") == 2
+        monkeypatch.setattr(scheduler_module.settings, "connector_concurrency", {"instagram": 5})
+        assert scheduler.limit_for("instagram") == 5
+
+
+class TestIngestUsesScheduler:
+    async def test_fetches_respect_service_limit(self, monkeypatch):
+        monkeypatch.setattr(
+            "app.graph.nodes.ingest.ingest_scheduler", FairScheduler(limits={"github": 1})
+        )
+        running = peak = 0
+
+        class Slow:
+            async def fetch(self, identifier, depth="full"):
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+                return {"languages": [identifier]}
+
+        monkeypatch.setitem(scheduler_module.connector_registry.classes, "github", Slow)
+        bundles = await asyncio.gather(*(_fetch_user_data({"github": f"u{i}"}) for i in range(4)))
+
+        assert peak == 1
+        assert [b["github"]["languages"] for b in bundles] == [["u0"], ["u1"], ["u2"], ["u3"]]
@@ -0,0 +1,134 @@
+"""Tests for the headless scraper load profiles.
+
+Pages and routes are faked so these run without Chromium installed.
+"""
+
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from app.connectors import instagram, linkedin
+from app.connectors.scrape import ScraperProfile
+from app.services.deadline import request_deadline
+
+
+# ── fakes ─────────────────────────────────────────────────────────
+
+class FakeRoute:
+    def __init__(self, resource_type, url):
+        self.request = SimpleNamespace(resource_type=resource_type, url=url)
+        self.outcome = None
+
+    async def continue_(self):
+        self.outcome = "continue"
+
+    async def abort(self):
+        self.outcome = "abort"
+
+
+class FakePage:
+    def __init__(self, ready=True):
+        self.ready = ready
+        self.routes = []
+        self.waited_for = []
+
+    async def route(self, pattern, handler):
+        self.routes.append((pattern, handler))
+
+    async def wait_for_selector(self, selector, **kwargs):
+        self.waited_for.append(selector)
+        if not self.ready:
+            raise PlaywrightTimeoutError("not ready")
+
+
+class SlowPage(FakePage):
+    """A page whose navigation always times out."""
+
+    url = ""
+
+    async def goto(self, url, **kwargs):
+        raise PlaywrightTimeoutError("slow")
+
+    async def title(self):
+        return ""
+
+    async def query_selector(self, selector):
+        return None
+
+
+class FakePool:
+    @asynccontextmanager
+    async def page(self, **kwargs):
+        yield SlowPage()
+
+
+PROFILE = ScraperProfile(first_party=("example.com",), ready_selector="h1")
+
+
+# ── unit: request filtering ───────────────────────────────────────
+
+class TestAllows:
+    @pytest.mark.parametrize("url", ["https://example.com/x", "https://static.example.com/app.js"])
+    def test_first_party_scripts_allowed(self, url):
+        assert PROFILE.allows("script", url)
+
+    @pytest.mark.parametrize("url", ["https://tracker.net/t.js", "https://notexample.com/x"])
+    def test_third_party_blocked(self, url):
+        assert not PROFILE.allows("script", url)
+
+    @pytest.mark.parametrize("kind", ["image", "media", "font", "stylesheet"])
+    def test_heavy_types_blocked(self, kind):
+        assert not PROFILE.allows(kind, "https://example.com/asset")
+
+    def test_screenshot_profile_keeps_images_and_css(self):
+        shot = PROFILE.with_screenshot()
+        assert shot.allows("image", "https://example.com/a.jpg")
+        assert shot.allows("stylesheet", "https://example.com/a.css")
+        assert not shot.allows("font", "https://example.com/a.woff2")
+
+    def test_connector_profiles_use_cheap_load_state(self):
+        for profile in (instagram.SCRAPER_PROFILE, linkedin.SCRAPER_PROFILE):
+            assert profile.wait_until == "domcontentloaded"
+            assert profile.ready_selector
+
+
+# ── unit: page wiring ─────────────────────────────────────────────
+
+class TestInstall:
+    async def test_routes_continue_or_abort(self):
+        page = FakePage()
+        await PROFILE.install(page)
+        [(pattern, handler)] = page.routes
+        assert pattern == "**/*"
+
+        ok = FakeRoute("document", "https://example.com/")
+        blocked = FakeRoute("image", "https://example.com/a.png")
+        await handler(ok)
+        await handler(blocked)
+        assert (ok.outcome, blocked.outcome) == ("continue", "abort")
+
+    async def test_wait_ready_swallows_timeout(self):
+        page = FakePage(ready=False)
+        await PROFILE.wait_ready(page)
+        assert page.waited_for == ["h1"]
+
+
+# ── unit: navigation timeouts ─────────────────────────────────────
+
+class TestNavigationTimeout:
+    @pytest.mark.parametrize(
+        "connector", [instagram.InstagramConnector, linkedin.LinkedInConnector]
+    )
+    async def test_full_timeout_is_reported(self, connector):
+        result = await connector(pool=FakePool())._render_profile("slow")
+        assert result["timed_out"] is True
+
+    @pytest.mark.parametrize(
+        "connector", [instagram.InstagramConnector, linkedin.LinkedInConnector]
+    )
+    async def test_deadline_cut_is_not_a_profile_timeout(self, connector):
+        async with request_deadline(1):
+            result = await connector(pool=FakePool())._render_profile("slow")
+        assert "timed_out" not in result
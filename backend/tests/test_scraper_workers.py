@@ -0,0 +1,81 @@
+"""Tests for dispatching scraper fetches to worker processes."""
+
+import os
+
+import pytest
+
+from app.graph.nodes.ingest import fetch_service_data
+from app.services import scraper_workers as workers_module
+from app.services.cache import LOGIN_WALL, negative_cache
+from app.services.scraper_workers import ScraperWorkerError, ScraperWorkerPool
+
+
+class WalledConnector:
+    """Records a login wall the way the real scrapers do."""
+
+    async def fetch(self, identifier, depth="full"):
+        if negative_cache.check("walled", identifier):
+            return {"bio": "", "skipped": True}
+        negative_cache.record("walled", identifier, LOGIN_WALL)
+        return {"bio": "", "pid": os.getpid()}
+
+
+class CrashingConnector:
+    async def fetch(self, identifier, depth="full"):
+        os._exit(1)
+
+
+@pytest.fixture
+def pool():
+    pool = ScraperWorkerPool(workers=1, max_tasks=10, max_rss_mb=0, services={"walled"})
+    yield pool
+    pool.shutdown()
+
+
+class TestScraperWorkerPool:
+    async def test_fetch_runs_in_another_process(self, pool):
+        data = await pool.run(WalledConnector, "walled", "someone", "full")
+
+        assert data["pid"] != os.getpid()
+        assert pool.stats()["dispatched"] == 1
+
+    async def test_worker_outcome_reaches_api_negative_cache(self, pool):
+        await pool.run(WalledConnector, "walled", "someone", "full")
+
+        assert negative_cache.peek("walled", "someone") == LOGIN_WALL
+
+    async def test_api_outcome_short_circuits_in_worker(self, pool):
+        negative_cache.record("walled", "other", LOGIN_WALL)
+
+        data = await pool.run(WalledConnector, "walled", "other", "full")
+
+        assert data == {"bio": "", "skipped": True}
+
+    async def test_crashed_worker_is_replaced(self, pool):
+        with pytest.raises(ScraperWorkerError):
+            await pool.run(CrashingConnector, "walled", "someone", "full")
+
+        data = await pool.run(WalledConnector, "walled", "someone", "full")
+        assert data["bio"] == ""
+        assert pool.stats()["crashed"] == 1
+
+    def test_handles_only_configured_connectors(self, pool):
+        assert pool.handles("walled")
+        assert not pool.handles("github")
+        assert not ScraperWorkerPool(workers=0).handles("instagram")
+        assert ScraperWorkerPool(workers=1).handles("instagram")
+
+
+@pytest.mark.skipif(not os.path.isdir("/proc"), reason="needs /proc")
+def test_tree_rss_counts_this_process():
+    assert workers_module._tree_rss_bytes(os.getpid()) > 0
+
+
+class TestIngestDispatch:
+    async def test_scrapers_go_through_workers_when_enabled(self, pool, monkeypatch):
+        monkeypatch.setattr("app.graph.nodes.ingest.scraper_workers", pool)
+
+        data = await fetch_service_data("walled", "someone", WalledConnector)
+
+        assert data["pid"] != os.getpid()
+        assert pool.stats()["dispatched"] == 1
@@ -0,0 +1,70 @@
+"""Tests for the content-addressed screenshot store and its endpoint."""
+
+import io
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.main import app
+from app.services import screenshots as screenshots_module
+from app.services.screenshots import ScreenshotStore, screenshot_store
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 64
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ScreenshotStore(root=str(tmp_path))
+
+
+class TestScreenshotStore:
+    async def test_same_image_same_ref(self, store, monkeypatch):
+        monkeypatch.setattr(screenshots_module, "Image", None)
+
+        first = await store.put(PNG)
+        second = await store.put(PNG)
+
+        assert first == second
+        assert first.endswith(".png")
+        assert list(store.root.iterdir()) == [store.root / first]
+
+    async def test_wide_screenshot_resized_to_webp(self, store, monkeypatch):
+        Image = pytest.importorskip("PIL.Image")
+        monkeypatch.setattr(screenshots_module.settings, "screenshot_max_width", 540)
+        png = io.BytesIO()
+        Image.new("RGB", (1080, 1920), "white").save(png, format="PNG")
+
+        ref = await store.put(png.getvalue())
+
+        assert ref.endswith(".webp")
+        with Image.open(store.path_for(ref)) as img:
+            assert img.format == "WEBP"
+            assert img.size == (540, 960)
+
+    async def test_undecodable_image_kept_as_is(self, store):
+        ref = await store.put(PNG)
+
+        assert store.path_for(ref).read_bytes() == PNG
+
+    @pytest.mark.parametrize("ref", ["../etc/passwd", "abc.png", "0" * 32 + ".gif"])
+    def test_rejects_malformed_refs(self, store, ref):
+        assert store.path_for(ref) is None
+
+    def test_unknown_ref(self, store):
+        assert store.path_for("0" * 32 + ".png") is None
+
+
+class TestScreenshotEndpoint:
+    async def test_serves_stored_screenshot(self):
+        ref = await screenshot_store.put(PNG)
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+            resp = await ac.get(f"/api/screenshots/{ref}")
+
+        assert resp.status_code == 200
+        assert resp.content == PNG
+
+    async def test_missing_screenshot_is_404(self):
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+            resp = await ac.get("/api/screenshots/" + "0" * 32 + ".webp")
+
+        assert resp.status_code == 404
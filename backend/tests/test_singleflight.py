@@ -0,0 +1,165 @@
+"""Tests for single-flight deduplication of concurrent fetches."""
+
+import asyncio
+
+import pytest
+
+from app.graph.nodes.ingest import fetch_service_data
+from app.services import deadline
+from app.services.deadline import DeadlineExceeded, request_deadline
+from app.services.singleflight import SingleFlight
+
+
+# ── unit: SingleFlight ────────────────────────────────────────────
+
+class TestSingleFlight:
+    async def test_concurrent_callers_share_one_call(self):
+        flights = SingleFlight()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"ok": True}
+
+        results = await asyncio.gather(*(flights.do("k", work) for _ in range(5)))
+        assert calls == 1
+        assert all(r == {"ok": True} for r in results)
+        assert flights.stats() == {"in_flight": 0, "started": 1, "joined": 4, "abandoned": 0}
+
+    async def test_exception_shared_by_all_callers(self):
+        flights = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            flights.do("k", work), flights.do("k", work), return_exceptions=True
+        )
+        assert all(isinstance(r, ValueError) for r in results)
+
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        flights = SingleFlight()
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+            return "done"
+
+        first = asyncio.create_task(flights.do("k", work))
+        second = asyncio.create_task(flights.do("k", work))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == "done"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    async def test_last_caller_leaving_cancels_work(self):
+        flights = SingleFlight()
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def work():
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        callers = [asyncio.create_task(flights.do("k", work)) for _ in range(2)]
+        await started.wait()
+        for caller in callers:
+            caller.cancel()
+        await asyncio.gather(*callers, return_exceptions=True)
+        await asyncio.wait_for(cancelled.wait(), 1)
+
+        assert flights.stats()["abandoned"] == 1
+        assert flights.stats()["in_flight"] == 0
+
+    async def test_caller_after_abandon_starts_fresh(self):
+        flights = SingleFlight()
+        started = asyncio.Event()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                await asyncio.sleep(0.01)  # slow cleanup keeps the task alive
+                raise
+            return "first"
+
+        async def quick():
+            return "fresh"
+
+        caller = asyncio.create_task(flights.do("k", work))
+        await started.wait()
+        caller.cancel()
+        await asyncio.gather(caller, return_exceptions=True)
+
+        assert await flights.do("k", quick) == "fresh"
+        assert calls == 1
+
+    async def test_first_callers_deadline_not_imposed_on_others(self):
+        flights = SingleFlight()
+        started = asyncio.Event()
+
+        async def work():
+            started.set()
+            await asyncio.sleep(0.05)
+            return deadline.remaining()
+
+        async def impatient():
+            async with request_deadline(0.01):
+                return await flights.do("k", work)
+
+        first = asyncio.create_task(impatient())
+        await started.wait()
+        second = asyncio.create_task(flights.do("k", work))
+
+        with pytest.raises(DeadlineExceeded):
+            await first
+        assert await second is None
+        assert flights.stats()["abandoned"] == 0
+
+    async def test_new_call_after_completion(self):
+        flights = SingleFlight()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+
+        await flights.do("k", work)
+        await flights.do("k", work)
+        assert calls == 2
+
+
+# ── unit: connector fetch path ────────────────────────────────────
+
+class TestConcurrentConnectorFetch:
+    async def test_same_identity_fetched_once(self):
+        calls = 0
+
+        class SlowConnector:
+            async def fetch(self, identifier, depth="full"):
+                nonlocal calls
+                calls += 1
+                await asyncio.sleep(0.01)
+                return {"languages": ["Go"]}
+
+        results = await asyncio.gather(
+            fetch_service_data("github", "octocat", SlowConnector),
+            fetch_service_data("github", "@OctoCat", SlowConnector, bypass_cache=True),
+        )
+        assert calls == 1
+        assert results[0] == results[1]
+        assert results[0] is not results[1]
@@ -247,3 +247,64 @@ def _mock_handler(artists: dict, tracks: dict, recent: dict):
         return httpx.Response(404)
 
     return handler
+
+
+# ── unit: vault-backed fetch and cursor pagination ────────────────
+
+def _played(hour: int) -> dict:
+    return {"played_at": f"2024-01-15T{hour:02d}:00:00.000Z"}
+
+
+def _api_transport(recent_pages: int, seen: list):
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.url.path, request.headers["Authorization"], request.url.params.get("before")))
+        if request.headers["Authorization"] == "Bearer stale":
+            return httpx.Response(401)
+        if "/recently-played" in request.url.path:
+            page = int(request.url.params.get("before") or 0)
+            body = {"items": [_played(page)], "next": None}
+            if page + 1 < recent_pages:
+                body["next"] = f"https://api.spotify.com/v1/me/player/recently-played?limit=50&before={page + 1}"
+            return httpx.Response(200, json=body)
+        return httpx.Response(200, json=EMPTY_RESPONSE)
+
+    return httpx.MockTransport(handler)
+
+
+class FakeVault:
+    def __init__(self, token):
+        self.token = token
+        self.forced = 0
+
+    async def access_token(self, username, *, force_refresh=False):
+        if force_refresh:
+            self.forced += 1
+            self.token = "fresh"
+        return self.token
+
+
+class TestVaultBackedFetch:
+    async def test_follows_recently_played_cursors(self):
+        seen = []
+        client = httpx.AsyncClient(transport=_api_transport(3, seen), base_url="https://api.spotify.com/v1")
+        connector = SpotifyConnector(client=client, vault=FakeVault("good"))
+
+        result = await connector.fetch("someone")
+
+        assert result["listening_hours"] == [0, 1, 2]
+        befores = [b for path, _, b in seen if "recently-played" in path]
+        assert befores == [None, "1", "2"]
+
+    async def test_refreshes_once_on_401(self):
+        seen = []
+        vault = FakeVault("stale")
+        client = httpx.AsyncClient(transport=_api_transport(1, seen), base_url="https://api.spotify.com/v1")
+
+        result = await SpotifyConnector(client=client, vault=vault).fetch("someone", depth="preview")
+
+        assert vault.forced == 1
+        assert result == {"top_artists": [], "top_genres": []}
+
+    async def test_missing_authorization_raises(self):
+        with pytest.raises(PermissionError, match="No Spotify authorization"):
+            await SpotifyConnector(vault=FakeVault(None)).fetch("someone")
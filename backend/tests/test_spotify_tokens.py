@@ -0,0 +1,124 @@
+"""Tests for the Spotify OAuth token vault."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.services import spotify_tokens as vault_module
+from app.services.spotify_tokens import SpotifyTokenVault
+from app.services.store import SQLiteStore
+
+
+@pytest.fixture(autouse=True)
+def _client_credentials(monkeypatch):
+    monkeypatch.setattr(vault_module.settings, "spotify_client_id", "cid")
+    monkeypatch.setattr(vault_module.settings, "spotify_client_secret", "secret")
+
+
+def _vault(handler):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return SpotifyTokenVault(store=SQLiteStore(":memory:"), client=client)
+
+
+def _token_server(requests, status=200, rotate=False, account="someone"):
+    async def handler(request):
+        if request.url.path == "/v1/me":
+            return httpx.Response(200, json={"id": account})
+        requests.append(dict(httpx.QueryParams(request.content.decode())))
+        await asyncio.sleep(0)
+        if status != 200:
+            return httpx.Response(status)
+        body = {"access_token": f"access-{len(requests)}", "expires_in": 3600}
+        if rotate:
+            body["refresh_token"] = f"refresh-{len(requests)}"
+        return httpx.Response(200, json=body)
+
+    return handler
+
+
+class TestSpotifyTokenVault:
+    async def test_unknown_user(self):
+        assert await _vault(_token_server([])).access_token("nobody") is None
+
+    async def test_fresh_token_served_without_refresh(self):
+        requests = []
+        vault = _vault(_token_server(requests))
+        await vault.save("@Someone", "access-0", "refresh-0", expires_in=3600)
+
+        assert await vault.access_token("someone") == "access-0"
+        assert requests == []
+
+    async def test_expiring_token_refreshed_and_refresh_token_kept(self):
+        requests = []
+        vault = _vault(_token_server(requests))
+        await vault.save("someone", "access-0", "refresh-0", expires_in=30)
+
+        assert await vault.access_token("someone") == "access-1"
+        assert requests == [{"grant_type": "refresh_token", "refresh_token": "refresh-0"}]
+        entry = await vault.store.get(vault.namespace, "someone")
+        assert entry["refresh_token"] == "refresh-0"
+        assert entry["expires_at"] > time.time() + 3000
+
+    async def test_concurrent_refreshes_share_one_request(self):
+        requests = []
+        vault = _vault(_token_server(requests, rotate=True))
+        await vault.save("someone", "access-0", "refresh-0", expires_in=0)
+
+        tokens = await asyncio.gather(*(vault.access_token("someone") for _ in range(5)))
+
+        assert set(tokens) == {"access-1"}
+        assert len(requests) == 1
+
+    async def test_revoked_refresh_token(self):
+        vault = _vault(_token_server([], status=400))
+        await vault.save("someone", "access-0", "refresh-0", expires_in=0)
+
+        with pytest.raises(PermissionError):
+            await vault.access_token("someone")
+
+    async def test_exchange_code_stores_tokens(self):
+        requests = []
+        vault = _vault(_token_server(requests, rotate=True))
+
+        grant = await vault.exchange_code("someone", "the-code", "http://localhost/cb")
+
+        assert requests[0]["grant_type"] == "authorization_code"
+        assert await vault.access_token("someone") == "access-1"
+        await vault.check_grant("@Someone", grant)
+
+    @pytest.mark.parametrize("grant", [None, "", "someone-elses"])
+    async def test_check_grant_rejects_other_callers(self, grant):
+        vault = _vault(_token_server([], rotate=True))
+        await vault.exchange_code("someone", "the-code", "http://localhost/cb")
+
+        with pytest.raises(PermissionError):
+            await vault.check_grant("someone", grant)
+
+    async def test_check_grant_unknown_user(self):
+        with pytest.raises(PermissionError, match="No Spotify authorization"):
+            await _vault(_token_server([])).check_grant("nobody", "grant")
+
+    async def test_refresh_keeps_grant(self):
+        vault = _vault(_token_server([], rotate=True))
+        grant = await vault.exchange_code("someone", "the-code", "http://localhost/cb")
+
+        await vault.access_token("someone", force_refresh=True)
+
+        await vault.check_grant("someone", grant)
+
+    async def test_rejected_code_has_its_own_message(self):
+        vault = _vault(_token_server([], status=400))
+
+        with pytest.raises(PermissionError, match="authorization code"):
+            await vault.exchange_code("someone", "bad-code", "http://localhost/cb")
+
+    async def test_exchange_code_rejects_other_account(self):
+        vault = _vault(_token_server([], rotate=True, account="mallory"))
+
+        with pytest.raises(PermissionError):
+            await vault.exchange_code("someone", "the-code", "http://localhost/cb")
+
+        assert await vault.access_token("someone") is None
+        assert await vault.access_token("mallory") is None
@@ -0,0 +1,106 @@
+"""Tests for conditional requests backed by the validator store."""
+
+import httpx
+
+from app.connectors.github import API_BASE, GitHubConnector
+from app.connectors.letterboxd import FEED_URL, LetterboxdConnector
+from app.services.validators import validator_store
+
+FEED_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:letterboxd="https://letterboxd.com">
+  <channel>
+    <item>
+      <title>Past Lives, 2023 - ★★★★½</title>
+      <link>https://letterboxd.com/someone/film/past-lives/</link>
+      <letterboxd:memberRating>4.5</letterboxd:memberRating>
+    </item>
+  </channel>
+</rss>
+"""
+
+
+class ConditionalServer:
+    """Serves ``body`` with validators, answering 304 when they match."""
+
+    def __init__(self, body, etag=None, last_modified=None, json_body=False):
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.json_body = json_body
+        self.statuses = []
+
+    def __call__(self, request):
+        fresh = (
+            (self.etag and request.headers.get("If-None-Match") == self.etag)
+            or (self.last_modified and request.headers.get("If-Modified-Since") == self.last_modified)
+        )
+        headers = {}
+        if self.etag:
+            headers["ETag"] = self.etag
+        if self.last_modified:
+            headers["Last-Modified"] = self.last_modified
+        status = 304 if fresh else 200
+        self.statuses.append(status)
+        if status == 304:
+            return httpx.Response(304, headers=headers)
+        if self.json_body:
+            return httpx.Response(200, json=self.body, headers=headers)
+        return httpx.Response(200, text=self.body, headers=headers)
+
+
+class TestGitHubConditional:
+    async def test_etag_revalidation_reuses_body(self):
+        server = ConditionalServer(
+            [{"name": "repo", "description": None, "stargazers_count": 3, "language": "Go", "owner": {}}],
+            etag='W/"abc"',
+            json_body=True,
+        )
+        client = httpx.AsyncClient(base_url=API_BASE, transport=httpx.MockTransport(server))
+        connector = GitHubConnector(client=client, token="")
+
+        first = await connector.fetch("octocat", depth="preview")
+        second = await connector.fetch("octocat", depth="preview")
+
+        assert server.statuses == [200, 304]
+        assert first == second
+        assert first["languages"] == ["Go"]
+        assert validator_store.stats()["revalidated"] >= 1
+
+    async def test_stored_body_keeps_only_read_fields(self):
+        server = ConditionalServer(
+            [{"name": "repo", "language": "Go", "owner": {"login": "x"}}], etag='"1"', json_body=True
+        )
+        client = httpx.AsyncClient(base_url=API_BASE, transport=httpx.MockTransport(server))
+        await GitHubConnector(client=client, token="").fetch("octocat", depth="preview")
+
+        key = validator_store.key_for(
+            f"{API_BASE}/users/octocat/repos", {"per_page": 100, "sort": "updated"}
+        )
+        entry = await validator_store.get(key)
+        assert "owner" not in entry["body"]["data"][0]
+
+
+class TestLetterboxdConditional:
+    async def test_last_modified_revalidation_skips_parse(self):
+        server = ConditionalServer(FEED_XML, last_modified="Mon, 01 Jan 2024 00:00:00 GMT")
+        client = httpx.AsyncClient(transport=httpx.MockTransport(server))
+        connector = LetterboxdConnector(client=client)
+
+        first = await connector.fetch("someone")
+        second = await connector.fetch("someone")
+
+        assert server.statuses == [200, 304]
+        assert first == second
+        assert first["recent_films"][0] == {
+            "title": "Past Lives, 2023",
+            "rating": 4.5,
+            "link": "https://letterboxd.com/someone/film/past-lives/",
+        }
+
+    async def test_no_validators_nothing_stored(self):
+        server = ConditionalServer(FEED_XML)
+        client = httpx.AsyncClient(transport=httpx.MockTransport(server))
+
+        await LetterboxdConnector(client=client).fetch("someone")
+
+        assert await validator_store.get(FEED_URL.format(username="someone")) is None
@@ -0,0 +1,77 @@
+"""Tests for venue_node Places fan-out and candidate dedupe."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.graph.nodes.venue import _dedupe_candidates, venue_node
+from app.services.llm import LLMService
+
+
+# ── unit: dedupe ──────────────────────────────────────────────────
+
+class TestDedupeCandidates:
+    def test_dedupes_by_place_id(self):
+        candidates = [
+            {"place_id": "p1", "name": "Blue Note"},
+            {"place_id": "p1", "name": "Blue Note Jazz Club"},
+            {"place_id": "p2", "name": "Smalls"},
+        ]
+        assert [c["place_id"] for c in _dedupe_candidates(candidates)] == ["p1", "p2"]
+
+    def test_falls_back_to_name_and_address(self):
+        candidates = [
+            {"name": "Mock jazz", "address": "123 Discovery Way"},
+            {"name": "mock jazz ", "address": "123 discovery way"},
+            {"name": "Mock jazz", "address": "9 Elsewhere"},
+        ]
+        assert len(_dedupe_candidates(candidates)) == 2
+
+
+# ── unit: venue_node fan-out ──────────────────────────────────────
+
+class TestVenueNode:
+    async def test_searches_run_concurrently_and_dedupe(self):
+        svc = MagicMock(spec=LLMService)
+        svc.brainstorm_venue_queries = AsyncMock(return_value=[
+            {"name": "jazz", "search_query": "jazz bar"},
+            {"name": "jazz again", "search_query": "live jazz"},
+            {"name": "film", "search_query": "indie cinema"},
+        ])
+        svc.rank_venues = AsyncMock(return_value=[{"name": "Blue Note"}])
+
+        running = 0
+        peak = 0
+
+        async def search_venue(query, location=None):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            if "jazz" in query:
+                return [{"place_id": "blue-note", "name": "Blue Note"}]
+            return [{"place_id": "ifc", "name": "IFC Center"}]
+
+        with patch("app.graph.nodes.venue.PlacesService") as MockPlaces:
+            MockPlaces.return_value.search_venue = AsyncMock(side_effect=search_venue)
+            result = await venue_node({"cross_ref": {}}, {"configurable": {"llm": svc}})
+
+        assert peak == 3
+        candidates = svc.rank_venues.call_args.args[0]
+        assert [c["place_id"] for c in candidates] == ["blue-note", "ifc"]
+        assert result == {"venues": [{"name": "Blue Note"}]}
+
+    async def test_failed_search_is_skipped(self):
+        svc = MagicMock(spec=LLMService)
+        svc.brainstorm_venue_queries = AsyncMock(return_value=[
+            {"search_query": "a"}, {"search_query": "b"},
+        ])
+        svc.rank_venues = AsyncMock(return_value=[])
+
+        with patch("app.graph.nodes.venue.PlacesService") as MockPlaces:
+            MockPlaces.return_value.search_venue = AsyncMock(
+                side_effect=[RuntimeError("quota"), [{"place_id": "x", "name": "X"}]]
+            )
+            await venue_node({"cross_ref": {}}, {"configurable": {"llm": svc}})
+
+        assert svc.rank_venues.call_args.args[0] == [{"place_id": "x", "name": "X"}]
@@ -4,6 +4,7 @@ export async function connectService(service: string, username: string): Promise
   const res = await fetch(`${API_BASE}/api/connect`, {
     method: "POST",
     headers: { "Content-Type": "application/json" },
+    credentials: "include",
     body: JSON.stringify({ service, username }),
   });
   return res.json();
@@ -21,6 +22,7 @@ export async function analyzeUser(identifiers: Record<string, string | null>): P
   const res = await fetch(`${API_BASE}/api/analyze`, {
     method: "POST",
     headers: { "Content-Type": "application/json" },
+    credentials: "include",
     body: JSON.stringify({ identifiers }),
   });
   return res.json();
@@ -51,6 +53,7 @@ export async function runPipeline(request: MatchRequest): Promise<CoachingRespon
   const res = await fetch(`${API_BASE}/run`, {
     method: "POST",
     headers: { "Content-Type": "application/json" },
+    credentials: "include",
     body: JSON.stringify(request),
   });
   if (!res.ok) throw new Error("Failed to run pipeline");